@@ -25,6 +25,9 @@ def create_app(config_name: str = None) -> Flask:
     )
     app.config.from_object(config_by_name[config_name])
 
+    from app.services.uploads import UploadRequest
+    app.request_class = UploadRequest
+
     CORS(app)
 
     # CSP: allow unsafe-eval for html2pdf.js (template-editor) and third-party scripts.
@@ -42,19 +45,58 @@ def create_app(config_name: str = None) -> Flask:
         response.headers["Content-Security-Policy"] = csp
         return response
 
+    _init_template_cache(app)
+    _init_metrics(app)
+    _init_profiler(app)
     _init_db(app)
+    _init_export_cache(app)
+    _init_downloads(app)
+    _init_render_pool(app)
+    _init_export_warmup(app)
+    _init_export_jobs(app)
+    _init_export_bundle(app)
+    _init_parse_cache(app)
+    _init_batch_parser(app)
+    _init_preview_cache(app)
+    _init_thumbnails(app)
+    _init_user_cache(app)
     _init_login_manager(app)
     _init_oauth(app)
     _register_blueprints(app)
+    _precompile_templates(app)
 
     return app
 
 
 # ── Extension initialisers ────────────────────────────────────────────────────
 
+def _init_template_cache(app: Flask) -> None:
+    from app.services.template_cache import template_cache
+    template_cache.init_app(app)
+
+
+def _precompile_templates(app: Flask) -> None:
+    if app.config.get("TEMPLATE_PRECOMPILE"):
+        from app.services.template_cache import template_cache
+        template_cache.precompile(app)
+
+
+def _init_metrics(app: Flask) -> None:
+    from app.services.metrics import metrics
+    metrics.init_app(app)
+
+
+def _init_profiler(app: Flask) -> None:
+    from app.services.profiler import request_profiler
+    request_profiler.init_app(app)
+
+
 def _init_db(app: Flask) -> None:
+    from app.models import sqlite
     from app.models.user import db
-    from app.models.resume_db import Resume  # noqa: F401 — ensure table is created
+    from app.models.resume_db import Resume
+    from app.models.export_job import ExportJob  # noqa: F401
+    from app.models.parse_cache import ParseCacheEntry  # noqa: F401
 
     # Ensure data/ exists
     data_dir = Path(__file__).parent.parent / "data"
@@ -69,10 +111,108 @@ def _init_db(app: Flask) -> None:
         abs_path.parent.mkdir(parents=True, exist_ok=True)
         app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{abs_path}"
 
+    sqlite_tuned = sqlite.configure(app)
     db.init_app(app)
 
     with app.app_context():
+        if sqlite_tuned:
+            sqlite.install(app, db)
         db.create_all()
+        _upgrade_schema(db)
+        Resume.backfill_listing()
+
+
+def _upgrade_schema(db) -> None:
+    """Add columns and indexes that models gained after their table was created.
+
+    ``create_all`` only creates missing tables. There are no migrations, so new
+    columns must be nullable or have a ``server_default``.
+    """
+    import logging
+    from sqlalchemy import inspect, text
+
+    log = logging.getLogger(__name__)
+    with db.engine.begin() as conn:
+        inspector = inspect(conn)
+        existing  = set(inspector.get_table_names())
+        for table in db.metadata.sorted_tables:
+            if table.name not in existing:
+                continue
+            columns = {c["name"] for c in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in columns:
+                    continue
+                ddl = f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column.type.compile(conn.dialect)}"
+                if column.server_default is not None:
+                    default = column.server_default.arg
+                    default = default.text if hasattr(default, "text") else "'%s'" % default.replace("'", "''")
+                    ddl += f"{'' if column.nullable else ' NOT NULL'} DEFAULT {default}"
+                conn.execute(text(ddl))
+                log.info("[db] Added column %s.%s", table.name, column.name)
+            indexes = {i["name"] for i in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name not in indexes:
+                    index.create(conn)
+                    log.info("[db] Created index %s", index.name)
+
+
+def _init_export_cache(app: Flask) -> None:
+    from app.services.export_cache import export_cache
+    export_cache.init_app(app)
+
+
+def _init_downloads(app: Flask) -> None:
+    from app.services.downloads import downloads
+    downloads.init_app(app)
+
+
+def _init_render_pool(app: Flask) -> None:
+    from app.services.render_pool import render_pool
+    render_pool.init_app(app)
+
+
+def _init_export_warmup(app: Flask) -> None:
+    import multiprocessing
+
+    # Spawned pool workers re-import the main module; they load the engine themselves.
+    if app.config.get("EXPORT_WARMUP") and multiprocessing.parent_process() is None:
+        from app.services.export_service import start_warm_up
+        start_warm_up()
+
+
+def _init_export_jobs(app: Flask) -> None:
+    from app.services.export_jobs import export_jobs
+    export_jobs.init_app(app)
+
+
+def _init_export_bundle(app: Flask) -> None:
+    from app.services.export_bundle import export_bundler
+    export_bundler.init_app(app)
+
+
+def _init_parse_cache(app: Flask) -> None:
+    from app.services.parse_cache import parse_cache
+    parse_cache.init_app(app)
+
+
+def _init_batch_parser(app: Flask) -> None:
+    from app.services.batch_parser import batch_parser
+    batch_parser.init_app(app)
+
+
+def _init_preview_cache(app: Flask) -> None:
+    from app.services.preview_cache import preview_cache
+    preview_cache.init_app(app)
+
+
+def _init_thumbnails(app: Flask) -> None:
+    from app.services.thumbnails import thumbnails
+    thumbnails.init_app(app)
+
+
+def _init_user_cache(app: Flask) -> None:
+    from app.services.user_cache import user_cache
+    user_cache.init_app(app)
 
 
 def _init_login_manager(app: Flask) -> None:
@@ -82,8 +222,8 @@ def _init_login_manager(app: Flask) -> None:
 
     @login_manager.user_loader
     def load_user(user_id: str):
-        from app.models.user import User
-        return User.query.get(int(user_id))
+        from app.services.user_cache import user_cache
+        return user_cache.load(int(user_id))
 
 
 def _init_oauth(app: Flask) -> None:
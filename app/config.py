@@ -15,9 +15,14 @@ except ImportError:
 class Config:
     SECRET_KEY = os.environ.get("SECRET_KEY", "change-me-in-production-please")
     DATA_FILE  = BASE_DIR / "data" / "resume_data.json"
+    RESUME_SAVE_COALESCE_MS = int(os.environ.get("RESUME_SAVE_COALESCE_MS", "200"))  # 0 = write each save
     DEBUG      = False
     TESTING    = False
 
+    # ── Request size limits ───────────────────────────────────────────────────
+    MAX_CONTENT_LENGTH = 16 * 1024 * 1024   # any request body (JSON resumes can embed photos)
+    MAX_UPLOAD_BYTES   = 10 * 1024 * 1024   # resume file uploads, enforced while streaming
+
     # ── Database ──────────────────────────────────────────────────────────────
     SQLALCHEMY_DATABASE_URI     = os.environ.get(
         "DATABASE_URL",
@@ -29,6 +34,107 @@ class Config:
         "pool_pre_ping": True,                          # recover from dropped connections
     }
 
+    # ── SQLite production profile ────────────────────────────────────────────
+    # WAL and tuned pragmas on every connection, reads and writes on separate pools.
+    SQLITE_TUNED           = os.environ.get("SQLITE_TUNED", "0") != "0"
+    SQLITE_READ_POOL_SIZE  = int(os.environ.get("SQLITE_READ_POOL_SIZE", "8"))
+    SQLITE_WRITE_POOL_SIZE = 1      # SQLite has one writer; more connections only contend
+    SQLITE_PRAGMAS         = {
+        "journal_mode": "WAL",
+        "synchronous":  "NORMAL",                                                # durable at checkpoints
+        "busy_timeout": int(os.environ.get("SQLITE_BUSY_TIMEOUT_MS", "5000")),
+        "cache_size":   -int(os.environ.get("SQLITE_CACHE_MB", "32")) * 1024,    # negative = KiB
+        "mmap_size":    int(os.environ.get("SQLITE_MMAP_MB", "256")) * 1024 * 1024,
+    }
+
+    # ── Templates ─────────────────────────────────────────────────────────────
+    JINJA_BYTECODE_CACHE_ENABLED = os.environ.get("JINJA_BYTECODE_CACHE_ENABLED", "1") != "0"
+    JINJA_BYTECODE_CACHE_DIR     = BASE_DIR / "data" / "jinja_cache"
+    TEMPLATE_PRECOMPILE          = os.environ.get("TEMPLATE_PRECOMPILE", "0") != "0"   # compile all in create_app
+
+    # ── Export cache ──────────────────────────────────────────────────────────
+    EXPORT_CACHE_ENABLED      = os.environ.get("EXPORT_CACHE_ENABLED", "1") != "0"
+    EXPORT_CACHE_DIR          = BASE_DIR / "data" / "export_cache"
+    EXPORT_CACHE_MEMORY_BYTES = int(os.environ.get("EXPORT_CACHE_MEMORY_MB", "64")) * 1024 * 1024
+    EXPORT_CACHE_DISK_BYTES   = int(os.environ.get("EXPORT_CACHE_DISK_MB", "512")) * 1024 * 1024
+
+    # ── Export delivery ───────────────────────────────────────────────────────
+    # How export files reach the client: "" streams them from the worker
+    # (sendfile() via wsgi.file_wrapper); "x-accel-redirect" (nginx) or
+    # "x-sendfile" (Apache, lighttpd) hand the file to the front-end server.
+    EXPORT_SENDFILE     = os.environ.get("EXPORT_SENDFILE", "")
+    EXPORT_ACCEL_ROOT   = BASE_DIR / "data"                                  # nginx internal location's alias
+    EXPORT_ACCEL_PREFIX = os.environ.get("EXPORT_ACCEL_PREFIX", "/_data/")   # ...and its URI prefix
+    EXPORT_FILE_MAX_AGE = 24 * 3600   # browser caching of /api/export/files/ (content-addressed)
+
+    # ── PDF render pool ───────────────────────────────────────────────────────
+    # Worker processes for PDF conversion; 0 renders inline in the request thread.
+    PDF_RENDER_WORKERS             = int(os.environ.get("PDF_RENDER_WORKERS", "2"))
+    PDF_RENDER_QUEUE_SIZE          = int(os.environ.get("PDF_RENDER_QUEUE_SIZE", "8"))
+    PDF_RENDER_TIMEOUT             = float(os.environ.get("PDF_RENDER_TIMEOUT", "60"))
+    PDF_RENDER_MAX_JOBS_PER_WORKER = int(os.environ.get("PDF_RENDER_MAX_JOBS_PER_WORKER", "200"))
+    PDF_RENDER_RETRY_AFTER         = 5        # seconds, sent with 503 when the queue is full
+    PDF_RENDER_PREWARM             = False    # spawn workers at startup instead of first export
+
+    # Import the PDF engine and python-docx in a background thread at startup
+    # rather than on the first export (they take about a second to import).
+    EXPORT_WARMUP = os.environ.get("EXPORT_WARMUP", "0") != "0"
+
+    # ── Asynchronous export jobs ──────────────────────────────────────────────
+    EXPORT_JOB_WORKERS      = int(os.environ.get("EXPORT_JOB_WORKERS", "2"))   # threads per process
+    EXPORT_JOB_DIR          = BASE_DIR / "data" / "export_jobs"
+    EXPORT_JOB_TTL          = int(os.environ.get("EXPORT_JOB_TTL", "3600"))    # seconds results are kept
+    EXPORT_JOB_POLL_SECONDS = 1.0
+
+    # ── Bundle exports (/api/export/bundle) ───────────────────────────────────
+    EXPORT_BUNDLE_WORKERS      = int(os.environ.get("EXPORT_BUNDLE_WORKERS", "2"))   # render threads, shared
+    EXPORT_BUNDLE_MAX_RESUMES  = int(os.environ.get("EXPORT_BUNDLE_MAX_RESUMES", "100"))
+    EXPORT_BUNDLE_BUSY_RETRIES = 3   # per entry, waiting Retry-After when the render pool is full
+
+    # ── Parse cache ───────────────────────────────────────────────────────────
+    PARSE_CACHE_ENABLED        = os.environ.get("PARSE_CACHE_ENABLED", "1") != "0"
+    PARSE_CACHE_MEMORY_ENTRIES = 256
+    PARSE_CACHE_MAX_ROWS       = int(os.environ.get("PARSE_CACHE_MAX_ROWS", "5000"))
+    PARSE_CACHE_TTL            = int(os.environ.get("PARSE_CACHE_TTL_DAYS", "30")) * 24 * 3600
+
+    # ── Batch parsing (/api/parse-resume/batch) ───────────────────────────────
+    PARSE_BATCH_WORKERS   = int(os.environ.get("PARSE_BATCH_WORKERS", "0"))   # 0 = min(4, CPU count)
+    PARSE_BATCH_MAX_FILES = int(os.environ.get("PARSE_BATCH_MAX_FILES", "50"))
+    PARSE_BATCH_MAX_BYTES = int(os.environ.get("PARSE_BATCH_MAX_MB", "100")) * 1024 * 1024
+    PARSE_BATCH_TIMEOUT   = 300   # seconds for the whole batch
+
+    # ── Preview cache (rendered resume HTML) ──────────────────────────────────
+    PREVIEW_CACHE_ENABLED      = os.environ.get("PREVIEW_CACHE_ENABLED", "1") != "0"
+    PREVIEW_CACHE_MEMORY_BYTES = int(os.environ.get("PREVIEW_CACHE_MEMORY_MB", "16")) * 1024 * 1024
+
+    # ── Thumbnails (resume previews and template gallery) ─────────────────────
+    THUMBNAILS_ENABLED  = os.environ.get("THUMBNAILS_ENABLED", "1") != "0"
+    THUMBNAIL_DIR       = BASE_DIR / "data" / "thumbnails"
+    THUMBNAIL_WIDTH     = int(os.environ.get("THUMBNAIL_WIDTH", "400"))        # pixels
+    THUMBNAIL_FORMAT    = os.environ.get("THUMBNAIL_FORMAT", "webp")           # webp (needs Pillow) or png
+    THUMBNAIL_WORKERS   = int(os.environ.get("THUMBNAIL_WORKERS", "1"))        # background threads
+    THUMBNAIL_IDLE_WAIT = float(os.environ.get("THUMBNAIL_IDLE_WAIT", "30"))   # seconds to wait for an idle render worker
+    THUMBNAIL_MAX_AGE   = 365 * 24 * 3600                                       # immutable, content-addressed
+
+    # ── User cache (Flask-Login user_loader) ─────────────────────────────────
+    USER_CACHE_ENABLED     = os.environ.get("USER_CACHE_ENABLED", "1") != "0"
+    USER_CACHE_TTL         = int(os.environ.get("USER_CACHE_TTL", "60"))   # seconds; bounds cross-process staleness
+    USER_CACHE_MAX_ENTRIES = 1024
+
+    # ── Metrics (Server-Timing headers, Prometheus /metrics) ──────────────────
+    METRICS_ENABLED       = os.environ.get("METRICS_ENABLED", "1") != "0"
+    SERVER_TIMING_ENABLED = os.environ.get("SERVER_TIMING_ENABLED", "1") != "0"
+    METRICS_TOKEN         = os.environ.get("METRICS_TOKEN", "")   # bearer token; empty = loopback in debug only
+
+    # ── Request profiler (X-Profile header / ?_profile=, admins only) ─────────
+    PROFILER_ENABLED           = os.environ.get("PROFILER_ENABLED", "0") == "1"   # admins: flask set-admin
+    PROFILE_DIR                = BASE_DIR / "data" / "profiles"
+    PROFILE_MAX_FILES          = int(os.environ.get("PROFILE_MAX_FILES", "50"))   # newest kept
+    PROFILE_SAMPLE_INTERVAL_MS = float(os.environ.get("PROFILE_SAMPLE_INTERVAL_MS", "1"))
+
+    # ── Dashboard ─────────────────────────────────────────────────────────────
+    DASHBOARD_PAGE_SIZE = int(os.environ.get("DASHBOARD_PAGE_SIZE", "20"))   # resumes per listing page
+
     # ── Google OAuth ──────────────────────────────────────────────────────────
     GOOGLE_CLIENT_ID     = os.environ.get("GOOGLE_CLIENT_ID", "")
     GOOGLE_CLIENT_SECRET = os.environ.get("GOOGLE_CLIENT_SECRET", "")
@@ -51,6 +157,10 @@ class DevelopmentConfig(Config):
 class ProductionConfig(Config):
     DEBUG = False
     SESSION_COOKIE_SECURE = True    # enforce HTTPS in production
+    PDF_RENDER_PREWARM    = True
+    SQLITE_TUNED          = os.environ.get("SQLITE_TUNED", "1") != "0"
+    TEMPLATE_PRECOMPILE   = os.environ.get("TEMPLATE_PRECOMPILE", "1") != "0"
+    EXPORT_WARMUP         = os.environ.get("EXPORT_WARMUP", "1") != "0"
 
 
 config_by_name = {
@@ -1,89 +1,452 @@
 """API controllers — resume CRUD, export, and parse endpoints."""
-from flask import Blueprint, jsonify, request, send_file
+import json
+import logging
+import re
+import shutil
+import tempfile
+from io import BytesIO
+
+from flask import (
+    Blueprint, Response, current_app, g, jsonify, request, send_file,
+    stream_with_context, url_for,
+)
 
 from flask_login import current_user
+from sqlalchemy.orm import defer
+from sqlalchemy.orm.exc import StaleDataError
+from werkzeug.exceptions import RequestEntityTooLarge
+from werkzeug.http import is_resource_modified
+from werkzeug.utils import secure_filename
 
+from app.models.export_job import ExportJob
 from app.models.resume import ResumeModel
 from app.models.resume_db import Resume
 from app.models.user import db
-from app.services.export_service import build_pdf, build_docx, PDF_ENGINE
-from app.services.resume_parser import parse_resume_file
+from app.services.batch_parser import BatchRejected, batch_parser
+from app.services.downloads import downloads
+from app.services.export_bundle import BundleRejected, export_bundler
+from app.services.export_cache import export_cache
+from app.services.export_jobs import export_jobs
+from app.services.export_service import build_docx, build_pdf, export_file, pdf_engine
+from app.services.json_patch import JsonPatchConflict, JsonPatchError, apply_patch
+from app.services.metrics import metrics
+from app.services.render_pool import RenderPoolBusy, RenderTimeout
+from app.services.uploads import enforce_upload_limit, open_upload
+from app.services.parse_cache import parse_cache
+from app.services.preview_cache import preview_cache, template_file_for
+from app.services.profiler import PROFILE_NAME, request_profiler
+from app.services.thumbnails import thumbnails
+
+log = logging.getLogger(__name__)
 
 api_bp = Blueprint("api", __name__, url_prefix="/api")
 
+# Preview-cache slot for the file-backed anonymous resume (DB resumes use their id).
+_ANONYMOUS_PREVIEW = "anonymous"
+
+
+def _find_resume(resume_id=None, *options):
+    """Return the current user's resume (by id, or the primary one), or None."""
+    query = Resume.query.options(*options)
+    if resume_id:
+        return query.filter_by(id=resume_id, user_id=current_user.id).first()
+    return query.filter_by(user_id=current_user.id, is_primary=True).first()
+
 
 def _get_resume_data(resume_id=None):
     """Return resume data for current user, or file-based fallback for anonymous."""
     if current_user.is_authenticated:
-        if resume_id:
-            r = Resume.query.filter_by(id=resume_id, user_id=current_user.id).first()
-        else:
-            r = Resume.query.filter_by(user_id=current_user.id, is_primary=True).first()
+        r = _find_resume(resume_id)
         if r:
             return r.data
         return ResumeModel.default_data()
     return ResumeModel.load()
 
 
+def _saved_response(resume=None):
+    """Success body for a save, with the new ETag (and revision for DB resumes)."""
+    if resume is None:
+        response = jsonify({"success": True})
+        response.set_etag(ResumeModel.validators()[0])
+        return response
+    response = jsonify({"success": True, "revision": resume.revision})
+    response.set_etag(resume.etag)
+    return response
+
+
+def _resume_saved(resume=None) -> None:
+    """Drop derived artifacts of a resume that was just saved (None: the anonymous file)."""
+    if resume is None:
+        preview_cache.invalidate(_ANONYMOUS_PREVIEW)
+        return
+    preview_cache.invalidate(resume.id)
+    thumbnails.enqueue(resume.id, resume.etag)
+
+
+def _precondition_failed(etag: str):
+    response = jsonify({"error": "Resume was modified since it was loaded."})
+    response.set_etag(etag)
+    return response, 412
+
+
+def _if_match_fails(etag: str) -> bool:
+    return bool(request.if_match) and not request.if_match.contains(etag)
+
+
 @api_bp.route("/resume", methods=["GET"])
 def get_resume():
-    """Return saved resume data (user-specific if logged in)."""
+    """Return saved resume data (user-specific if logged in).
+
+    Sends a strong ETag (content hash; data-file mtime for anonymous users)
+    and Last-Modified, and answers a matching If-None-Match or
+    If-Modified-Since with 304 before anything is serialized.
+    """
     resume_id = request.args.get("resume_id", type=int)
-    return jsonify(_get_resume_data(resume_id=resume_id))
+    if current_user.is_authenticated:
+        r = _find_resume(resume_id, defer(Resume.data))
+        if r is None:
+            return jsonify(ResumeModel.default_data())
+        etag, last_modified = r.etag, r.updated_at
+        load = lambda: r.data  # noqa: E731
+    else:
+        etag, last_modified = ResumeModel.validators()
+        load = ResumeModel.load
+
+    if not is_resource_modified(request.environ, etag=etag, last_modified=last_modified):
+        response = Response(status=304)
+    else:
+        response = jsonify(load())
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    response.cache_control.no_cache = True
+    response.vary.add("Cookie")
+    return response
 
 
 @api_bp.route("/resume", methods=["POST"])
 def save_resume():
-    """Persist resume data sent as JSON (user-specific if logged in)."""
+    """Persist resume data sent as JSON (user-specific if logged in).
+
+    An ``If-Match`` header makes the save conditional on the version the
+    client last saw (412 when the resume has changed since).
+    """
     data = request.get_json()
     resume_id = request.args.get("resume_id", type=int)
     if current_user.is_authenticated:
-        if resume_id:
-            r = Resume.query.filter_by(id=resume_id, user_id=current_user.id).first()
-        else:
-            r = Resume.query.filter_by(user_id=current_user.id, is_primary=True).first()
+        r = _find_resume(resume_id)
         if r:
-            r.data = data
+            if _if_match_fails(r.etag):
+                return _precondition_failed(r.etag)
+            r.set_data(data)
         else:
             r = Resume(user_id=current_user.id, name="My Resume", data=data or {}, is_primary=True)
             db.session.add(r)
-        db.session.commit()
-    else:
+        try:
+            db.session.commit()
+        except StaleDataError:
+            db.session.rollback()
+            return jsonify({"error": "Resume was modified concurrently; reload and retry."}), 409
+        _resume_saved(r)
+        return _saved_response(r)
+    etag = ResumeModel.validators()[0]
+    if _if_match_fails(etag):
+        return _precondition_failed(etag)
+    ResumeModel.save(data)
+    _resume_saved()
+    return _saved_response()
+
+
+@api_bp.route("/resume", methods=["PATCH"])
+def patch_resume():
+    """Apply a JSON Patch (RFC 6902) to the saved resume.
+
+    Send ``If-Match`` with the ETag from the last GET/save: 412 when the resume
+    has changed since, 409 when a ``test`` operation fails or another save
+    lands first, 422 when the patch does not fit the document.
+    """
+    operations = request.get_json(silent=True)
+    if not isinstance(operations, list):
+        return jsonify({"error": "Body must be a JSON Patch array."}), 400
+    resume_id = request.args.get("resume_id", type=int)
+
+    if not current_user.is_authenticated:
+        etag = ResumeModel.validators()[0]
+        if _if_match_fails(etag):
+            return _precondition_failed(etag)
+        try:
+            data = _patched_resume(ResumeModel.load(), operations)
+        except JsonPatchConflict as exc:
+            return jsonify({"error": str(exc)}), 409
+        except JsonPatchError as exc:
+            return jsonify({"error": str(exc)}), 422
         ResumeModel.save(data)
-    return jsonify({"success": True})
+        _resume_saved()
+        return _saved_response()
+
+    r = _find_resume(resume_id)
+    if r is None:
+        return jsonify({"error": "Resume not found."}), 404
+    if _if_match_fails(r.etag):
+        return _precondition_failed(r.etag)
+    try:
+        data = _patched_resume(r.data, operations)
+    except JsonPatchConflict as exc:
+        return jsonify({"error": str(exc)}), 409
+    except JsonPatchError as exc:
+        return jsonify({"error": str(exc)}), 422
+
+    if data != r.data:
+        r.set_data(data)
+        try:
+            db.session.commit()
+        except StaleDataError:
+            db.session.rollback()
+            return jsonify({"error": "Resume was modified concurrently; reload and retry."}), 409
+        _resume_saved(r)
+    return _saved_response(r)
+
+
+def _patched_resume(doc: dict, operations: list) -> dict:
+    """``apply_patch`` for resumes: the result must still be a JSON object."""
+    data = apply_patch(doc, operations)
+    if not isinstance(data, dict):
+        raise JsonPatchError("Patched resume must be a JSON object.")
+    return data
+
+
+@api_bp.route("/resume/preview", methods=["GET"])
+def preview_resume():
+    """Return the saved resume rendered as HTML (``?template=`` overrides its own).
+
+    Served from the preview cache while the resume is unchanged; 304 on a
+    matching If-None-Match. ``X-Preview-Cache`` reports HIT or MISS.
+    """
+    resume_id = request.args.get("resume_id", type=int)
+    if current_user.is_authenticated:
+        r = _find_resume(resume_id, defer(Resume.data))
+        if r is None:
+            return jsonify({"error": "Resume not found."}), 404
+        slot, version, template_id = r.id, r.etag, r.template
+        load = lambda: r.data  # noqa: E731
+    else:
+        slot, version = _ANONYMOUS_PREVIEW, ResumeModel.validators()[0]
+        load = ResumeModel.load
+        template_id = None
+    template_file = template_file_for(request.args.get("template") or template_id or (load() or {}).get("template"))
+    etag = f"{version}-{template_file}"
+    if not is_resource_modified(request.environ, etag=etag):
+        response = Response(status=304)
+    else:
+        html, hit = preview_cache.render(slot, version, template_file, load)
+        response = Response(html, mimetype="text/html")
+        response.headers["X-Preview-Cache"] = "HIT" if hit else "MISS"
+    response.set_etag(etag)
+    response.cache_control.no_cache = True
+    response.vary.add("Cookie")
+    return response
+
+
+@api_bp.route("/preview/stats", methods=["GET"])
+def preview_stats():
+    """Preview cache counters: entries, bytes, hits, misses, evictions, hit_rate.
+
+    Same access rule as ``/metrics`` (``METRICS_TOKEN``).
+    """
+    if not metrics.authorized():
+        return jsonify({"error": "Not found"}), 404
+    return jsonify(preview_cache.stats())
 
 
 @api_bp.route("/export/pdf", methods=["POST"])
 def export_pdf():
     """Generate and stream a PDF of the resume."""
-    if PDF_ENGINE is None:
+    if pdf_engine() is None:
         return jsonify({
             "error": "No PDF engine installed. Run: pip install xhtml2pdf  OR  pip install weasyprint"
         }), 503
 
     data = request.get_json()
-    buffer = build_pdf(data)
-    filename = _resume_filename(data, "pdf")
-    return send_file(buffer, mimetype="application/pdf", as_attachment=True, download_name=filename)
+    try:
+        export = export_file("pdf", data)
+        return _send_export(export, "pdf", data, _resume_filename(data, "pdf"))
+    except RenderPoolBusy as exc:   # also RenderPoolRestarted: the job was lost, retry
+        response = jsonify({"error": str(exc)})
+        response.headers["Retry-After"] = str(exc.retry_after)
+        return response, 503
+    except RenderTimeout as exc:
+        return jsonify({"error": str(exc)}), 504
 
 
 @api_bp.route("/export/docx", methods=["POST"])
 def export_docx():
     """Generate and stream a DOCX of the resume."""
     data = request.get_json()
-    buffer = build_docx(data)
-    filename = _resume_filename(data, "docx")
-    return send_file(
-        buffer,
-        mimetype="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-        as_attachment=True,
-        download_name=filename,
+    export = export_file("docx", data)
+    return _send_export(export, "docx", data, _resume_filename(data, "docx"))
+
+
+def _send_export(export, fmt, data, filename):
+    """Send a rendered export; Content-Location gives a GET URL for re-downloads and ranges.
+
+    Another worker pruning the disk tier can remove the file after
+    ``export_file`` returned it; the export is then rebuilt and sent from memory.
+    """
+    if export.path is not None:
+        try:
+            response = downloads.send(export.path, mimetype=_EXPORT_MIMETYPES[fmt],
+                                      download_name=filename, etag=export.key)
+        except FileNotFoundError:
+            log.info("[api] Export file %s was pruned before it was sent; rebuilding", export.key)
+            payload = (build_pdf(data) if fmt == "pdf" else build_docx(data)).getvalue()
+            export = export._replace(path=None, payload=payload)
+    if export.path is None:
+        return send_file(BytesIO(export.payload), mimetype=_EXPORT_MIMETYPES[fmt],
+                         as_attachment=True, download_name=filename)
+    response.headers["Content-Location"] = url_for(
+        "api.download_export_file", name=f"{export.key}.{fmt}", filename=filename,
     )
+    return response
+
+
+@api_bp.route("/export/bundle", methods=["POST"])
+def export_bundle():
+    """Stream a ZIP of several of the user's resumes.
+
+    Body: ``{"resume_ids": [...], "formats": ["pdf", "docx"]}``; without
+    ``resume_ids`` every resume is included, ``formats`` defaults to PDF.
+    Entries are rendered in parallel and sent as each one finishes.
+    """
+    if not current_user.is_authenticated:
+        return jsonify({"error": "Sign in to export several resumes."}), 401
+    body = request.get_json(silent=True) or {}
+    formats = body.get("formats") or ["pdf"]
+    resume_ids = body.get("resume_ids")
+    if not isinstance(formats, list) or not (resume_ids is None or isinstance(resume_ids, list)):
+        return jsonify({"error": "resume_ids and formats must be lists."}), 400
+    if resume_ids is not None and (
+        not resume_ids or not all(isinstance(i, int) and not isinstance(i, bool) for i in resume_ids)
+    ):
+        return jsonify({"error": "resume_ids must be a non-empty list of integers."}), 400
+    if "pdf" in formats and pdf_engine() is None:
+        return jsonify({
+            "error": "No PDF engine installed. Run: pip install xhtml2pdf  OR  pip install weasyprint"
+        }), 503
+
+    query = Resume.query.filter_by(user_id=current_user.id).order_by(Resume.id)
+    if resume_ids is not None:
+        query = query.filter(Resume.id.in_(set(resume_ids)))
+    resumes = query.all()
+    if resume_ids is not None and len(resumes) != len(set(resume_ids)):
+        found = {r.id for r in resumes}
+        missing = [i for i in dict.fromkeys(resume_ids) if i not in found]
+        return jsonify({"error": "Resumes not found", "resume_ids": missing}), 404
+    if not resumes:
+        return jsonify({"error": "No resumes to export."}), 404
+    try:
+        entries = export_bundler.entries(resumes, formats)
+    except BundleRejected as exc:
+        return jsonify({"error": str(exc)}), exc.status
+
+    return Response(
+        export_bundler.stream(entries),
+        mimetype="application/zip",
+        headers={
+            "Content-Disposition": 'attachment; filename="resumes.zip"',
+            "X-Accel-Buffering": "no",   # let nginx pass entries through as they come
+        },
+    )
+
+
+_EXPORT_FILE_NAME = re.compile(r"([0-9a-f]{64})\.(pdf|docx)")
+
+
+@api_bp.route("/export/files/<name>", methods=["GET"])
+def download_export_file(name):
+    """Download a rendered export by its content address (``<sha256>.<pdf|docx>``).
+
+    The address covers the resume content, so it works as a capability URL.
+    Supports conditional and Range requests; 404 once the file is pruned.
+    """
+    match = _EXPORT_FILE_NAME.fullmatch(name)
+    path = export_cache.file(match.group(1)) if match else None
+    if path is None:
+        return jsonify({"error": "Export file not found or expired"}), 404
+    key, fmt = match.groups()
+    filename = secure_filename(request.args.get("filename", "")) or f"resume.{fmt}"
+    if not filename.endswith(f".{fmt}"):
+        filename += f".{fmt}"
+    return downloads.send(path, mimetype=_EXPORT_MIMETYPES[fmt], download_name=filename, etag=key,
+                          max_age=current_app.config["EXPORT_FILE_MAX_AGE"])
+
+
+_EXPORT_MIMETYPES = {
+    "pdf":  "application/pdf",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+}
+
+
+@api_bp.route("/export/jobs", methods=["POST"])
+def create_export_job():
+    """Queue an export (``?format=pdf|docx``) and return its job id immediately."""
+    fmt = request.args.get("format", "pdf").lower()
+    if fmt not in _EXPORT_MIMETYPES:
+        return jsonify({"error": "Unsupported format. Use pdf or docx."}), 400
+    if fmt == "pdf" and pdf_engine() is None:
+        return jsonify({
+            "error": "No PDF engine installed. Run: pip install xhtml2pdf  OR  pip install weasyprint"
+        }), 503
+
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({"error": "Resume JSON body required"}), 400
+
+    user_id = current_user.id if current_user.is_authenticated else None
+    job = export_jobs.submit(fmt, data, _resume_filename(data, fmt), user_id=user_id)
+    body = job.to_dict()
+    body["status_url"] = url_for("api.get_export_job", job_id=job.id)
+    body["file_url"]   = url_for("api.download_export_job", job_id=job.id)
+    return jsonify(body), 202, {"Location": body["status_url"]}
+
+
+@api_bp.route("/export/jobs/<job_id>", methods=["GET"])
+def get_export_job(job_id):
+    """Poll the status of an export job."""
+    job = _get_export_job(job_id)
+    if job is None:
+        return jsonify({"error": "Export job not found or expired"}), 404
+    body = job.to_dict()
+    if job.status == ExportJob.DONE:
+        body["file_url"] = url_for("api.download_export_job", job_id=job.id)
+    return jsonify(body)
+
+
+@api_bp.route("/export/jobs/<job_id>/file", methods=["GET"])
+def download_export_job(job_id):
+    """Download the file produced by a finished export job."""
+    job = _get_export_job(job_id)
+    if job is None:
+        return jsonify({"error": "Export job not found or expired"}), 404
+    if job.status != ExportJob.DONE:
+        return jsonify({"error": f"Export job is {job.status}", "status": job.status}), 409
+    return downloads.send(job.result_path, mimetype=_EXPORT_MIMETYPES[job.format], download_name=job.filename)
+
+
+def _get_export_job(job_id):
+    job = ExportJob.query.filter_by(id=job_id).first()
+    if job is None:
+        return None
+    if job.user_id is not None and (
+        not current_user.is_authenticated or current_user.id != job.user_id
+    ):
+        return None
+    return job
 
 
 @api_bp.route("/parse-resume", methods=["POST"])
 def parse_resume():
     """Parse an uploaded resume file and return structured JSON data."""
+    enforce_upload_limit()
     if "resume" not in request.files:
         return jsonify({"error": "No file uploaded"}), 400
 
@@ -96,21 +459,92 @@ def parse_resume():
     if ext not in allowed_ext:
         return jsonify({"error": "Unsupported file type. Use PDF or DOCX."}), 415
 
-    file_bytes = file.read()
-    if len(file_bytes) > 10 * 1024 * 1024:
-        return jsonify({"error": "File too large. Max 10 MB."}), 413
-
     import logging
     log = logging.getLogger(__name__)
+    with open_upload(file) as upload:
+        if len(upload) > current_app.config["MAX_UPLOAD_BYTES"]:
+            return _upload_too_large()
+        try:
+            parsed = parse_cache.parse(upload, file.filename)
+            c = parsed.get("contacts") or {}
+            log.info("[parse-resume] Parsed: name=%r, experience=%d, skills=%d",
+                     c.get("name"), len(parsed.get("experience") or []), len(parsed.get("skills") or []))
+            return jsonify(parsed)
+        except Exception as exc:
+            log.exception("[parse-resume] Failed: %s", exc)
+            return jsonify({"error": f"Parsing failed: {exc}"}), 500
+
+
+@api_bp.route("/parse-resume/batch", methods=["POST"])
+def parse_resume_batch():
+    """Parse many resumes (multipart ``resumes`` parts or one ZIP) and stream NDJSON.
+
+    Each line is ``{"index", "filename", "ok", "data" | "error"}`` and is sent
+    as soon as that file finishes, so results arrive in completion order.
+    """
+    try:
+        enforce_upload_limit(batch_parser.max_bytes)
+        files = request.files.getlist("resumes") or request.files.getlist("resume")
+    except RequestEntityTooLarge:
+        limit_mb = batch_parser.max_bytes // (1024 * 1024)
+        return jsonify({"error": f"Batch too large. Max {limit_mb} MB per batch."}), 413
+    workdir = tempfile.mkdtemp(prefix="batch-")
     try:
-        parsed = parse_resume_file(file_bytes, file.filename)
-        c = parsed.get("contacts") or {}
-        log.info("[parse-resume] Parsed: name=%r, experience=%d, skills=%d",
-                 c.get("name"), len(parsed.get("experience") or []), len(parsed.get("skills") or []))
-        return jsonify(parsed)
-    except Exception as exc:
-        log.exception("[parse-resume] Failed: %s", exc)
-        return jsonify({"error": f"Parsing failed: {exc}"}), 500
+        entries = batch_parser.collect(files, workdir)
+    except BatchRejected as exc:
+        shutil.rmtree(workdir, ignore_errors=True)
+        return jsonify({"error": str(exc)}), exc.status
+
+    def generate():
+        try:
+            for result in batch_parser.run(entries):
+                yield json.dumps(result, ensure_ascii=False) + "\n"
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="application/x-ndjson",
+        headers={"X-Accel-Buffering": "no"},   # let nginx pass lines through as they come
+    )
+
+
+@api_bp.route("/profiles", methods=["GET"])
+def list_profiles():
+    """Saved request profiles, newest first (admins only)."""
+    if not request_profiler.enabled or not request_profiler.is_admin(current_user):
+        return jsonify({"error": "Not found"}), 404
+    return jsonify([
+        {"name": p.name, "size": p.stat().st_size, "url": url_for("api.download_profile", name=p.name)}
+        for p in request_profiler.profiles()
+    ])
+
+
+@api_bp.route("/profiles/<name>", methods=["GET"])
+def download_profile(name):
+    """Download one saved request profile (admins only)."""
+    if not request_profiler.enabled or not request_profiler.is_admin(current_user) or not PROFILE_NAME.fullmatch(name):
+        return jsonify({"error": "Not found"}), 404
+    path = request_profiler.directory / name
+    if not path.exists():
+        return jsonify({"error": "Not found"}), 404
+    mimetype = "application/json" if name.endswith(".json") else "application/octet-stream"
+    return downloads.send(path, mimetype=mimetype, download_name=name)
+
+
+@api_bp.errorhandler(RequestEntityTooLarge)
+def _request_too_large(exc=None):
+    # Upload routes set their own limit (enforce_upload_limit); everything else
+    # is bound by MAX_CONTENT_LENGTH.
+    if g.get("upload_limit"):
+        return _upload_too_large()
+    limit_mb = current_app.config["MAX_CONTENT_LENGTH"] // (1024 * 1024)
+    return jsonify({"error": f"Request too large. Max {limit_mb} MB."}), 413
+
+
+def _upload_too_large():
+    limit_mb = g.get("upload_limit", current_app.config["MAX_UPLOAD_BYTES"]) // (1024 * 1024)
+    return jsonify({"error": f"File too large. Max {limit_mb} MB."}), 413
 
 
 def _resume_filename(data: dict, extension: str) -> str:
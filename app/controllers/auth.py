@@ -9,6 +9,7 @@ from flask import (
 from flask_login import current_user, login_required, login_user, logout_user
 
 from app.models.user import User, db
+from app.services.user_cache import user_cache
 
 auth_bp = Blueprint("auth", __name__, url_prefix="/auth")
 
@@ -41,6 +42,7 @@ def email_login():
 
     user.last_login_at = datetime.utcnow()
     db.session.commit()
+    user_cache.invalidate(user.id)
     login_user(user, remember=True)
     return jsonify({"ok": True, "redirect": session.pop("next_url", "/dashboard")}), 200
 
@@ -70,6 +72,8 @@ def register():
 
 @auth_bp.route("/logout")
 def logout():
+    if current_user.is_authenticated:
+        user_cache.invalidate(current_user.id)
     logout_user()
     return redirect("/")
 
@@ -118,6 +122,7 @@ def google_callback():
         db.session.add(user)
 
     db.session.commit()
+    user_cache.invalidate(user.id)
     login_user(user, remember=True)
     return redirect(session.pop("next_url", "/dashboard"))
 
@@ -171,5 +176,6 @@ def facebook_callback():
         db.session.add(user)
 
     db.session.commit()
+    user_cache.invalidate(user.id)
     login_user(user, remember=True)
     return redirect(session.pop("next_url", "/dashboard"))
@@ -1,32 +1,19 @@
 """Page controllers — serve HTML views."""
 import os
 
-from flask import Blueprint, flash, redirect, render_template, request, session, url_for
+from flask import (
+    Blueprint, abort, current_app, flash, redirect, render_template, request,
+    send_from_directory, session, url_for,
+)
 from flask_login import current_user, login_required
+from werkzeug.exceptions import RequestEntityTooLarge
 
 from app.models.resume import ResumeModel
-
-# Map template IDs (from resume data / JS) to actual resume HTML template filenames
-TEMPLATE_TO_HTML = {
-    "classic": "classic",
-    "modern_simple": "modern",
-    "modern_with_photo": "photo_modern",
-    "chronological": "classic",
-    "functional": "minimal",
-    "hybrid": "two_col_light",
-    "creative": "timeline",
-    "simple_ats": "clean",
-    "two_col_ats": "two_col_light",
-    "polished": "elegant",
-    "minimalist": "minimal",
-    "elegant": "elegant",
-    "teenager": "simple",
-    "internship": "simple",
-    "entry_level": "clean",
-    "career_change": "minimal",
-}
 from app.models.resume_db import Resume
-from app.services.resume_parser import parse_resume_file
+from app.services.parse_cache import parse_cache
+from app.services.preview_cache import preview_cache, template_file_for
+from app.services.thumbnails import thumbnails
+from app.services.uploads import enforce_upload_limit, open_upload
 
 pages_bp = Blueprint("pages", __name__)
 
@@ -39,13 +26,20 @@ def landing():
 @pages_bp.route("/upload", methods=["GET", "POST"])
 def upload():
     if request.method == "POST":
-        if "resume" not in request.files:
+        try:
+            enforce_upload_limit()
+            if "resume" not in request.files:
+                return redirect(url_for("pages.upload_source"))
+        except RequestEntityTooLarge:
+            limit_mb = current_app.config["MAX_UPLOAD_BYTES"] // (1024 * 1024)
+            flash(f"File too large. Max {limit_mb} MB.", "error")
             return redirect(url_for("pages.upload_source"))
         file = request.files["resume"]
         if not file or not file.filename:
             return redirect(url_for("pages.upload_source"))
         try:
-            parsed = parse_resume_file(file.read(), file.filename)
+            with open_upload(file) as upload:
+                parsed = parse_cache.parse(upload, file.filename)
             tpl = request.form.get("selected_template", "").strip()
             if tpl:
                 parsed["template"] = tpl
@@ -66,35 +60,51 @@ def upload_source():
 @pages_bp.route("/dashboard")
 @login_required
 def dashboard():
-    """User dashboard — resume preview, Edit, Download, Create New Resume."""
-    resumes = list(
-        Resume.query.filter_by(user_id=current_user.id)
-        .order_by(Resume.updated_at.desc())
+    """User dashboard — resume preview, Edit, Download, Create New Resume.
+
+    The resume list is one keyset-paginated page of listing columns; only the
+    selected resume's ``data`` is loaded, for the preview.
+    """
+    resumes, next_cursor = Resume.listing(
+        current_user.id,
+        limit=current_app.config["DASHBOARD_PAGE_SIZE"],
+        cursor=request.args.get("cursor"),
     )
     resume_id = request.args.get("resume_id", type=int)
     current_resume = None
     if resume_id:
-        current_resume = next((r for r in resumes if r.id == resume_id), None)
+        current_resume = next((r for r in resumes if r.id == resume_id), None) \
+            or Resume.query.filter_by(id=resume_id, user_id=current_user.id).first()
     if not current_resume and resumes:
         current_resume = resumes[0]
-    resume_data = current_resume.data if current_resume else ResumeModel.default_data()
-
-    # Render resume HTML for preview (map template ID to HTML template filename)
-    template_id = (resume_data or {}).get("template", "classic")
-    template_file = TEMPLATE_TO_HTML.get(template_id, "classic")
-    resume_html = render_template(f"resume/{template_file}.html", **(resume_data or ResumeModel.default_data()))
+    if current_resume and current_resume not in resumes:
+        resumes.insert(0, current_resume)
+
+    # Prefer the pre-rendered thumbnail; otherwise live HTML from the preview cache
+    thumbnail_url = thumbnails.resume_url(current_resume) if current_resume else None
+    if thumbnail_url:
+        resume_html = None
+    elif current_resume:
+        thumbnails.enqueue(current_resume.id, current_resume.etag)
+        resume_html, _ = preview_cache.render(
+            current_resume.id, current_resume.etag, template_file_for(current_resume.template),
+            lambda: current_resume.data or ResumeModel.default_data(),
+        )
+    else:
+        resume_html = render_template("resume/classic.html", **ResumeModel.default_data())
 
     def display_name(r):
-        return (r.data.get("contacts", {}).get("name") or r.name or "My Resume").replace(" ", "_").upper()
+        return (r.display_name or r.name or "My Resume").replace(" ", "_").upper()
 
     return render_template(
         "dashboard.html",
         user=current_user,
         resumes=resumes,
         current_resume=current_resume,
-        resume_data=resume_data,
         resume_html=resume_html,
+        thumbnail_url=thumbnail_url,
         display_name=display_name,
+        next_cursor=next_cursor,
     )
 
 
@@ -113,7 +123,32 @@ def login():
 
 @pages_bp.route("/templates")
 def choose_templates():
-    return render_template("choose_templates.html")
+    return render_template("choose_templates.html", gallery_thumbnails=thumbnails.gallery_urls())
+
+
+def _immutable(response, private: bool = False):
+    """Long-lived caching for content-addressed thumbnail files."""
+    response.cache_control.no_cache = None
+    response.cache_control.max_age = current_app.config["THUMBNAIL_MAX_AGE"]
+    response.cache_control.immutable = True
+    response.cache_control.public = not private
+    response.cache_control.private = private or None
+    return response
+
+
+@pages_bp.route("/thumbnails/resumes/<int:resume_id>/<name>")
+@login_required
+def resume_thumbnail(resume_id, name):
+    if not Resume.query.with_entities(Resume.id).filter_by(id=resume_id, user_id=current_user.id).first():
+        abort(404)
+    return _immutable(send_from_directory(thumbnails.resume_dir(resume_id), name), private=True)
+
+
+@pages_bp.route("/thumbnails/gallery/<name>")
+def gallery_thumbnail(name):
+    if name == "manifest.json":
+        abort(404)
+    return _immutable(send_from_directory(thumbnails.gallery_path(""), name))
 
 
 @pages_bp.route("/editor", methods=["GET"])
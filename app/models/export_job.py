@@ -0,0 +1,41 @@
+"""Export job model — persistent queue for asynchronous PDF/DOCX exports."""
+import uuid
+from datetime import datetime
+
+from app.models.user import db
+
+
+class ExportJob(db.Model):
+    """Queued export; the rendered file lives on disk at ``result_path``."""
+
+    __tablename__ = "export_jobs"
+
+    QUEUED  = "queued"
+    RUNNING = "running"
+    DONE    = "done"
+    FAILED  = "failed"
+
+    id          = db.Column(db.String(32), primary_key=True, default=lambda: uuid.uuid4().hex)
+    user_id     = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=True, index=True)
+    format      = db.Column(db.String(8), nullable=False)
+    status      = db.Column(db.String(16), nullable=False, default=QUEUED, index=True)
+    payload     = db.Column(db.JSON, nullable=False)
+    filename    = db.Column(db.String(255), nullable=False)
+    result_path = db.Column(db.String(512), nullable=True)
+    error       = db.Column(db.Text, nullable=True)
+    attempts    = db.Column(db.Integer, nullable=False, default=0)
+    created_at  = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+    started_at  = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+    expires_at  = db.Column(db.DateTime, nullable=True, index=True)
+
+    def to_dict(self) -> dict:
+        return {
+            "job_id":      self.id,
+            "format":      self.format,
+            "status":      self.status,
+            "error":       self.error,
+            "created_at":  self.created_at.isoformat() + "Z" if self.created_at else None,
+            "finished_at": self.finished_at.isoformat() + "Z" if self.finished_at else None,
+            "expires_at":  self.expires_at.isoformat() + "Z" if self.expires_at else None,
+        }
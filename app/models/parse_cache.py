@@ -0,0 +1,17 @@
+"""Parse cache model — structured resume JSON keyed by uploaded file digest."""
+from datetime import datetime
+
+from app.models.user import db
+
+
+class ParseCacheEntry(db.Model):
+    """Result of parsing one uploaded file with one parser version."""
+
+    __tablename__ = "parse_cache"
+
+    digest         = db.Column(db.String(64), primary_key=True)   # SHA-256 of extension + file bytes
+    parser_version = db.Column(db.String(16), primary_key=True)
+    data           = db.Column(db.JSON, nullable=False)
+    size_bytes     = db.Column(db.Integer, nullable=False, default=0)
+    created_at     = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+    last_used_at   = db.Column(db.DateTime, default=datetime.utcnow, index=True)
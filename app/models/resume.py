@@ -1,9 +1,165 @@
-"""Resume model — data loading, saving, and default values."""
+"""Resume model — data loading, saving, and default values.
+
+The anonymous resume lives in one JSON file shared by every worker process.
+:class:`ResumeFile` keeps a parsed copy in memory, revalidated against the
+file's inode, mtime and size, so reads are a ``stat`` plus a copy. Writes go
+to a temp file that is fsynced and renamed over the original while holding an
+exclusive ``flock`` on a sidecar lock file. Saves arriving within
+``RESUME_SAVE_COALESCE_MS`` of each other are written once; until then this
+process serves the pending data and other processes the previous file.
+
+A coalesced save is acknowledged before it reaches the disk: if the process
+is killed (SIGKILL, OOM) within that window the save is lost. A normal exit
+flushes it. A background write that fails is logged and retried with backoff.
+Set ``RESUME_SAVE_COALESCE_MS=0`` to write every save before responding.
+"""
+import atexit
+import copy
+import hashlib
 import json
+import logging
+import os
+import tempfile
+import threading
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Dict, Optional, Tuple
 
 from flask import current_app
 
+log = logging.getLogger(__name__)
+
+try:
+    import fcntl
+except ImportError:  # not POSIX; atomic renames still apply, without the lock
+    fcntl = None
+
+_MAX_RETRY_DELAY = 30.0   # seconds between retries of a failed background write
+
+
+class ResumeFile:
+    """In-memory view and coalescing writer for one resume JSON file."""
+
+    def __init__(self, path: Path):
+        self.path      = Path(path)
+        self._lock     = threading.Lock()
+        self._key      = None    # (st_ino, st_mtime_ns, st_size) of the cached read
+        self._data     = None
+        self._etag     = None
+        self._modified = None
+        self._pending  = False   # saved in memory, not yet on disk
+        self._timer: Optional[threading.Timer] = None
+
+    def _state(self):
+        """Return ``(data, etag, last_modified)``; data is None when there is no file."""
+        with self._lock:
+            if self._pending:
+                return self._data, self._etag, self._modified
+            try:
+                st = os.stat(self.path)
+            except FileNotFoundError:
+                self._key = self._data = self._etag = self._modified = None
+                return None, None, None
+            key = (st.st_ino, st.st_mtime_ns, st.st_size)
+            if key != self._key:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._data = json.load(f)
+                self._key      = key
+                self._etag     = data_digest(self._data)[:32]
+                self._modified = datetime.fromtimestamp(st.st_mtime, timezone.utc)
+            return self._data, self._etag, self._modified
+
+    def load(self) -> Optional[dict]:
+        """A private copy of the saved data, or None when there is no file."""
+        data = self._state()[0]
+        return copy.deepcopy(data) if data is not None else None
+
+    def validators(self) -> Tuple[Optional[str], Optional[datetime]]:
+        _, etag, modified = self._state()
+        return etag, modified
+
+    def save(self, data: dict, delay: float = 0.0) -> None:
+        """Store ``data``; written to disk now, or after ``delay`` seconds with later saves folded in."""
+        data = copy.deepcopy(data)
+        with self._lock:
+            self._data     = data
+            self._etag     = data_digest(data)[:32]
+            self._modified = datetime.now(timezone.utc)
+            self._pending  = True
+            if delay > 0:
+                if self._timer is None:
+                    self._schedule(delay)
+                return
+        self.flush()
+
+    def _schedule(self, delay: float) -> None:
+        # Caller holds self._lock.
+        self._timer = threading.Timer(delay, self._flush_in_background, (delay,))
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _flush_in_background(self, delay: float) -> None:
+        try:
+            self.flush()
+        except Exception as exc:
+            retry = min(delay * 2, _MAX_RETRY_DELAY)
+            log.error("[resume] Could not write %s: %s; retrying in %.1fs", self.path, exc, retry)
+            with self._lock:
+                if self._pending and self._timer is None:
+                    self._schedule(retry)
+
+    def flush(self) -> None:
+        """Write pending data to disk, if any."""
+        with self._lock:
+            self._timer = None
+            if not self._pending:
+                return
+            self._write(self._data)
+            st = os.stat(self.path)
+            self._key     = (st.st_ino, st.st_mtime_ns, st.st_size)
+            self._pending = False
+
+    def _write(self, data: dict) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(f"{self.path}.lock", "a") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp, self.path)
+            except BaseException:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+                raise
+            # flock is released when the lock file closes
+
+
+_files: Dict[Path, ResumeFile] = {}
+_files_lock = threading.Lock()
+
+
+def resume_file(path: Path) -> ResumeFile:
+    """The shared :class:`ResumeFile` for ``path`` (one per process)."""
+    with _files_lock:
+        if path not in _files:
+            _files[path] = ResumeFile(path)
+        return _files[path]
+
+
+@atexit.register
+def _flush_pending() -> None:
+    for f in list(_files.values()):
+        try:
+            f.flush()
+        except Exception as exc:
+            log.warning("[resume] Could not write %s on exit: %s", f.path, exc)
+
 
 class ResumeModel:
     """Handles persistence and default data for resume records."""
@@ -15,19 +171,26 @@ class ResumeModel:
     @classmethod
     def load(cls) -> dict:
         """Return saved resume data, or defaults if no file exists."""
-        data_file = cls._data_file()
-        if data_file.exists():
-            with open(data_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        return cls.default_data()
+        data = resume_file(cls._data_file()).load()
+        return data if data is not None else cls.default_data()
+
+    @classmethod
+    def validators(cls) -> Tuple[str, Optional[datetime]]:
+        """Return ``(etag, last_modified)`` for the saved data.
+
+        The ETag is the content hash, so it does not change when a coalesced
+        save reaches the disk; for the defaults it is the hash of the defaults.
+        """
+        etag, modified = resume_file(cls._data_file()).validators()
+        if etag is None:
+            return data_digest(cls.default_data())[:32], None
+        return etag, modified
 
     @classmethod
     def save(cls, data: dict) -> None:
-        """Persist resume data to disk."""
-        data_file = cls._data_file()
-        data_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(data_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        """Persist resume data to disk (coalesced with saves that follow closely)."""
+        delay = current_app.config.get("RESUME_SAVE_COALESCE_MS", 0) / 1000
+        resume_file(cls._data_file()).save(data, delay)
 
     @staticmethod
     def default_data() -> dict:
@@ -160,3 +323,9 @@ class ResumeModel:
             "additional": "",
             "template": "classic",
         }
+
+
+def data_digest(data) -> str:
+    """SHA-256 of the canonical JSON form of resume data (key order and spacing ignored)."""
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
@@ -1,20 +1,143 @@
 """Resume DB model — user-specific resume storage."""
+import logging
 from datetime import datetime
+from typing import List, Optional, Tuple
 
+from sqlalchemy.orm import load_only, validates
+
+from app.models.resume import data_digest
 from app.models.user import db
 
+log = logging.getLogger(__name__)
+
 
 class Resume(db.Model):
-    """User resume record with JSON data."""
+    """User resume record with JSON data.
+
+    ``revision`` is the ORM version counter: every UPDATE bumps it and only
+    succeeds if the row still has the revision that was loaded, so concurrent
+    writers fail with ``StaleDataError`` instead of overwriting each other.
+    ``data_hash`` and the listing columns (``display_name``, ``template``,
+    ``job_title``) are kept in step with ``data``, so listings never need to
+    load the JSON blob.
+    """
 
     __tablename__ = "resumes"
+    __table_args__ = (
+        db.Index("ix_resumes_user_primary_updated", "user_id", "is_primary", "updated_at"),
+    )
 
-    id         = db.Column(db.Integer, primary_key=True)
-    user_id    = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False, index=True)
-    name       = db.Column(db.String(120), nullable=False, default="My Resume")
-    data       = db.Column(db.JSON, nullable=False)
-    is_primary = db.Column(db.Boolean, default=True, nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    id           = db.Column(db.Integer, primary_key=True)
+    user_id      = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False, index=True)
+    name         = db.Column(db.String(120), nullable=False, default="My Resume")
+    data         = db.Column(db.JSON, nullable=False)
+    is_primary   = db.Column(db.Boolean, default=True, nullable=False)
+    created_at   = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at   = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    revision     = db.Column(db.Integer, nullable=False, default=1, server_default="1")
+    data_hash    = db.Column(db.String(64), nullable=True)
+    display_name = db.Column(db.String(200), nullable=True)
+    template     = db.Column(db.String(64), nullable=True)
+    job_title    = db.Column(db.String(200), nullable=True)
 
     user = db.relationship("User", backref=db.backref("resumes", lazy="dynamic"))
+
+    __mapper_args__ = {"version_id_col": revision}
+
+    LISTING_COLUMNS = ("id", "user_id", "name", "is_primary", "updated_at", "revision",
+                       "display_name", "template", "job_title", "data_hash")
+
+    @validates("data")
+    def _sync_data(self, key, value):
+        self.data_hash = data_digest(value)
+        for column, field in _listing_fields(value).items():
+            setattr(self, column, field)
+        return value
+
+    @property
+    def etag(self) -> str:
+        """Strong entity tag (unquoted) derived from the content hash."""
+        return (self.data_hash or data_digest(self.data))[:32]
+
+    def set_data(self, data: dict) -> None:
+        """Replace the resume content; the revision is bumped on flush."""
+        self.data = data
+
+    # ── Listing ───────────────────────────────────────────────────────────────
+
+    @classmethod
+    def listing(cls, user_id: int, limit: int, cursor: str = None) -> Tuple[List["Resume"], Optional[str]]:
+        """Return one page of a user's resumes, newest first, without their ``data``.
+
+        Keyset pagination over ``(updated_at, id)``: pass the returned cursor to
+        get the next page. Returns ``(rows, next_cursor)``; the cursor is None on
+        the last page.
+        """
+        query = (
+            cls.query.options(load_only(*(getattr(cls, c) for c in cls.LISTING_COLUMNS)))
+            .filter(cls.user_id == user_id)
+            .order_by(cls.updated_at.desc(), cls.id.desc())
+        )
+        after = _decode_cursor(cursor)
+        if after is not None:
+            updated_at, last_id = after
+            query = query.filter(db.or_(
+                cls.updated_at < updated_at,
+                db.and_(cls.updated_at == updated_at, cls.id < last_id),
+            ))
+        rows = query.limit(limit + 1).all()
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        return rows, _encode_cursor(rows[-1])
+
+    @classmethod
+    def backfill_listing(cls, batch: int = 500) -> int:
+        """Fill the listing columns of rows saved before they existed.
+
+        Writes through the table directly, so neither ``revision`` nor
+        ``updated_at`` changes. Returns the number of rows updated.
+        """
+        table, done = cls.__table__, 0
+        while True:
+            rows = db.session.execute(
+                db.select(table.c.id, table.c.data).where(table.c.template.is_(None)).limit(batch)
+            ).all()
+            for row_id, data in rows:
+                db.session.execute(
+                    table.update().where(table.c.id == row_id).values(
+                        data_hash=data_digest(data), updated_at=table.c.updated_at, **_listing_fields(data),
+                    )
+                )
+            db.session.commit()
+            done += len(rows)
+            if len(rows) < batch:
+                break
+        if done:
+            log.info("[resume_db] Backfilled listing columns for %d resumes", done)
+        return done
+
+
+def _listing_fields(data) -> dict:
+    data = data if isinstance(data, dict) else {}
+    contacts = data.get("contacts") or {}
+    return {
+        "display_name": (contacts.get("name") or "")[:200] or None,
+        "template":     str(data.get("template") or "classic")[:64],
+        "job_title":    (contacts.get("jobTitle") or "")[:200] or None,
+    }
+
+
+def _encode_cursor(row: "Resume") -> str:
+    stamp = row.updated_at.strftime("%Y%m%d%H%M%S%f") if row.updated_at else "0"
+    return f"{stamp}-{row.id}"
+
+
+def _decode_cursor(cursor: Optional[str]):
+    if not cursor:
+        return None
+    try:
+        stamp, last_id = cursor.rsplit("-", 1)
+        return datetime.strptime(stamp, "%Y%m%d%H%M%S%f"), int(last_id)
+    except ValueError:
+        return None
@@ -0,0 +1,99 @@
+"""SQLite production profile — tuned pragmas and separate read/write pools.
+
+With ``SQLITE_TUNED`` on and a file-backed ``sqlite:///`` URL, the default
+engine becomes the writer: a small pool whose connections open every
+transaction with ``BEGIN IMMEDIATE``, so concurrent writers queue on
+``busy_timeout`` instead of failing with "database is locked" when a read
+transaction tries to upgrade. A second engine, bound under :data:`READ_BIND`,
+serves plain reads from a larger pool of ``query_only`` connections; in WAL
+mode those never block on, or block, the writer.
+
+:class:`RoutingSession` picks the engine per statement. Flushes and Core
+INSERT/UPDATE/DELETE go to the writer, and so does everything after them
+until the transaction ends, so a request always reads its own writes.
+"""
+import logging
+from functools import partial
+
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+from sqlalchemy.sql.dml import UpdateBase
+
+log = logging.getLogger(__name__)
+
+READ_BIND = "read"
+
+
+class RoutingSession(Session):
+    """``db.session`` class: reads on the ``read`` bind when it exists, writes on the default engine."""
+
+    def __init__(self, db, **kwargs):
+        super().__init__(db, **kwargs)
+        self._on_writer = False
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self._on_writer:
+            reader = self._db.engines.get(READ_BIND)
+            if reader is not None:
+                if not (self._flushing or isinstance(clause, UpdateBase)):
+                    return reader
+                self._on_writer = True
+        return super().get_bind(mapper, clause=clause, bind=bind, **kwargs)
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _release_writer(session, transaction) -> None:
+    if transaction.parent is None:
+        session._on_writer = False
+
+
+def configure(app) -> bool:
+    """Add the read bind and pool sizes to the config; call before ``db.init_app``.
+
+    Returns False (and changes nothing) unless the profile applies.
+    """
+    uri = app.config.get("SQLALCHEMY_DATABASE_URI", "")
+    if not app.config.get("SQLITE_TUNED") or not uri.startswith("sqlite:///") or ":memory:" in uri:
+        return False
+    options = dict(app.config.get("SQLALCHEMY_ENGINE_OPTIONS") or {})
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+        **options,
+        "pool_size":    app.config.get("SQLITE_WRITE_POOL_SIZE", 1),
+        "max_overflow": 0,
+    }
+    binds = dict(app.config.get("SQLALCHEMY_BINDS") or {})
+    binds[READ_BIND] = {
+        **options,
+        "url":          uri,
+        "pool_size":    app.config.get("SQLITE_READ_POOL_SIZE", 8),
+        "max_overflow": 0,
+    }
+    app.config["SQLALCHEMY_BINDS"] = binds
+    return True
+
+
+def install(app, db) -> None:
+    """Register the connection hooks on both engines; call in an app context, before first use."""
+    pragmas = dict(app.config.get("SQLITE_PRAGMAS") or {})
+    writer, reader = db.engines[None], db.engines[READ_BIND]
+
+    event.listen(writer, "connect", partial(_on_connect, pragmas=pragmas, read_only=False))
+    event.listen(writer, "begin", _begin_immediate)
+    reader_pragmas = {k: v for k, v in pragmas.items() if k != "journal_mode"}  # set once, by the writer
+    event.listen(reader, "connect", partial(_on_connect, pragmas=reader_pragmas, read_only=True))
+    log.info("[db] SQLite profile: %s; read pool %d", pragmas, reader.pool.size())
+
+
+def _on_connect(dbapi_connection, connection_record, pragmas, read_only) -> None:
+    if not read_only:
+        dbapi_connection.isolation_level = None   # transactions are begun by _begin_immediate
+    cursor = dbapi_connection.cursor()
+    for name, value in pragmas.items():
+        cursor.execute(f"PRAGMA {name}={value}")
+    if read_only:
+        cursor.execute("PRAGMA query_only=ON")
+    cursor.close()
+
+
+def _begin_immediate(conn) -> None:
+    conn.exec_driver_sql("BEGIN IMMEDIATE")
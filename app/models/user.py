@@ -1,11 +1,14 @@
 """User model — supports email/password + Google/Facebook OAuth."""
 from datetime import datetime
+from typing import NamedTuple, Optional
 
 from flask_login import UserMixin
 from flask_sqlalchemy import SQLAlchemy
 from werkzeug.security import check_password_hash, generate_password_hash
 
-db = SQLAlchemy()
+from app.models.sqlite import RoutingSession
+
+db = SQLAlchemy(session_options={"class_": RoutingSession})
 
 
 class User(UserMixin, db.Model):
@@ -19,6 +22,7 @@ class User(UserMixin, db.Model):
     facebook_id   = db.Column(db.String(120), unique=True, nullable=True, index=True)
     avatar_url    = db.Column(db.String(512),  nullable=True)
     is_active     = db.Column(db.Boolean, default=True, nullable=False)
+    is_admin      = db.Column(db.Boolean, default=False, nullable=False, server_default=db.text("0"))  # flask set-admin
     created_at    = db.Column(db.DateTime, default=datetime.utcnow)
     last_login_at = db.Column(db.DateTime, nullable=True)
 
@@ -39,5 +43,33 @@ class User(UserMixin, db.Model):
     def display_name(self) -> str:
         return self.name or self.email.split("@")[0]
 
+    def snapshot(self) -> "UserSnapshot":
+        return UserSnapshot(self.id, self.email, self.name, self.avatar_url, self.is_active, bool(self.is_admin))
+
     def __repr__(self) -> str:  # pragma: no cover
         return f"<User id={self.id} email={self.email!r}>"
+
+
+class UserSnapshot(NamedTuple):
+    """Read-only copy of the user fields request handling needs; what ``current_user`` is.
+
+    Not bound to a session, so it can be cached across requests. Load the
+    ``User`` row to change anything.
+    """
+
+    id:         int
+    email:      str
+    name:       Optional[str]
+    avatar_url: Optional[str]
+    is_active:  bool
+    is_admin:   bool = False
+
+    is_authenticated = True
+    is_anonymous     = False
+
+    def get_id(self) -> str:
+        return str(self.id)
+
+    @property
+    def display_name(self) -> str:
+        return self.name or self.email.split("@")[0]
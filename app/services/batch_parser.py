@@ -0,0 +1,255 @@
+"""Batch parser — parse many resumes per request across a process pool.
+
+Files arrive either as several multipart parts or as one ZIP archive. They
+are validated against per-batch limits, checked against the parse cache, and
+the misses are fanned out to ``parse_resume`` in worker processes.
+Results come back in completion order, so the endpoint can stream each one
+as soon as it is ready.
+"""
+import atexit
+import logging
+import multiprocessing
+import os
+import shutil
+import threading
+import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Iterator, List, NamedTuple, Optional
+
+from app.services.parse_cache import parse_cache
+from app.services.resume_parser import MappedFile, ParseResult, parse_resume
+
+log = logging.getLogger(__name__)
+
+_ALLOWED_EXT = {"pdf", "docx", "doc"}
+
+
+class BatchRejected(ValueError):
+    """Raised when a batch as a whole breaks a limit or cannot be read."""
+
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+
+class BatchEntry(NamedTuple):
+    index: int
+    filename: str
+    path: Optional[str]        # spooled file on disk; None when rejected up front
+    size: int
+    error: Optional[str] = None
+
+
+class BatchParser:
+    """Process pool and limits for batch parsing; configured by :meth:`init_app`."""
+
+    def __init__(self):
+        self.workers        = 1
+        self.max_files      = 50
+        self.max_bytes      = 100 * 1024 * 1024
+        self.max_file_bytes = 10 * 1024 * 1024
+        self.timeout        = 300.0
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app) -> None:
+        self.workers        = int(app.config.get("PARSE_BATCH_WORKERS") or min(4, os.cpu_count() or 1))
+        self.max_files      = int(app.config.get("PARSE_BATCH_MAX_FILES", 50))
+        self.max_bytes      = int(app.config.get("PARSE_BATCH_MAX_BYTES", 100 * 1024 * 1024))
+        self.max_file_bytes = int(app.config.get("MAX_UPLOAD_BYTES", 10 * 1024 * 1024))
+        self.timeout        = float(app.config.get("PARSE_BATCH_TIMEOUT", 300))
+
+    # ── Intake ────────────────────────────────────────────────────────────────
+
+    def collect(self, files, workdir: str) -> List[BatchEntry]:
+        """Validate uploaded files (or one ZIP) and return one entry per resume.
+
+        ZIP members are extracted into ``workdir``, which the caller removes.
+
+        Raises:
+            BatchRejected: when the batch is empty, too large, or has too many files.
+        """
+        files = [f for f in files if f and f.filename]
+        if not files:
+            raise BatchRejected("No files uploaded")
+        if len(files) == 1 and _ext(files[0].filename) == "zip":
+            return self._collect_zip(files[0], workdir)
+
+        if len(files) > self.max_files:
+            raise BatchRejected(f"Too many files. Max {self.max_files} per batch.", 413)
+        entries = []
+        for i, f in enumerate(files):
+            path = _spooled_path(f, workdir, i)
+            size = os.path.getsize(path)
+            entries.append(BatchEntry(i, f.filename, path, size, self._entry_error(f.filename, size)))
+        if sum(e.size for e in entries) > self.max_bytes:
+            raise self._too_large()
+        return entries
+
+    def _too_large(self) -> BatchRejected:
+        return BatchRejected(f"Batch too large. Max {self.max_bytes // (1024 * 1024)} MB per batch.", 413)
+
+    def _collect_zip(self, archive, workdir: str) -> List[BatchEntry]:
+        try:
+            zf = zipfile.ZipFile(_spooled_path(archive, workdir, "archive"))
+        except zipfile.BadZipFile:
+            raise BatchRejected("Invalid ZIP archive")
+        with zf:
+            members = [
+                m for m in zf.infolist()
+                if not m.is_dir()
+                and not m.filename.startswith("__MACOSX/")
+                and not os.path.basename(m.filename).startswith(".")
+            ]
+            if len(members) > self.max_files:
+                raise BatchRejected(f"Too many files. Max {self.max_files} per batch.", 413)
+            if sum(m.file_size for m in members) > self.max_bytes:
+                raise self._too_large()
+
+            entries = []
+            extracted = 0
+            for i, m in enumerate(members):
+                name = os.path.basename(m.filename)
+                error = self._entry_error(name, m.file_size)
+                if error:
+                    entries.append(BatchEntry(i, name, None, m.file_size, error))
+                    continue
+                path = os.path.join(workdir, f"{i}.{_ext(name)}")
+                # Never trust the header sizes: stop one byte past the file limit
+                # or past what is left of the batch limit, whichever comes first.
+                limit = min(self.max_file_bytes, self.max_bytes - extracted) + 1
+                try:
+                    with zf.open(m) as src, open(path, "wb") as dst:
+                        copied = _copy_limited(src, dst, limit)
+                except (zipfile.BadZipFile, zlib.error, EOFError):
+                    entries.append(BatchEntry(i, name, None, 0, "Corrupt file in archive."))
+                    continue
+                extracted += copied
+                if extracted > self.max_bytes:
+                    raise self._too_large()
+                if copied > self.max_file_bytes:
+                    entries.append(BatchEntry(i, name, None, copied, "File too large."))
+                else:
+                    entries.append(BatchEntry(i, name, path, copied))
+            return entries
+
+    def _entry_error(self, filename: str, size: int) -> Optional[str]:
+        if _ext(filename) not in _ALLOWED_EXT:
+            return "Unsupported file type. Use PDF or DOCX."
+        if size > self.max_file_bytes:
+            return f"File too large. Max {self.max_file_bytes // (1024 * 1024)} MB."
+        return None
+
+    # ── Parsing ───────────────────────────────────────────────────────────────
+
+    def run(self, entries: List[BatchEntry]) -> Iterator[dict]:
+        """Yield one result dict per entry, in completion order.
+
+        Must be iterated inside an app context (for the parse cache).
+        """
+        futures = {}
+        for entry in entries:
+            if entry.error:
+                yield _result(entry, error=entry.error)
+                continue
+            with MappedFile(entry.path) as mapped:
+                key = parse_cache.digest(mapped, entry.filename)
+            cached = parse_cache.get(key)
+            if cached is not None:
+                yield _result(entry, data=cached)
+                continue
+            future = self._pool().submit(_parse_path, entry.path, entry.filename)
+            futures[future] = (entry, key)
+
+        pending = set(futures)
+        try:
+            for future in as_completed(futures, timeout=self.timeout):
+                pending.discard(future)
+                entry, key = futures[future]
+                try:
+                    data, complete = future.result()
+                except Exception as exc:
+                    log.warning("[batch_parser] %s failed: %s", entry.filename, exc)
+                    yield _result(entry, error=f"Parsing failed: {exc}")
+                    continue
+                if complete:
+                    parse_cache.put(key, data, entry.size)
+                yield _result(entry, data=data)
+        except FutureTimeoutError:
+            for future in pending:
+                future.cancel()
+                yield _result(futures[future][0], error="Parsing timed out.")
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _parse_path(path: str, filename: str) -> ParseResult:
+    """Worker entry point: parse one spooled file through a shared memory map."""
+    with MappedFile(path) as mapped:
+        return parse_resume(mapped, filename)
+
+
+def _result(entry: BatchEntry, data: dict = None, error: str = None) -> dict:
+    result = {"index": entry.index, "filename": entry.filename, "ok": error is None}
+    if error is None:
+        result["data"] = data
+    else:
+        result["error"] = error
+    return result
+
+
+def _ext(filename: str) -> str:
+    return filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+
+
+def _spooled_path(file, workdir: str, tag) -> str:
+    """Give ``workdir`` its own reference to an uploaded file and return its path.
+
+    The request's spooled temp files are deleted when the request closes, which
+    happens before a streamed response finishes, so the batch keeps a hard link
+    (or, across filesystems, a copy) of each one.
+    """
+    dst = os.path.join(workdir, f"upload-{tag}")
+    stream = file.stream
+    src = getattr(stream, "name", None)
+    if isinstance(src, str):
+        stream.flush()
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copyfile(src, dst)
+        return dst
+    stream.seek(0)
+    with open(dst, "wb") as out:
+        shutil.copyfileobj(stream, out, 1024 * 1024)
+    return dst
+
+
+def _copy_limited(src, dst, limit: int) -> int:
+    copied = 0
+    while copied < limit:
+        chunk = src.read(min(1024 * 1024, limit - copied))
+        if not chunk:
+            break
+        dst.write(chunk)
+        copied += len(chunk)
+    return copied
+
+
+batch_parser = BatchParser()
+atexit.register(batch_parser.shutdown)
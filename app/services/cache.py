@@ -0,0 +1,90 @@
+"""In-process cache primitives shared by the export, parse and preview caches."""
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class LRUCache:
+    """Thread-safe LRU cache bounded by entry count and/or total size.
+
+    ``sizeof`` measures each value (defaults to ``len``) so byte-oriented
+    caches can be capped by memory rather than by number of entries.
+    Hit, miss and eviction counters are exposed through :meth:`stats`.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        sizeof: Callable[[Any], int] = len,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes   = max_bytes
+        self._sizeof     = sizeof
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._bytes      = 0
+        self._lock       = threading.Lock()
+        self.hits        = 0
+        self.misses      = 0
+        self.evictions   = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        size = self._sizeof(value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            return  # larger than the whole cache — never worth storing
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._data[key] = (value, size)
+            self._bytes += size
+            self._evict()
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.pop(key, None)
+            if entry is None:
+                return default
+            self._bytes -= entry[1]
+            return entry[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries":   len(self._data),
+                "bytes":     self._bytes,
+                "hits":      self.hits,
+                "misses":    self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _evict(self) -> None:
+        # Caller holds the lock.
+        while self._data and (
+            (self.max_entries is not None and len(self._data) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            _, (_, size) = self._data.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
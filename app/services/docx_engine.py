@@ -0,0 +1,232 @@
+"""DOCX engine — resume documents from a pre-built package skeleton.
+
+Building through python-docx's object model and saving recompresses the
+whole default template on every export; its ``styles.xml`` alone is over
+400 KB. Instead, the template package is read once per process into a
+skeleton zip that holds every part except ``word/document.xml``, compressed
+once, with fixed timestamps. An export copies the skeleton bytes, renders
+``document.xml`` in one pass from WordprocessingML fragments, and appends it.
+The same input therefore always produces the same bytes.
+
+Each resume template has a :class:`DocxTheme` (font, accent colour) taken from
+its HTML/CSS, applied to the name, headings and section rules.
+"""
+import importlib.util
+import os
+import re
+import threading
+import zipfile
+from io import BytesIO
+from typing import List, NamedTuple, Optional
+from xml.sax.saxutils import escape
+
+DOCUMENT_PART = "word/document.xml"
+_ZIP_DATE     = (1980, 1, 1, 0, 0, 0)
+
+# A4 in twentieths of a point; margins as in python-docx's default template.
+_SECT_PR = (
+    '<w:sectPr><w:pgSz w:w="11906" w:h="16838"/>'
+    '<w:pgMar w:top="1440" w:right="1800" w:bottom="1440" w:left="1800" w:header="720" w:footer="720" w:gutter="0"/>'
+    '<w:cols w:space="720"/><w:docGrid w:linePitch="360"/></w:sectPr>'
+)
+
+# Characters XML 1.0 cannot carry (python-docx rejects them outright).
+_INVALID_XML = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+
+
+class DocxTheme(NamedTuple):
+    font:   str
+    accent: str    # hex RGB without '#'
+
+
+DEFAULT_THEME = DocxTheme("Arial", "1A1A1A")
+
+# Keyed by HTML template file (see TEMPLATE_TO_HTML); fonts are the closest
+# commonly installed face, accents the template's dominant CSS colour.
+DOCX_THEMES = {
+    "bold":                DocxTheme("Arial", "111827"),
+    "classic":             DEFAULT_THEME,
+    "clean":               DocxTheme("Arial", "475569"),
+    "corporate":           DocxTheme("Arial", "374151"),
+    "elegant":             DocxTheme("Georgia", "92400E"),
+    "executive":           DocxTheme("Arial", "1A2744"),
+    "infographic":         DocxTheme("Arial", "0EA5E9"),
+    "minimal":             DocxTheme("Georgia", "2C2C2C"),
+    "modern":              DocxTheme("Calibri", "1E293B"),
+    "photo_classic":       DocxTheme("Arial", "1E3A5F"),
+    "photo_executive":     DocxTheme("Arial", "1E3A8A"),
+    "photo_minimal":       DocxTheme("Arial", "334155"),
+    "photo_modern":        DocxTheme("Arial", "0EA5E9"),
+    "simple":              DocxTheme("Arial", "374151"),
+    "timeline":            DocxTheme("Arial", "7C3AED"),
+    "two_col_blue":        DocxTheme("Arial", "3B82F6"),
+    "two_col_green":       DocxTheme("Arial", "10B981"),
+    "two_col_light":       DocxTheme("Arial", "1E293B"),
+    "two_col_photo_blue":  DocxTheme("Arial", "3B82F6"),
+    "two_col_photo_dark":  DocxTheme("Arial", "1E293B"),
+    "two_col_photo_green": DocxTheme("Arial", "16A34A"),
+    "two_col_photo_teal":  DocxTheme("Arial", "0891B2"),
+    "two_col_red":         DocxTheme("Arial", "DC2626"),
+    "two_col_warm":        DocxTheme("Arial", "F59E0B"),
+}
+
+
+class _Skeleton(NamedTuple):
+    zip_bytes:    bytes   # every template part except document.xml
+    document_head: str    # document.xml up to and including <w:body>
+
+
+_skeleton: Optional[_Skeleton] = None
+_skeleton_lock = threading.Lock()
+
+
+def _template_path() -> str:
+    # Located without importing python-docx, which exports no longer need.
+    spec = importlib.util.find_spec("docx")
+    return os.path.join(spec.submodule_search_locations[0], "templates", "default.docx")
+
+
+def skeleton() -> _Skeleton:
+    """Load python-docx's default template once per process."""
+    global _skeleton
+    with _skeleton_lock:
+        if _skeleton is None:
+            buffer = BytesIO()
+            with zipfile.ZipFile(_template_path()) as src, \
+                    zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as dst:
+                for name in src.namelist():
+                    if name == DOCUMENT_PART:
+                        document = src.read(name).decode("utf-8")
+                        continue
+                    dst.writestr(_zip_info(name), src.read(name))
+            head = document[:document.index("<w:body>") + len("<w:body>")]
+            _skeleton = _Skeleton(buffer.getvalue(), head)
+        return _skeleton
+
+
+def _zip_info(name: str) -> zipfile.ZipInfo:
+    info = zipfile.ZipInfo(name, date_time=_ZIP_DATE)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.external_attr = 0o644 << 16
+    return info
+
+
+# ── WordprocessingML fragments ────────────────────────────────────────────────
+
+def _text(value) -> str:
+    """Run content for ``value``: escaped text, with newlines and tabs as Word breaks."""
+    value = _INVALID_XML.sub("", str(value or ""))
+    parts = []
+    for i, line in enumerate(value.split("\n")):
+        if i:
+            parts.append("<w:br/>")
+        for j, chunk in enumerate(line.split("\t")):
+            if j:
+                parts.append("<w:tab/>")
+            if chunk:
+                parts.append(f'<w:t xml:space="preserve">{escape(chunk)}</w:t>')
+    return "".join(parts)
+
+
+class _Fragments:
+    """Pre-rendered paragraph and run properties for one theme."""
+
+    def __init__(self, theme: DocxTheme):
+        fonts = f'<w:rFonts w:ascii="{theme.font}" w:hAnsi="{theme.font}" w:cs="{theme.font}"/>'
+        self.run        = f"<w:rPr>{fonts}</w:rPr>"
+        self.bold_run   = f"<w:rPr>{fonts}<w:b/></w:rPr>"
+        self.name_run   = f'<w:rPr>{fonts}<w:b/><w:color w:val="{theme.accent}"/><w:sz w:val="36"/></w:rPr>'
+        self.title_run  = f'<w:rPr>{fonts}<w:color w:val="{theme.accent}"/></w:rPr>'
+        self.head_run   = f'<w:rPr>{fonts}<w:color w:val="{theme.accent}"/></w:rPr>'
+        self.center     = '<w:pPr><w:jc w:val="center"/></w:pPr>'
+        self.heading    = (
+            '<w:pPr><w:pStyle w:val="Heading2"/><w:pBdr>'
+            f'<w:bottom w:val="single" w:sz="6" w:space="1" w:color="{theme.accent}"/></w:pBdr></w:pPr>'
+        )
+        self.bullet     = '<w:pPr><w:pStyle w:val="ListBullet"/></w:pPr>'
+
+    @staticmethod
+    def paragraph(text, ppr: str = "", rpr: str = "") -> str:
+        content = _text(text)
+        if not content:
+            return f"<w:p>{ppr}</w:p>"
+        return f"<w:p>{ppr}<w:r>{rpr}{content}</w:r></w:p>"
+
+
+_fragments = {}
+
+
+def _fragments_for(theme: DocxTheme) -> _Fragments:
+    fragments = _fragments.get(theme)
+    if fragments is None:
+        fragments = _fragments[theme] = _Fragments(theme)
+    return fragments
+
+
+def document_body(data: dict, theme: DocxTheme) -> str:
+    """The ``<w:body>`` content for one resume, built in a single pass."""
+    f = _fragments_for(theme)
+    p = f.paragraph
+    contacts = data.get("contacts", {})
+    out: List[str] = []
+
+    # Header — name and job title
+    out.append(p(contacts.get("name", ""), f.center, f.name_run))
+    if contacts.get("jobTitle"):
+        out.append(p(contacts["jobTitle"], f.center, f.title_run))
+    out.append("<w:p/>")
+
+    # Contact information
+    location = contacts.get("location") or (
+        ", ".join(filter(None, [contacts.get("city"), contacts.get("country")]))
+        if (contacts.get("city") or contacts.get("country")) else None
+    )
+    contact_parts = [
+        contacts.get("email"),
+        contacts.get("phone") and f"{contacts.get('phoneCode', '')} {contacts.get('phone', '')}".strip(),
+        location,
+    ]
+    contact_parts = [part for part in contact_parts if part]
+    if contact_parts:
+        out.append(p(" | ".join(contact_parts), f.center, f.run))
+
+    def heading(title: str) -> None:
+        out.append("<w:p/>")
+        out.append(p(title, f.heading, f.head_run))
+
+    # Summary
+    if data.get("summary"):
+        heading("SUMMARY")
+        out.append(p(data["summary"], "", f.run))
+
+    # Experience
+    heading("EXPERIENCE")
+    for entry in data.get("experience", []):
+        out.append(p(f"{entry.get('role', '')} — {entry.get('company', '')}", "", f.bold_run))
+        out.append(p(entry.get("dates", ""), f.bullet, f.run))
+        out.append(p(entry.get("description", ""), "", f.run))
+
+    # Education
+    heading("EDUCATION")
+    for entry in data.get("education", []):
+        out.append(p(entry.get("school", ""), "", f.bold_run))
+        out.append(p(f"{entry.get('degree', '')} · {entry.get('dates', '')}", "", f.run))
+
+    # Skills
+    if data.get("skills"):
+        heading("SKILLS")
+        out.append(p(", ".join(data["skills"]), "", f.run))
+
+    return "".join(out)
+
+
+def render_docx(data: dict, template_file: str = "classic") -> bytes:
+    """DOCX bytes for ``data`` styled after the HTML template ``template_file``."""
+    base = skeleton()
+    theme = DOCX_THEMES.get(template_file, DEFAULT_THEME)
+    document = f"{base.document_head}{document_body(data, theme)}{_SECT_PR}</w:body></w:document>"
+
+    buffer = BytesIO(base.zip_bytes)
+    with zipfile.ZipFile(buffer, "a") as package:
+        package.writestr(_zip_info(DOCUMENT_PART), document.encode("utf-8"))
+    return buffer.getvalue()
@@ -0,0 +1,108 @@
+"""Downloads — file responses for exports, optionally handed off to the front-end server.
+
+``EXPORT_SENDFILE`` picks how a file on disk reaches the client:
+
+  - ``""`` (default) — the worker streams it. Werkzeug passes the open file to
+    the WSGI server's ``wsgi.file_wrapper``, which gunicorn and uWSGI send
+    with ``sendfile()``, so the bytes never pass through Python. GET requests
+    get Content-Length, ETag, conditional (304) and Range (206) handling.
+  - ``"x-accel-redirect"`` — nginx. The response carries only headers, with
+    ``X-Accel-Redirect`` set to ``EXPORT_ACCEL_PREFIX`` plus the file's path
+    under ``EXPORT_ACCEL_ROOT``; nginx serves the file, including Range
+    requests, from an ``internal`` location aliased to that directory.
+  - ``"x-sendfile"`` — Apache (mod_xsendfile) or lighttpd: ``X-Sendfile``
+    with the file's absolute path.
+
+Files outside ``EXPORT_ACCEL_ROOT`` are always streamed by the worker.
+"""
+import logging
+import threading
+from pathlib import Path
+from typing import Optional, Tuple
+from urllib.parse import quote
+
+from flask import current_app, request
+from werkzeug.utils import send_file
+
+log = logging.getLogger(__name__)
+
+MODES = ("", "x-accel-redirect", "x-sendfile")
+
+
+class Downloads:
+    """Sends files to the client or the front-end server; configured by :meth:`init_app`."""
+
+    def __init__(self):
+        self.mode = ""
+        self.accel_root: Optional[Path] = None
+        self.accel_prefix = "/"
+        self.streamed  = 0
+        self.offloaded = 0
+        self._lock = threading.Lock()
+
+    def init_app(self, app) -> None:
+        mode = (app.config.get("EXPORT_SENDFILE") or "").strip().lower()
+        if mode not in MODES:
+            log.warning("[downloads] Unknown EXPORT_SENDFILE %r; files are streamed by the worker", mode)
+            mode = ""
+        self.mode = mode
+        self.accel_root = Path(app.config["EXPORT_ACCEL_ROOT"]).resolve()
+        self.accel_prefix = "/" + app.config.get("EXPORT_ACCEL_PREFIX", "").strip("/") + "/"
+
+    def send(self, path, *, mimetype: str, download_name: str, etag: Optional[str] = None,
+             max_age: Optional[int] = None):
+        """An attachment response for the file at ``path``.
+
+        ``etag`` defaults to one derived from the file's mtime and size; pass
+        the content address for content-addressed files. With ``max_age``
+        the response may be kept in the browser's cache (never a shared one).
+        """
+        path = Path(path).resolve()
+        handoff = self._handoff_header(path)
+        response = send_file(
+            str(path), request.environ,
+            mimetype=mimetype,
+            as_attachment=True,
+            download_name=download_name,
+            conditional=handoff is None,
+            etag=etag or True,
+            max_age=max_age,
+            use_x_sendfile=handoff is not None,
+            response_class=current_app.response_class,
+        )
+        if max_age:
+            response.cache_control.public = None
+            response.cache_control.private = True
+
+        if handoff is None:
+            with self._lock:
+                self.streamed += 1
+            return response
+
+        del response.headers["X-Sendfile"]
+        # The front-end server sends the body, its length and any requested range.
+        response.content_length = None
+        response = response.make_conditional(request.environ)
+        if response.status_code != 304:
+            response.headers[handoff[0]] = handoff[1]
+        with self._lock:
+            self.offloaded += 1
+        return response
+
+    def _handoff_header(self, path: Path) -> Optional[Tuple[str, str]]:
+        if self.mode == "x-sendfile":
+            return "X-Sendfile", str(path)
+        if self.mode == "x-accel-redirect":
+            try:
+                relative = path.relative_to(self.accel_root)
+            except ValueError:
+                return None
+            return "X-Accel-Redirect", self.accel_prefix + quote(relative.as_posix())
+        return None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"mode": self.mode or "stream", "streamed": self.streamed, "offloaded": self.offloaded}
+
+
+downloads = Downloads()
@@ -0,0 +1,169 @@
+"""Export bundle — many resumes rendered in parallel and streamed as one ZIP.
+
+Entries are rendered through ``build_pdf``/``build_docx`` on a shared pool of
+``EXPORT_BUNDLE_WORKERS`` threads. Each thread runs in its own app context,
+and PDF conversion still goes through the render pool. Each entry is written
+to the archive as soon as it finishes. The ZIP goes to an unseekable sink
+(sizes and CRCs in data descriptors, central directory at the end) that is
+drained after every entry. At most ``2 × workers`` rendered entries are held
+at once, never the archive. Entries that fail are listed in ``ERRORS.txt``
+at the end of the archive: by then the 200 has already been sent.
+"""
+import atexit
+import logging
+import threading
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Iterator, List, NamedTuple, Optional
+
+from werkzeug.utils import secure_filename
+
+log = logging.getLogger(__name__)
+
+FORMATS = ("pdf", "docx")
+
+
+class BundleRejected(ValueError):
+    """Raised when a bundle request asks for too much or for unknown formats."""
+
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+
+class BundleEntry(NamedTuple):
+    name: str      # path inside the archive
+    fmt:  str
+    data: dict
+
+
+class ExportBundler:
+    """Thread pool and limits for bundle exports; configured by :meth:`init_app`."""
+
+    def __init__(self):
+        self.app = None
+        self.workers      = 2
+        self.max_resumes  = 100
+        self.busy_retries = 3
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app) -> None:
+        self.app          = app
+        self.workers      = max(1, int(app.config.get("EXPORT_BUNDLE_WORKERS") or 2))
+        self.max_resumes  = int(app.config.get("EXPORT_BUNDLE_MAX_RESUMES", 100))
+        self.busy_retries = int(app.config.get("EXPORT_BUNDLE_BUSY_RETRIES", 3))
+
+    def entries(self, resumes, formats: List[str]) -> List[BundleEntry]:
+        """One entry per resume and format, named ``<resume name>-<id>.<format>``.
+
+        Raises:
+            BundleRejected: for unknown formats or more than ``max_resumes`` resumes.
+        """
+        unknown = [f for f in formats if not isinstance(f, str) or f not in FORMATS]
+        if not formats or unknown:
+            raise BundleRejected(f"formats must be a non-empty subset of {', '.join(FORMATS)}")
+        formats = list(dict.fromkeys(formats))
+        if len(resumes) > self.max_resumes:
+            raise BundleRejected(f"Too many resumes. Max {self.max_resumes} per bundle.", 413)
+        return [
+            BundleEntry(f"{secure_filename(resume.name) or 'resume'}-{resume.id}.{fmt}", fmt, resume.data)
+            for resume in resumes
+            for fmt in formats
+        ]
+
+    def stream(self, entries: List[BundleEntry]) -> Iterator[bytes]:
+        """Yield the ZIP archive of ``entries`` in chunks, one or more per finished entry."""
+        sink = _Sink()
+        queued = iter(entries)
+        in_flight = {}
+        errors = []
+
+        def submit_next() -> None:
+            entry = next(queued, None)
+            if entry is not None:
+                in_flight[self._pool().submit(self._render, entry)] = entry
+
+        for _ in range(2 * self.workers):
+            submit_next()
+        try:
+            with zipfile.ZipFile(sink, "w", zipfile.ZIP_STORED) as archive:
+                while in_flight:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        entry = in_flight.pop(future)
+                        submit_next()
+                        try:
+                            payload = future.result()
+                        except Exception as exc:
+                            log.warning("[export_bundle] %s failed: %s", entry.name, exc)
+                            errors.append(f"{entry.name}: {exc}")
+                            continue
+                        # PDF and DOCX are already compressed; storing them keeps this cheap.
+                        archive.writestr(_zip_info(entry.name), payload)
+                        yield sink.take()
+                if errors:
+                    archive.writestr(_zip_info("ERRORS.txt"), "\n".join(errors) + "\n")
+            yield sink.take()
+        finally:
+            # Client went away (or an error escaped): drop what has not started.
+            for future in in_flight:
+                future.cancel()
+
+    def _render(self, entry: BundleEntry) -> bytes:
+        from app.services.export_service import build_docx, build_pdf
+        from app.services.render_pool import RenderPoolBusy
+
+        with self.app.app_context():
+            for attempt in range(self.busy_retries + 1):
+                try:
+                    if entry.fmt == "pdf":
+                        return build_pdf(entry.data).getvalue()
+                    return build_docx(entry.data).getvalue()
+                except RenderPoolBusy as exc:
+                    if attempt == self.busy_retries:
+                        raise
+                    time.sleep(exc.retry_after)
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="export-bundle")
+            return self._executor
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+class _Sink:
+    """Write-only, unseekable buffer that ``ZipFile`` streams into."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def take(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _zip_info(name: str) -> zipfile.ZipInfo:
+    info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+    info.compress_type = zipfile.ZIP_STORED
+    info.external_attr = 0o644 << 16
+    return info
+
+
+export_bundler = ExportBundler()
+atexit.register(export_bundler.shutdown)
@@ -0,0 +1,242 @@
+"""Export cache — content-addressed store for rendered PDF and DOCX exports.
+
+Two tiers:
+  1. Memory — a byte-bounded LRU per worker process, for repeat downloads.
+  2. Disk   — files under ``EXPORT_CACHE_DIR`` (data/export_cache by default),
+              shared by every worker and kept across restarts. Least recently
+              used files are pruned once the directory exceeds its byte cap.
+
+Keys are a SHA-256 over the canonical resume JSON, the source of the resolved
+Jinja template (plus the shared macros it imports), the engine name and
+version, and the source of the app's own builder for the format (the DOCX
+engine module), so any change that could alter the output produces a new key.
+Disk-tier files are served directly to clients (see :meth:`ExportCache.file`
+and :mod:`app.services.downloads`), so a file is never rewritten in place.
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from flask import current_app
+
+from app.services.cache import LRUCache
+
+log = logging.getLogger(__name__)
+
+# Bump to invalidate every cached export after a change to how exports are built.
+CACHE_FORMAT_VERSION = "1"
+
+_MACROS_TEMPLATE = "resume/_macros.html"
+
+# Modules whose code shapes an export beyond the templates (themes, document layout).
+_BUILDER_MODULES = {"docx": "app.services.docx_engine"}
+
+
+class ExportCache:
+    """Two-tier (memory + disk) export cache; configured by :meth:`init_app`."""
+
+    def __init__(self):
+        self.enabled        = False
+        self.memory         = LRUCache(max_bytes=0)
+        self.disk_dir: Optional[Path] = None
+        self.disk_max_bytes = 0
+        self._disk_bytes    = 0
+        self._lock          = threading.Lock()
+        self.disk_hits      = 0
+        self.disk_evictions = 0
+
+    def init_app(self, app) -> None:
+        self.enabled = bool(app.config.get("EXPORT_CACHE_ENABLED", True))
+        self.memory  = LRUCache(max_bytes=app.config.get("EXPORT_CACHE_MEMORY_BYTES", 0))
+        self.disk_max_bytes = app.config.get("EXPORT_CACHE_DISK_BYTES", 0)
+        if self.enabled and self.disk_max_bytes:
+            self.disk_dir = Path(app.config["EXPORT_CACHE_DIR"])
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            self._disk_bytes = sum(size for _, size, _ in self._scan_disk())
+        else:
+            self.disk_dir = None
+
+    # ── Keys ──────────────────────────────────────────────────────────────────
+
+    def key_for(self, fmt: str, data: dict, template_name: str, engine: str) -> str:
+        """Return the content address for an export of ``data``."""
+        h = hashlib.sha256()
+        for part in (
+            CACHE_FORMAT_VERSION,
+            fmt,
+            engine,
+            _engine_version(engine),
+            _builder_source(fmt),
+            _template_source(f"resume/{template_name}.html"),
+            _template_source(_MACROS_TEMPLATE),
+        ):
+            h.update(part.encode("utf-8"))
+            h.update(b"\0")
+        h.update(json.dumps(
+            data, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str,
+        ).encode("utf-8"))
+        return h.hexdigest()
+
+    # ── Lookup / store ────────────────────────────────────────────────────────
+
+    def get(self, key: str) -> Optional[bytes]:
+        if not self.enabled:
+            return None
+        payload = self.memory.get(key)
+        if payload is not None:
+            return payload
+        path = self._disk_path(key)
+        if path is None:
+            return None
+        try:
+            payload = path.read_bytes()
+            os.utime(path)  # mark as recently used for LRU pruning
+        except OSError:
+            return None
+        with self._lock:
+            self.disk_hits += 1
+        self.memory.put(key, payload)
+        return payload
+
+    def file(self, key: str) -> Optional[Path]:
+        """The disk-tier file for ``key`` if there is one, marked as recently used."""
+        path = self._disk_path(key) if self.enabled else None
+        if path is None:
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        with self._lock:
+            self.disk_hits += 1
+        return path
+
+    def put(self, key: str, payload: bytes, memory: bool = True) -> Optional[Path]:
+        """Store ``payload``; return its disk-tier file, or None without one.
+
+        ``memory=False`` skips the memory tier, for exports that are cheaper to
+        rebuild than to keep in every worker.
+        """
+        if not self.enabled:
+            return None
+        if memory:
+            self.memory.put(key, payload)
+        path = self._disk_path(key)
+        if path is None or path.exists():
+            return path
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp, path)
+        except OSError as e:
+            log.warning("[export_cache] Could not write %s: %s", path, e)
+            return None
+        with self._lock:
+            self._disk_bytes += len(payload)
+            over = self._disk_bytes > self.disk_max_bytes
+        if over:
+            self._prune_disk()
+        return path if path.exists() else None
+
+    def clear(self) -> None:
+        self.memory.clear()
+        for path, _, _ in self._scan_disk():
+            path.unlink(missing_ok=True)
+        with self._lock:
+            self._disk_bytes = 0
+
+    def stats(self) -> dict:
+        mem = self.memory.stats()
+        with self._lock:
+            return {
+                "enabled":          self.enabled,
+                "memory_entries":   mem["entries"],
+                "memory_bytes":     mem["bytes"],
+                "memory_hits":      mem["hits"],
+                "memory_evictions": mem["evictions"],
+                "disk_bytes":       self._disk_bytes,
+                "disk_hits":        self.disk_hits,
+                "disk_evictions":   self.disk_evictions,
+                "hits":             mem["hits"] + self.disk_hits,
+                "misses":           mem["misses"] - self.disk_hits,
+            }
+
+    # ── Disk tier ─────────────────────────────────────────────────────────────
+
+    def _disk_path(self, key: str) -> Optional[Path]:
+        if self.disk_dir is None:
+            return None
+        return self.disk_dir / key[:2] / key
+
+    def _scan_disk(self):
+        if self.disk_dir is None or not self.disk_dir.exists():
+            return []
+        entries = []
+        for path in self.disk_dir.glob("*/*"):
+            if path.name.startswith(".tmp-"):
+                continue
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((path, st.st_size, st.st_mtime))
+        return entries
+
+    def _prune_disk(self) -> None:
+        """Delete least recently used files until the tier is under 90% of its cap."""
+        entries = sorted(self._scan_disk(), key=lambda e: e[2])
+        total   = sum(size for _, size, _ in entries)
+        target  = int(self.disk_max_bytes * 0.9)
+        evicted = 0
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total   -= size
+            evicted += 1
+        with self._lock:
+            self._disk_bytes     = total
+            self.disk_evictions += evicted
+        if evicted:
+            log.info("[export_cache] Pruned %d files from disk tier", evicted)
+
+
+@lru_cache(maxsize=None)
+def _engine_version(engine: str) -> str:
+    try:
+        from importlib.metadata import version
+        return version(engine)
+    except Exception:
+        return "unknown"
+
+
+@lru_cache(maxsize=None)
+def _builder_source(fmt: str) -> str:
+    module = _BUILDER_MODULES.get(fmt)
+    if module is None:
+        return ""
+    try:
+        import importlib.util
+        return Path(importlib.util.find_spec(module).origin).read_text(encoding="utf-8")
+    except Exception:
+        return "unknown"
+
+
+def _template_source(name: str) -> str:
+    env = current_app.jinja_env
+    try:
+        source, _, _ = env.loader.get_source(env, name)
+    except Exception:
+        return ""
+    return source
+
+
+export_cache = ExportCache()
@@ -0,0 +1,161 @@
+"""Export job queue — asynchronous exports drained by background workers.
+
+Jobs are rows in the ``export_jobs`` table, so they survive restarts and are
+shared by every app process using the same database. Each process runs
+``EXPORT_JOB_WORKERS`` daemon threads. A thread claims a queued job with a
+conditional UPDATE, so two processes never run the same job. It renders
+through ``build_pdf``/``build_docx`` and writes the file under
+``EXPORT_JOB_DIR``. Finished jobs and their files are deleted once
+``EXPORT_JOB_TTL`` has passed. Jobs left ``running`` by a crashed process
+are re-queued once they look stale.
+"""
+import logging
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+from app.models.export_job import ExportJob
+from app.models.user import db
+
+log = logging.getLogger(__name__)
+
+_MAX_ATTEMPTS = 3
+
+
+class ExportJobQueue:
+    """SQLite-backed export queue; configured by :meth:`init_app`."""
+
+    def __init__(self):
+        self.app = None
+        self.result_dir: Optional[Path] = None
+        self.ttl           = timedelta(hours=1)
+        self.stale_after   = timedelta(minutes=5)
+        self.poll_interval = 1.0
+        self._wakeup  = threading.Event()
+        self._threads = []
+
+    def init_app(self, app) -> None:
+        self.app           = app
+        self.result_dir    = Path(app.config["EXPORT_JOB_DIR"])
+        self.ttl           = timedelta(seconds=app.config.get("EXPORT_JOB_TTL", 3600))
+        self.stale_after   = timedelta(seconds=2 * app.config.get("PDF_RENDER_TIMEOUT", 60) + 30)
+        self.poll_interval = float(app.config.get("EXPORT_JOB_POLL_SECONDS", 1.0))
+        self.result_dir.mkdir(parents=True, exist_ok=True)
+
+        workers = int(app.config.get("EXPORT_JOB_WORKERS", 0))
+        # Render-pool processes re-import the main module; they must not drain the queue.
+        if multiprocessing.parent_process() is not None:
+            workers = 0
+        for i in range(workers):
+            t = threading.Thread(target=self._run, name=f"export-job-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+
+    # ── Producer side ─────────────────────────────────────────────────────────
+
+    def submit(self, fmt: str, data: dict, filename: str, user_id: Optional[int] = None) -> ExportJob:
+        job = ExportJob(format=fmt, payload=data, filename=filename, user_id=user_id)
+        db.session.add(job)
+        db.session.commit()
+        self._wakeup.set()
+        return job
+
+    # ── Worker side ───────────────────────────────────────────────────────────
+
+    def _run(self) -> None:
+        while True:
+            try:
+                with self.app.app_context():
+                    self._sweep()
+                    while self._drain_one():
+                        pass
+            except Exception:
+                log.exception("[export_jobs] Worker loop error")
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+
+    def _drain_one(self) -> bool:
+        """Claim and run the oldest queued job. Returns False when the queue is empty."""
+        job = (
+            ExportJob.query.filter_by(status=ExportJob.QUEUED)
+            .order_by(ExportJob.created_at)
+            .first()
+        )
+        if job is None:
+            return False
+        claimed = (
+            ExportJob.query.filter_by(id=job.id, status=ExportJob.QUEUED)
+            .update({
+                "status":     ExportJob.RUNNING,
+                "started_at": datetime.utcnow(),
+                "attempts":   ExportJob.attempts + 1,
+            })
+        )
+        db.session.commit()
+        if claimed:
+            db.session.refresh(job)
+            self._execute(job)
+        return True
+
+    def _execute(self, job: ExportJob) -> None:
+        from app.services.export_service import build_docx, build_pdf
+        from app.services.render_pool import RenderPoolBusy
+
+        try:
+            buffer = build_pdf(job.payload) if job.format == "pdf" else build_docx(job.payload)
+            job.result_path = str(self._write_result(job.id, job.format, buffer.getvalue()))
+            job.status = ExportJob.DONE
+        except RenderPoolBusy as exc:
+            # Back off and let the job be picked up again once the pool has room.
+            # A busy pool is not a failed attempt. Sleep rather than wait on
+            # _wakeup: it stays set after submit() until the drain loop ends.
+            job.status   = ExportJob.QUEUED
+            job.attempts = max(0, job.attempts - 1)
+            db.session.commit()
+            time.sleep(exc.retry_after)
+            return
+        except Exception as exc:
+            log.exception("[export_jobs] Job %s failed", job.id)
+            job.status = ExportJob.FAILED
+            job.error  = str(exc)
+        job.finished_at = datetime.utcnow()
+        job.expires_at  = job.finished_at + self.ttl
+        db.session.commit()
+
+    def _write_result(self, job_id: str, fmt: str, payload: bytes) -> Path:
+        path = self.result_dir / f"{job_id}.{fmt}"
+        fd, tmp = tempfile.mkstemp(dir=self.result_dir, prefix=".tmp-")
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp, path)
+        return path
+
+    def _sweep(self) -> None:
+        """Delete expired jobs (and files) and re-queue jobs orphaned by a crashed worker."""
+        now = datetime.utcnow()
+        for job in ExportJob.query.filter(ExportJob.expires_at < now).all():
+            if job.result_path:
+                Path(job.result_path).unlink(missing_ok=True)
+            db.session.delete(job)
+
+        stale = ExportJob.query.filter(
+            ExportJob.status == ExportJob.RUNNING,
+            ExportJob.started_at < now - self.stale_after,
+        )
+        for job in stale.all():
+            if job.attempts >= _MAX_ATTEMPTS:
+                job.status      = ExportJob.FAILED
+                job.error       = "Export did not complete after several attempts."
+                job.finished_at = now
+                job.expires_at  = now + self.ttl
+            else:
+                job.status = ExportJob.QUEUED
+        db.session.commit()
+
+
+export_jobs = ExportJobQueue()
@@ -1,43 +1,108 @@
-"""Export service — PDF and DOCX generation from resume data."""
+"""Export service — PDF and DOCX generation from resume data.
+
+The PDF engines (xhtml2pdf pulls in reportlab and pyHanko) and python-docx
+take about a second to import, so nothing heavy is imported with this
+module: :func:`pdf_engine` detects the engine on first use, and
+:func:`warm_up` does the imports ahead of time in a background thread when
+``EXPORT_WARMUP`` is on.
+"""
 import hashlib
+import logging
 import sys
+import threading
+import time
 from io import BytesIO
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
 
-from docx import Document
-from docx.shared import Pt, Inches
-from docx.enum.text import WD_ALIGN_PARAGRAPH
 from flask import render_template
 
-# ── Python 3.8 / macOS OpenSSL compatibility patch ───────────────────────────
-# reportlab 4.x calls hashlib.md5(usedforsecurity=False) which is only valid
-# on Python 3.9+ (or standard CPython hashlib). On Python 3.8 with the macOS
-# system OpenSSL, the keyword is rejected. We patch it away here before any
-# reportlab import so the flag is silently ignored.
-if sys.version_info < (3, 9):
-    _orig_md5 = hashlib.md5
+from app.services.export_cache import export_cache
+from app.services.metrics import metrics
+from app.services.render_pool import render_pool
 
-    def _patched_md5(*args, **kwargs):
-        kwargs.pop("usedforsecurity", None)
-        return _orig_md5(*args, **kwargs)
+log = logging.getLogger(__name__)
 
-    hashlib.md5 = _patched_md5  # type: ignore[assignment]
+# Force an engine ("xhtml2pdf" or "weasyprint"); None picks the first available.
+PDF_ENGINE: Optional[str] = None
 
-PDF_ENGINE = None
-_WeasyHTML = None
+# Engine name in DOCX export cache keys; the key also covers python-docx's version,
+# whose default template the DOCX skeleton is built from.
+DOCX_ENGINE = "python-docx"
 
-try:
-    from xhtml2pdf import pisa
-    PDF_ENGINE = "xhtml2pdf"
-except ImportError:
-    pass
+_engines: Optional[Dict[str, object]] = None   # engine name -> converter module/class
+_engines_lock = threading.Lock()
 
-try:
-    from weasyprint import HTML as _WeasyHTML  # noqa: F401
-    if PDF_ENGINE is None:
-        PDF_ENGINE = "weasyprint"
-except Exception:
-    # weasyprint may be installed but missing system libraries (pango, cairo)
-    pass
+
+def _load_engines() -> Dict[str, object]:
+    """Import the installed PDF engines once; return them in preference order."""
+    global _engines
+    with _engines_lock:
+        if _engines is None:
+            with metrics.stage("pdf_engine_import"):
+                _engines = _import_engines()
+        return _engines
+
+
+def _import_engines() -> Dict[str, object]:
+    # ── Python 3.8 / macOS OpenSSL compatibility patch ───────────────────────
+    # reportlab 4.x calls hashlib.md5(usedforsecurity=False) which is only
+    # valid on Python 3.9+ (or standard CPython hashlib). On Python 3.8 with
+    # the macOS system OpenSSL, the keyword is rejected. We patch it away
+    # here before any reportlab import so the flag is silently ignored.
+    if sys.version_info < (3, 9):
+        _orig_md5 = hashlib.md5
+
+        def _patched_md5(*args, **kwargs):
+            kwargs.pop("usedforsecurity", None)
+            return _orig_md5(*args, **kwargs)
+
+        hashlib.md5 = _patched_md5  # type: ignore[assignment]
+
+    engines = {}
+    try:
+        from xhtml2pdf import pisa
+        engines["xhtml2pdf"] = pisa
+    except ImportError:
+        pass
+
+    try:
+        from weasyprint import HTML as WeasyHTML
+        engines["weasyprint"] = WeasyHTML
+    except Exception:
+        # weasyprint may be installed but missing system libraries (pango, cairo)
+        pass
+
+    return engines
+
+
+def available_engines() -> List[str]:
+    """Installed PDF engines, in preference order (imports them on first call)."""
+    return list(_load_engines())
+
+
+def pdf_engine() -> Optional[str]:
+    """The engine PDFs are rendered with, or None when none is installed."""
+    engines = _load_engines()
+    if PDF_ENGINE is not None:
+        return PDF_ENGINE if PDF_ENGINE in engines else None
+    return next(iter(engines), None)
+
+
+def warm_up() -> None:
+    """Import the PDF engines and load the DOCX skeleton now instead of on the first export."""
+    from app.services.docx_engine import skeleton
+
+    started = time.perf_counter()
+    engine = pdf_engine()
+    skeleton()
+    log.info("[export_service] Warmed up (PDF engine: %s) in %.0f ms", engine, (time.perf_counter() - started) * 1e3)
+
+
+def start_warm_up() -> threading.Thread:
+    thread = threading.Thread(target=warm_up, name="export-warmup", daemon=True)
+    thread.start()
+    return thread
 
 
 # Map client template IDs to Jinja2 HTML template files
@@ -64,95 +129,107 @@ TEMPLATE_TO_HTML = {
 def build_pdf(data: dict) -> BytesIO:
     """Render resume HTML and convert to PDF bytes.
 
+    Conversion runs in the render pool when one is configured, inline otherwise.
+
     Raises:
         RuntimeError: when no PDF engine is installed.
+        RenderPoolBusy / RenderPoolRestarted / RenderTimeout: from the render
+            pool, when enabled.
+    """
+    engine = _require_pdf_engine()
+    template_name = _template_name(data)
+
+    cache_key = None
+    if export_cache.enabled:
+        cache_key = export_cache.key_for("pdf", data, template_name, engine)
+        cached = export_cache.get(cache_key)
+        if cached is not None:
+            return BytesIO(cached)
+
+    pdf_bytes = _render_pdf(template_name, data)
+    if cache_key is not None:
+        export_cache.put(cache_key, pdf_bytes)
+    return BytesIO(pdf_bytes)
+
+
+class ExportFile(NamedTuple):
+    """A rendered export: its content address and either its file or its bytes."""
+    key:     str
+    path:    Optional[Path]    # disk-tier file; None when the cache has no disk tier
+    payload: Optional[bytes]   # set only when ``path`` is None
+
+
+def export_file(fmt: str, data: dict) -> ExportFile:
+    """Render ``data`` as ``fmt`` ("pdf" or "docx") into the export cache's disk tier.
+
+    The file is named by its content address, so repeat exports of the same
+    resume are served from disk without rendering.
+
+    Raises:
+        RuntimeError: when ``fmt`` is "pdf" and no PDF engine is installed.
+        RenderPoolBusy / RenderPoolRestarted / RenderTimeout: from the render
+            pool, when enabled.
     """
-    if PDF_ENGINE is None:
+    template_name = _template_name(data)
+    engine = _require_pdf_engine() if fmt == "pdf" else DOCX_ENGINE
+    key = export_cache.key_for(fmt, data, template_name, engine)
+    path = export_cache.file(key)
+    if path is not None:
+        return ExportFile(key, path, None)
+
+    if fmt == "pdf":
+        payload = export_cache.get(key) or _render_pdf(template_name, data)
+    else:
+        payload = _render_docx(data, template_name)
+    # DOCX takes about a millisecond to build, not worth a place in every worker's memory.
+    path = export_cache.put(key, payload, memory=fmt == "pdf")
+    return ExportFile(key, path, None if path is not None else payload)
+
+
+def _require_pdf_engine() -> str:
+    engine = pdf_engine()
+    if engine is None:
         raise RuntimeError(
             "No PDF engine installed. Run: pip install xhtml2pdf  OR  pip install weasyprint"
         )
+    return engine
+
+
+def _template_name(data: dict) -> str:
+    return TEMPLATE_TO_HTML.get(data.get("template", "classic"), "classic")
 
-    template_id = data.get("template", "classic")
-    template_name = TEMPLATE_TO_HTML.get(template_id, "classic")
+
+def _render_pdf(template_name: str, data: dict) -> bytes:
+    if render_pool.enabled:
+        with metrics.engine("pdf", pdf_engine(), mode="pool"):   # includes the wait for a worker
+            return render_pool.render(template_name, data)
     html_content = render_template(f"resume/{template_name}.html", **data)
+    with metrics.engine("pdf", pdf_engine()):
+        return html_to_pdf(html_content)
+
 
+def _render_docx(data: dict, template_name: str) -> bytes:
+    from app.services.docx_engine import render_docx
+
+    with metrics.engine("docx", DOCX_ENGINE):
+        return render_docx(data, template_name)
+
+
+def html_to_pdf(html_content: str) -> bytes:
+    """Convert rendered resume HTML to PDF bytes with the active engine."""
+    engine = pdf_engine()
+    converter = _load_engines()[engine]
     buffer = BytesIO()
-    if PDF_ENGINE == "weasyprint":
-        _WeasyHTML(string=html_content).write_pdf(buffer)
+    if engine == "weasyprint":
+        converter(string=html_content).write_pdf(buffer)
     else:
-        pisa.CreatePDF(BytesIO(html_content.encode("utf-8")), dest=buffer, encoding="utf-8")
-    buffer.seek(0)
-    return buffer
+        converter.CreatePDF(BytesIO(html_content.encode("utf-8")), dest=buffer, encoding="utf-8")
+    return buffer.getvalue()
 
 
 def build_docx(data: dict) -> BytesIO:
-    """Build a DOCX document from resume data and return as bytes."""
-    contacts = data.get("contacts", {})
-    name = contacts.get("name", "")
-    job_title = contacts.get("jobTitle", "")
-
-    doc = Document()
-    section = doc.sections[0]
-    section.page_width = Inches(8.27)
-    section.page_height = Inches(11.69)
-
-    # Header — name and job title
-    name_paragraph = doc.add_paragraph()
-    name_run = name_paragraph.add_run(name)
-    name_run.bold = True
-    name_run.font.size = Pt(18)
-    name_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-    if job_title:
-        title_paragraph = doc.add_paragraph(job_title)
-        title_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-    doc.add_paragraph()
-
-    # Contact information
-    location = contacts.get("location") or (
-        ", ".join(filter(None, [contacts.get("city"), contacts.get("country")]))
-        if (contacts.get("city") or contacts.get("country")) else None
-    )
-    contact_parts = [
-        contacts.get("email"),
-        contacts.get("phone") and f"{contacts.get('phoneCode', '')} {contacts.get('phone', '')}".strip(),
-        location,
-    ]
-    contact_parts = [p for p in contact_parts if p]
-    if contact_parts:
-        doc.add_paragraph(" | ".join(contact_parts))
-
-    # Summary
-    if data.get("summary"):
-        doc.add_paragraph()
-        doc.add_paragraph("SUMMARY", style="Heading 2")
-        doc.add_paragraph(data["summary"])
-
-    # Experience
-    doc.add_paragraph()
-    doc.add_paragraph("EXPERIENCE", style="Heading 2")
-    for entry in data.get("experience", []):
-        p = doc.add_paragraph()
-        p.add_run(f"{entry.get('role', '')} — {entry.get('company', '')}").bold = True
-        doc.add_paragraph(entry.get("dates", ""), style="List Bullet")
-        doc.add_paragraph(entry.get("description", ""))
-
-    # Education
-    doc.add_paragraph()
-    doc.add_paragraph("EDUCATION", style="Heading 2")
-    for entry in data.get("education", []):
-        p = doc.add_paragraph()
-        p.add_run(entry.get("school", "")).bold = True
-        doc.add_paragraph(f"{entry.get('degree', '')} · {entry.get('dates', '')}")
-
-    # Skills
-    if data.get("skills"):
-        doc.add_paragraph()
-        doc.add_paragraph("SKILLS", style="Heading 2")
-        doc.add_paragraph(", ".join(data["skills"]))
+    """Build a DOCX document from resume data and return as bytes.
 
-    buffer = BytesIO()
-    doc.save(buffer)
-    buffer.seek(0)
-    return buffer
+    Styled after the resume's HTML template; see :mod:`app.services.docx_engine`.
+    """
+    return BytesIO(_render_docx(data, _template_name(data)))
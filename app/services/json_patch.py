@@ -0,0 +1,165 @@
+"""JSON Patch (RFC 6902) — apply edit operations to a resume document.
+
+Lets clients send only what changed (``PATCH /api/resume``) instead of the
+whole document. Supports all six operations (add, remove, replace, move,
+copy, test) over JSON Pointer (RFC 6901) paths. A patch is atomic: it is
+applied to a copy, and the caller's document is untouched if any operation
+fails.
+"""
+import copy
+from typing import Any, List, Tuple
+
+_OPS = {"add", "remove", "replace", "move", "copy", "test"}
+
+
+class JsonPatchError(ValueError):
+    """The patch is malformed or cannot be applied to the document."""
+
+
+class JsonPatchConflict(JsonPatchError):
+    """A ``test`` operation failed: the document is not in the expected state."""
+
+
+def apply_patch(doc: Any, operations: List[dict]) -> Any:
+    """Return a new document with ``operations`` applied to ``doc``.
+
+    Raises:
+        JsonPatchError: when an operation is malformed or its path does not exist.
+        JsonPatchConflict: when a ``test`` operation does not match.
+    """
+    if not isinstance(operations, list):
+        raise JsonPatchError("Patch must be a JSON array of operations")
+    doc = copy.deepcopy(doc)
+    for index, op in enumerate(operations):
+        try:
+            doc = _apply_op(doc, op)
+        except JsonPatchConflict:
+            raise
+        except JsonPatchError as exc:
+            raise JsonPatchError(f"Operation {index}: {exc}") from None
+    return doc
+
+
+def _apply_op(doc: Any, op: dict) -> Any:
+    if not isinstance(op, dict) or op.get("op") not in _OPS:
+        raise JsonPatchError(f"unknown operation {op.get('op') if isinstance(op, dict) else op!r}")
+    name = op["op"]
+    path = _member(op, "path")
+
+    if name == "add":
+        return _add(doc, path, copy.deepcopy(_member(op, "value")))
+    if name == "remove":
+        return _remove(doc, path)[0]
+    if name == "replace":
+        doc, _ = _remove(doc, path)
+        return _add(doc, path, copy.deepcopy(_member(op, "value")))
+    if name == "test":
+        if not _json_equal(_get(doc, path), _member(op, "value")):
+            raise JsonPatchConflict(f"test failed at {path!r}")
+        return doc
+
+    source = _member(op, "from")
+    if name == "move":
+        if path != source and path.startswith(source + "/"):
+            raise JsonPatchError(f"cannot move {source!r} into its own child {path!r}")
+        doc, value = _remove(doc, source)
+        return _add(doc, path, value)
+    return _add(doc, path, copy.deepcopy(_get(doc, source)))  # copy
+
+
+def _json_equal(a: Any, b: Any) -> bool:
+    """Equality as RFC 6902 ``test`` defines it: same JSON type, then same value.
+
+    Unlike Python's ``==``, ``true`` is not ``1`` and ``false`` is not ``0``.
+    """
+    if isinstance(a, bool) or isinstance(b, bool):
+        return isinstance(a, bool) and isinstance(b, bool) and a == b
+    if isinstance(a, (int, float)) and isinstance(b, (int, float)):
+        return a == b
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_json_equal(a[k], b[k]) for k in a)
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(_json_equal(x, y) for x, y in zip(a, b))
+    return type(a) is type(b) and a == b
+
+
+def _member(op: dict, key: str) -> Any:
+    if key not in op:
+        raise JsonPatchError(f"{op['op']!r} requires {key!r}")
+    value = op[key]
+    if key in ("path", "from") and not isinstance(value, str):
+        raise JsonPatchError(f"{key!r} must be a string")
+    return value
+
+
+# ── JSON Pointer ──────────────────────────────────────────────────────────────
+
+def _tokens(pointer: str) -> List[str]:
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise JsonPatchError(f"invalid JSON Pointer {pointer!r}")
+    return [t.replace("~1", "/").replace("~0", "~") for t in pointer[1:].split("/")]
+
+
+def _index(container: list, token: str, allow_end: bool = False) -> int:
+    if allow_end and token == "-":
+        return len(container)
+    if not token.isdigit() or (token != "0" and token.startswith("0")):
+        raise JsonPatchError(f"invalid array index {token!r}")
+    index = int(token)
+    if index > len(container) or (index == len(container) and not allow_end):
+        raise JsonPatchError(f"array index {index} out of range")
+    return index
+
+
+def _parent(doc: Any, pointer: str) -> Tuple[Any, str]:
+    tokens = _tokens(pointer)
+    target = doc
+    for token in tokens[:-1]:
+        target = _child(target, token)
+    return target, tokens[-1]
+
+
+def _child(target: Any, token: str) -> Any:
+    if isinstance(target, dict):
+        if token not in target:
+            raise JsonPatchError(f"path member {token!r} does not exist")
+        return target[token]
+    if isinstance(target, list):
+        return target[_index(target, token)]
+    raise JsonPatchError(f"cannot traverse into {type(target).__name__}")
+
+
+def _get(doc: Any, pointer: str) -> Any:
+    target = doc
+    for token in _tokens(pointer):
+        target = _child(target, token)
+    return target
+
+
+def _add(doc: Any, pointer: str, value: Any) -> Any:
+    if pointer == "":
+        return value
+    parent, token = _parent(doc, pointer)
+    if isinstance(parent, dict):
+        parent[token] = value
+    elif isinstance(parent, list):
+        parent.insert(_index(parent, token, allow_end=True), value)
+    else:
+        raise JsonPatchError(f"cannot add to {type(parent).__name__}")
+    return doc
+
+
+def _remove(doc: Any, pointer: str) -> Tuple[Any, Any]:
+    """Remove the value at ``pointer``; return ``(doc, removed value)``."""
+    if pointer == "":
+        return None, doc
+    parent, token = _parent(doc, pointer)
+    if isinstance(parent, dict):
+        if token not in parent:
+            raise JsonPatchError(f"path {pointer!r} does not exist")
+        return doc, parent.pop(token)
+    if isinstance(parent, list):
+        return doc, parent.pop(_index(parent, token))
+    raise JsonPatchError(f"cannot remove from {type(parent).__name__}")
@@ -0,0 +1,343 @@
+"""Metrics — per-request stage timings (Server-Timing) and a Prometheus ``/metrics`` endpoint.
+
+Hot paths wrap their stages in :meth:`Metrics.stage`, or decorate them with
+:meth:`Metrics.timed`. The stages are PDF/DOCX text extraction, text parsing,
+template rendering (through Flask's template signals), PDF/DOCX conversion
+and render-pool waits. Each stage is observed into a latency histogram.
+Inside a request it is also added to the response's ``Server-Timing`` header,
+along with the request's SQL query count and time (counted through
+SQLAlchemy cursor events) and its total time.
+
+``GET /metrics`` renders the histograms, the counters and the caches' own
+statistics in the Prometheus text format, with no client library or external
+service. Values are per process: scrape each worker, or run one, for complete
+numbers. Work done in the render-pool and batch-parse worker processes shows
+up only as the time the request spent waiting for it.
+
+``/metrics`` requires ``Authorization: Bearer <METRICS_TOKEN>``. Without a
+token it answers loopback clients in debug and testing only, and is a 404
+everywhere else: behind a reverse proxy every client looks local.
+"""
+import bisect
+import hmac
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from flask import (
+    abort, before_render_template, current_app, g, has_request_context, request, template_rendered,
+)
+
+log = logging.getLogger(__name__)
+
+NAMESPACE = "resumeforge"
+
+# Seconds; request and stage latencies range from sub-millisecond cache hits to PDF renders.
+BUCKETS       = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+QUERY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5)
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+_LOOPBACK = {"127.0.0.1", "::1"}
+
+
+class Counter:
+    """Monotonic counter with labels."""
+
+    def __init__(self, name: str, help: str, labelnames: Tuple[str, ...] = ()):
+        self.name       = f"{NAMESPACE}_{name}"
+        self.help       = help
+        self.labelnames = labelnames
+        self._values: Dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = tuple(str(labels[n]) for n in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def expose(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        lines += [f"{self.name}{_labels(self.labelnames, key)} {_number(v)}" for key, v in values]
+        return lines
+
+
+class Histogram:
+    """Cumulative-bucket histogram with labels."""
+
+    def __init__(self, name: str, help: str, labelnames: Tuple[str, ...] = (), buckets=BUCKETS):
+        self.name       = f"{NAMESPACE}_{name}"
+        self.help       = help
+        self.labelnames = labelnames
+        self.buckets    = tuple(buckets)
+        self._series: Dict[tuple, list] = {}   # labels -> [count per bucket, +Inf count, sum]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels) -> None:
+        key = tuple(str(labels[n]) for n in self.labelnames)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1]    += value
+
+    def expose(self) -> List[str]:
+        with self._lock:
+            series = sorted((key, list(values)) for key, values in self._series.items())
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        names = self.labelnames + ("le",)
+        for key, values in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), values[:-1]):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _number(bound)
+                lines.append(f"{self.name}_bucket{_labels(names, key + (le,))} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_number(values[-1])}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+
+class _RequestTiming:
+    __slots__ = ("started", "stages", "queries", "query_seconds")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages: Dict[str, float] = {}
+        self.queries = 0
+        self.query_seconds = 0.0
+
+
+class Metrics:
+    """Histograms, counters and stats sources; configured by :meth:`init_app`."""
+
+    def __init__(self):
+        self.enabled       = False
+        self.server_timing = False
+        self.token         = ""
+        self.requests = Histogram("request_duration_seconds", "Request latency by endpoint.",
+                                  ("endpoint", "method", "status"))
+        self.stages   = Histogram("stage_duration_seconds", "Time spent in each instrumented stage.",
+                                  ("stage",))
+        self.engines  = Histogram("export_engine_duration_seconds",
+                                  "Export conversion time by format, engine and where it ran.",
+                                  ("format", "engine", "mode"))
+        self.queries  = Histogram("db_query_duration_seconds", "SQL statement execution time.",
+                                  buckets=QUERY_BUCKETS)
+        self.request_queries = Histogram("request_db_queries", "SQL statements per request, by endpoint.",
+                                         ("endpoint",), buckets=COUNT_BUCKETS)
+        self.query_count    = Counter("db_queries_total", "SQL statements executed, by endpoint.", ("endpoint",))
+        self.extractor_wins = Counter("pdf_extractor_wins_total",
+                                      "PDF text extractions by the extractor whose text was used.", ("extractor",))
+        self._stats: List[Tuple[str, str, Callable[[], dict]]] = []   # (family, source, stats())
+        self._local = threading.local()
+
+    def init_app(self, app) -> None:
+        self.enabled = bool(app.config.get("METRICS_ENABLED", True))
+        if not self.enabled:
+            return
+        self.server_timing = bool(app.config.get("SERVER_TIMING_ENABLED", True))
+        self.token         = app.config.get("METRICS_TOKEN", "")
+        if not self.token and not (app.debug or app.testing):
+            log.info("[metrics] METRICS_TOKEN is not set; /metrics is disabled")
+
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        before_render_template.connect(self._template_started, app)
+        template_rendered.connect(self._template_finished, app)
+        _install_query_hooks()
+        app.add_url_rule("/metrics", "metrics", self._metrics_view)
+
+        from app.services.export_cache import export_cache
+        from app.services.parse_cache import parse_cache
+        from app.services.preview_cache import preview_cache
+        from app.services.render_pool import render_pool
+        from app.services.template_cache import template_cache
+        from app.services.user_cache import user_cache
+        for source, service in (("export", export_cache), ("preview", preview_cache), ("user", user_cache),
+                                ("template", template_cache), ("parse", parse_cache)):
+            self.add_stats("cache", source, service.stats)
+        self.add_stats("render_pool", "pdf", render_pool.stats)
+
+    def add_stats(self, family: str, source: str, stats: Callable[[], dict]) -> None:
+        """Expose the numeric values of ``stats()`` as ``<family>_<key>{<family>="<source>"}`` gauges."""
+        self._stats = [s for s in self._stats if s[:2] != (family, source)] + [(family, source, stats)]
+
+    # ── Stages ────────────────────────────────────────────────────────────────
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the block as stage ``name``."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._record_stage(name, time.perf_counter() - start)
+
+    def timed(self, name: str):
+        """Decorator form of :meth:`stage`."""
+        def decorator(fn):
+            @wraps(fn)
+            def wrapper(*args, **kwargs):
+                with self.stage(name):
+                    return fn(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    @contextmanager
+    def engine(self, fmt: str, engine: str, mode: str = "inline") -> Iterator[None]:
+        """Time an export conversion, as stage ``<fmt>_<mode>`` and in the engine histogram."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.engines.observe(elapsed, format=fmt, engine=engine, mode=mode)
+            self._record_stage(f"{fmt}_{mode}", elapsed)
+
+    def _record_stage(self, name: str, seconds: float) -> None:
+        self.stages.observe(seconds, stage=name)
+        timing = g.get("_metrics") if has_request_context() else None
+        if timing is not None:
+            timing.stages[name] = timing.stages.get(name, 0.0) + seconds
+
+    def _template_started(self, sender, template, context, **extra) -> None:
+        stack = getattr(self._local, "templates", None)
+        if stack is None:
+            stack = self._local.templates = []
+        stack.append(time.perf_counter())
+
+    def _template_finished(self, sender, template, context, **extra) -> None:
+        stack = getattr(self._local, "templates", None)
+        if stack:
+            self._record_stage("render_template", time.perf_counter() - stack.pop())
+
+    # ── Requests and queries ──────────────────────────────────────────────────
+
+    def _before_request(self) -> None:
+        g._metrics = _RequestTiming()
+
+    def _after_request(self, response):
+        timing = g.pop("_metrics", None)
+        if timing is None:
+            return response
+        total = time.perf_counter() - timing.started
+        endpoint = request.endpoint or "unmatched"
+        self.requests.observe(total, endpoint=endpoint, method=request.method, status=response.status_code)
+        self.request_queries.observe(timing.queries, endpoint=endpoint)
+        if timing.queries:
+            self.query_count.inc(timing.queries, endpoint=endpoint)
+        if self.server_timing:
+            parts = [f"{name};dur={seconds * 1e3:.1f}" for name, seconds in timing.stages.items()]
+            if timing.queries:
+                parts.append(f'db;dur={timing.query_seconds * 1e3:.1f};desc="{timing.queries} queries"')
+            parts.append(f"total;dur={total * 1e3:.1f}")
+            response.headers.add("Server-Timing", ", ".join(parts))
+        return response
+
+    def _query_finished(self, seconds: float) -> None:
+        self.queries.observe(seconds)
+        timing = g.get("_metrics") if has_request_context() else None
+        if timing is None:
+            self.query_count.inc(endpoint="background")
+            return
+        # Added to the per-endpoint counter once, when the request ends.
+        timing.queries += 1
+        timing.query_seconds += seconds
+
+    # ── Exposition ────────────────────────────────────────────────────────────
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in (self.requests, self.stages, self.engines, self.queries, self.request_queries,
+                       self.query_count, self.extractor_wins):
+            lines += metric.expose()
+        lines += self._expose_stats()
+        return "\n".join(lines) + "\n"
+
+    def _expose_stats(self) -> List[str]:
+        families: Dict[str, List[str]] = {}
+        for family, source, stats in self._stats:
+            try:
+                values = stats()
+            except Exception as exc:
+                log.warning("[metrics] %s %s stats failed: %s", source, family, exc)
+                continue
+            for key, value in values.items():
+                if isinstance(value, bool):
+                    value = int(value)
+                if not isinstance(value, (int, float)):
+                    continue
+                name = f"{NAMESPACE}_{family}_{key}"
+                families.setdefault(name, []).append(f'{name}{{{family}="{source}"}} {_number(value)}')
+        lines = []
+        for name, samples in families.items():
+            lines += [f"# TYPE {name} gauge", *samples]
+        return lines
+
+    def authorized(self) -> bool:
+        """Whether the current request may read metrics (see the module docstring)."""
+        if self.token:
+            return hmac.compare_digest(request.headers.get("Authorization", ""), f"Bearer {self.token}")
+        return (current_app.debug or current_app.testing) and request.remote_addr in _LOOPBACK
+
+    def _metrics_view(self):
+        if not self.authorized():
+            abort(404)
+        return current_app.response_class(self.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+_query_hooks_installed = False
+
+
+def _install_query_hooks() -> None:
+    """Time every SQL statement, on every engine; once per process."""
+    global _query_hooks_installed
+    if _query_hooks_installed:
+        return
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    _query_hooks_installed = True
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if context is not None:
+        context._metrics_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    started = getattr(context, "_metrics_started", None)
+    if started is not None:
+        metrics._query_finished(time.perf_counter() - started)
+
+
+def _labels(names: Tuple[str, ...], values: tuple) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values))
+    return f"{{{pairs}}}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+metrics = Metrics()
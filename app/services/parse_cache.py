@@ -0,0 +1,142 @@
+"""Parse cache — reuse structured results for files that were already parsed.
+
+Users often upload the same PDF again and again. Results are keyed by the
+SHA-256 of the file bytes (plus extension) and ``PARSER_VERSION``. They are
+kept in a per-process LRU and in the ``parse_cache`` table, so an identical
+upload skips extraction and ``_parse_text`` entirely. Rows older than
+``PARSE_CACHE_TTL`` are dropped, the table is capped at
+``PARSE_CACHE_MAX_ROWS`` (least recently used first), and bumping
+``PARSER_VERSION`` invalidates everything cached by earlier versions.
+"""
+import copy
+import hashlib
+import logging
+import time
+from datetime import datetime, timedelta
+
+from app.models.parse_cache import ParseCacheEntry
+from app.models.user import db
+from app.services.cache import LRUCache
+from app.services.resume_parser import PARSER_VERSION, parse_resume, parse_resume_file
+
+log = logging.getLogger(__name__)
+
+
+class ParseCache:
+    """Two-tier (memory + SQLite) parse-result cache; configured by :meth:`init_app`."""
+
+    def __init__(self):
+        self.enabled  = False
+        self.memory   = LRUCache(max_entries=0)
+        self.ttl      = timedelta(days=30)
+        self.max_rows = 0
+
+    def init_app(self, app) -> None:
+        self.enabled  = bool(app.config.get("PARSE_CACHE_ENABLED", True))
+        self.memory   = LRUCache(max_entries=app.config.get("PARSE_CACHE_MEMORY_ENTRIES", 256))
+        self.ttl      = timedelta(seconds=app.config.get("PARSE_CACHE_TTL", 30 * 24 * 3600))
+        self.max_rows = int(app.config.get("PARSE_CACHE_MAX_ROWS", 5000))
+        if self.enabled:
+            with app.app_context():
+                stale = ParseCacheEntry.query.filter(ParseCacheEntry.parser_version != PARSER_VERSION)
+                removed = stale.delete(synchronize_session=False)
+                db.session.commit()
+                if removed:
+                    log.info("[parse_cache] Dropped %d entries from older parser versions", removed)
+
+    @staticmethod
+    def digest(file_bytes, filename: str) -> str:
+        ext = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+        h = hashlib.sha256(ext.encode("utf-8") + b"\0")
+        h.update(getattr(file_bytes, "buffer", file_bytes))  # bytes or MappedFile
+        return h.hexdigest()
+
+    def parse(self, file_bytes, filename: str) -> dict:
+        """Return ``parse_resume_file(file_bytes, filename)``, from cache when possible.
+
+        The result is always a fresh copy, so callers may modify it. Degraded
+        results (no text extracted, or extraction cut short) are not stored.
+        """
+        if not self.enabled:
+            return parse_resume_file(file_bytes, filename)
+
+        key = self.digest(file_bytes, filename)
+        cached = self.get(key)
+        if cached is not None:
+            log.info("[parse_cache] Hit for %s", filename)
+            return cached
+
+        data, complete = parse_resume(file_bytes, filename)
+        if not complete:
+            return data
+        self.put(key, data, len(file_bytes))
+        return copy.deepcopy(data)
+
+    def stats(self) -> dict:
+        return self.memory.stats()
+
+    def get(self, key: str):
+        """Return a copy of the cached result for ``key`` (see :meth:`digest`), or None."""
+        if not self.enabled:
+            return None
+        data = self._get(key)
+        return copy.deepcopy(data) if data is not None else None
+
+    def put(self, key: str, data: dict, size_bytes: int) -> None:
+        if self.enabled:
+            self._put(key, data, size_bytes)
+
+    # ── Tiers ─────────────────────────────────────────────────────────────────
+
+    def _get(self, key: str):
+        entry = self.memory.get(key)
+        if entry is not None:
+            stored_at, data = entry
+            if time.time() - stored_at < self.ttl.total_seconds():
+                return data
+            self.memory.pop(key)
+
+        row = ParseCacheEntry.query.filter_by(digest=key, parser_version=PARSER_VERSION).first()
+        if row is None:
+            return None
+        now = datetime.utcnow()
+        if row.created_at and row.created_at < now - self.ttl:
+            db.session.delete(row)
+            db.session.commit()
+            return None
+        row.last_used_at = now
+        db.session.commit()
+        self.memory.put(key, (time.time(), row.data))
+        return row.data
+
+    def _put(self, key: str, data: dict, size_bytes: int) -> None:
+        self.memory.put(key, (time.time(), data))
+        try:
+            db.session.merge(ParseCacheEntry(
+                digest=key, parser_version=PARSER_VERSION, data=data, size_bytes=size_bytes,
+            ))
+            db.session.commit()
+            self._evict()
+        except Exception as exc:
+            db.session.rollback()
+            log.warning("[parse_cache] Could not persist entry: %s", exc)
+
+    def _evict(self) -> None:
+        """Drop expired rows, then the least recently used rows beyond ``max_rows``."""
+        cutoff = datetime.utcnow() - self.ttl
+        ParseCacheEntry.query.filter(ParseCacheEntry.created_at < cutoff).delete(synchronize_session=False)
+        excess = ParseCacheEntry.query.count() - self.max_rows
+        if excess > 0:
+            oldest = (
+                db.session.query(ParseCacheEntry.digest)
+                .order_by(ParseCacheEntry.last_used_at)
+                .limit(excess)
+                .subquery()
+            )
+            ParseCacheEntry.query.filter(ParseCacheEntry.digest.in_(db.select(oldest.c.digest))).delete(
+                synchronize_session=False
+            )
+        db.session.commit()
+
+
+parse_cache = ParseCache()
@@ -0,0 +1,95 @@
+"""Preview cache — rendered resume HTML for the dashboard and preview endpoint.
+
+Rendering a resume template is pure in (content, template file), so the HTML
+is kept in a byte-bounded LRU with one slot per resume. An entry is only
+served while the resume's content hash and the requested template file still
+match; saves drop the slot explicitly through :meth:`PreviewCache.invalidate`.
+"""
+import threading
+from typing import Callable, Hashable, Tuple
+
+from flask import render_template
+
+from app.services.cache import LRUCache
+
+# Map template IDs (from resume data / JS) to actual resume HTML template filenames
+TEMPLATE_TO_HTML = {
+    "classic": "classic",
+    "modern_simple": "modern",
+    "modern_with_photo": "photo_modern",
+    "chronological": "classic",
+    "functional": "minimal",
+    "hybrid": "two_col_light",
+    "creative": "timeline",
+    "simple_ats": "clean",
+    "two_col_ats": "two_col_light",
+    "polished": "elegant",
+    "minimalist": "minimal",
+    "elegant": "elegant",
+    "teenager": "simple",
+    "internship": "simple",
+    "entry_level": "clean",
+    "career_change": "minimal",
+}
+
+
+def template_file_for(template_id: str) -> str:
+    return TEMPLATE_TO_HTML.get(template_id or "classic", "classic")
+
+
+class PreviewCache:
+    """Byte-bounded LRU of rendered preview HTML; configured by :meth:`init_app`."""
+
+    def __init__(self):
+        self.enabled = False
+        self.memory  = LRUCache(max_entries=0)
+        self.hits    = 0
+        self.misses  = 0
+        self._lock   = threading.Lock()
+
+    def init_app(self, app) -> None:
+        self.enabled = bool(app.config.get("PREVIEW_CACHE_ENABLED", True))
+        self.memory  = LRUCache(
+            max_bytes=app.config.get("PREVIEW_CACHE_MEMORY_BYTES", 16 * 1024 * 1024),
+            sizeof=lambda entry: len(entry[2]),
+        )
+
+    def render(self, slot: Hashable, version: str, template_file: str,
+               load_data: Callable[[], dict]) -> Tuple[str, bool]:
+        """Return ``(html, cache_hit)`` for one resume preview.
+
+        ``slot`` identifies the resume (its id), ``version`` its content (the
+        ETag), and ``load_data`` is only called on a miss, so deferred resume
+        data stays unloaded when the preview is cached.
+        """
+        if not self.enabled:
+            return render_template(f"resume/{template_file}.html", **load_data()), False
+
+        # The LRU's own counters see a stale slot as a hit, so count here.
+        entry = self.memory.get(slot)
+        hit = entry is not None and entry[0] == version and entry[1] == template_file
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if hit:
+            return entry[2], True
+
+        html = render_template(f"resume/{template_file}.html", **load_data())
+        self.memory.put(slot, (version, template_file, html))
+        return html, False
+
+    def invalidate(self, slot: Hashable) -> None:
+        self.memory.pop(slot)
+
+    def stats(self) -> dict:
+        stats = self.memory.stats()
+        with self._lock:
+            stats["hits"], stats["misses"] = self.hits, self.misses
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else None
+        return stats
+
+
+preview_cache = PreviewCache()
@@ -0,0 +1,238 @@
+"""Request profiler — opt-in, admin-only profiles of single production requests.
+
+An admin adds ``X-Profile: <mode>`` or ``?_profile=<mode>`` to a request, and
+that request's handling is profiled. Admins are users whose ``is_admin`` flag
+an operator set with ``flask set-admin <email>``; registering with some
+address is never enough, since emails are not verified. The profile is saved
+under ``PROFILE_DIR`` and the response carries its file name in
+``X-Profile``. Modes:
+
+  - ``cprofile`` (or ``1``) — deterministic, every call timed; saved as
+    ``.pstats`` (``python -m pstats``, snakeviz);
+  - ``sample`` — the request thread's stack is sampled every
+    ``PROFILE_SAMPLE_INTERVAL_MS``; saved as ``.speedscope.json`` for
+    https://www.speedscope.app. Lower overhead, and it shows where a slow
+    request waits (locks, I/O, the render pool). While the request holds the
+    GIL the sampler runs at most every switch interval (5 ms by default);
+    each sample is weighted by the time since the previous one.
+
+Only the newest ``PROFILE_MAX_FILES`` profiles are kept. Unless
+``PROFILER_ENABLED`` is set no hooks are installed at all. Otherwise a request
+without the flag costs one header lookup and one substring test on the query
+string.
+The profile covers the request from this hook to ``after_request``. A streamed
+body is produced after that and is not included.
+"""
+import cProfile
+import json
+import logging
+import re
+import secrets
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from flask import g, request
+from flask_login import current_user
+
+log = logging.getLogger(__name__)
+
+HEADER     = "X-Profile"
+QUERY_FLAG = "_profile"
+
+_MODES = {"1": "cprofile", "true": "cprofile", "cprofile": "cprofile", "sample": "sample"}
+_EXTENSIONS = {"cprofile": ".pstats", "sample": ".speedscope.json"}
+PROFILE_NAME = re.compile(r"[0-9]{8}T[0-9]{6}Z-[0-9a-f]{6}-[\w.]+\.(pstats|speedscope\.json)")
+
+
+class _Deterministic:
+    """cProfile over the request thread."""
+
+    def __init__(self):
+        self.profile = cProfile.Profile()
+
+    def start(self) -> None:
+        self.profile.enable()
+
+    def stop(self) -> None:
+        self.profile.disable()
+
+    def save(self, path: Path, name: str) -> None:
+        self.profile.dump_stats(str(path))
+
+
+class _Sampler:
+    """Samples one thread's stack from a background thread."""
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval  = interval
+        self.frames: List[dict] = []
+        self.samples: List[List[int]] = []
+        self.weights: List[float] = []
+        self._index: Dict[Tuple[str, str, int], int] = {}
+        self._stopped = threading.Event()
+        self._thread  = threading.Thread(target=self._run, name="profile-sampler", daemon=True)
+        self.elapsed  = 0.0
+
+    def start(self) -> None:
+        self._started = time.perf_counter()
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._thread.join()
+        self.elapsed = time.perf_counter() - self._started
+
+    def _run(self) -> None:
+        last = self._started
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            now = time.perf_counter()
+            if frame is None:
+                return
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(self._frame(code.co_name, code.co_filename, code.co_firstlineno))
+                frame = frame.f_back
+            stack.reverse()
+            self.samples.append(stack)
+            self.weights.append(now - last)
+            last = now
+
+    def _frame(self, name: str, filename: str, line: int) -> int:
+        key = (name, filename, line)
+        index = self._index.get(key)
+        if index is None:
+            index = self._index[key] = len(self.frames)
+            self.frames.append({"name": name, "file": filename, "line": line})
+        return index
+
+    def save(self, path: Path, name: str) -> None:
+        document = {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "resumeforge",
+            "activeProfileIndex": 0,
+            "shared": {"frames": self.frames},
+            "profiles": [{
+                "type": "sampled",
+                "name": name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": self.elapsed,
+                "samples": self.samples,
+                "weights": self.weights,
+            }],
+        }
+        path.write_text(json.dumps(document, separators=(",", ":")), encoding="utf-8")
+
+
+class RequestProfiler:
+    """Admin-only per-request profiler; configured by :meth:`init_app`."""
+
+    def __init__(self):
+        self.enabled   = False
+        self.directory: Optional[Path] = None
+        self.max_files = 50
+        self.interval  = 0.001
+        self._prune_lock = threading.Lock()
+
+    def init_app(self, app) -> None:
+        import click
+
+        @app.cli.command("set-admin")
+        @click.argument("email")
+        @click.option("--revoke", is_flag=True, help="Remove admin rights instead.")
+        def set_admin_command(email, revoke):
+            """Grant (or revoke) admin rights for the user registered as EMAIL."""
+            from app.models.user import User, db
+
+            user = User.query.filter_by(email=email.strip().lower()).first()
+            if user is None:
+                raise click.ClickException(f"No user registered as {email}")
+            user.is_admin = not revoke
+            db.session.commit()
+            click.echo(f"{user.email} is {'no longer' if revoke else 'now'} an admin "
+                       f"(running workers pick this up within USER_CACHE_TTL)")
+
+        self.enabled = bool(app.config.get("PROFILER_ENABLED", False))
+        if not self.enabled:
+            return
+        self.directory = Path(app.config["PROFILE_DIR"])
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_files = int(app.config.get("PROFILE_MAX_FILES", 50))
+        self.interval  = float(app.config.get("PROFILE_SAMPLE_INTERVAL_MS", 1)) / 1e3
+
+        app.before_request(self._start)
+        app.after_request(self._finish)
+        app.teardown_request(self._abandon)
+
+    def is_admin(self, user) -> bool:
+        return bool(user.is_authenticated) and bool(getattr(user, "is_admin", False))
+
+    def profiles(self) -> List[Path]:
+        """Saved profiles, newest first."""
+        if self.directory is None:
+            return []
+        paths = [p for p in self.directory.iterdir() if PROFILE_NAME.fullmatch(p.name)]
+        return sorted(paths, key=lambda p: p.name, reverse=True)   # names start with a UTC timestamp
+
+    # ── Request hooks ─────────────────────────────────────────────────────────
+
+    def _requested_mode(self) -> Optional[str]:
+        value = request.headers.get(HEADER)
+        if value is None:
+            if QUERY_FLAG not in request.environ.get("QUERY_STRING", ""):
+                return None
+            value = request.args.get(QUERY_FLAG)
+        return _MODES.get((value or "").strip().lower())
+
+    def _start(self) -> None:
+        mode = self._requested_mode()
+        if mode is None or not self.is_admin(current_user):
+            return
+        run = _Deterministic() if mode == "cprofile" else _Sampler(threading.get_ident(), self.interval)
+        try:
+            run.start()
+        except ValueError as exc:   # another profiler is active in this thread / interpreter
+            log.warning("[profiler] Could not profile %s: %s", request.path, exc)
+            g._profile_error = "unavailable"
+            return
+        g._profile = (mode, run)
+
+    def _finish(self, response):
+        profile = g.pop("_profile", None)
+        if profile is None:
+            if g.pop("_profile_error", None):
+                response.headers[HEADER] = "unavailable"
+            return response
+        mode, run = profile
+        run.stop()
+        stamp = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+        name = f"{stamp}-{secrets.token_hex(3)}-{request.endpoint or 'unmatched'}{_EXTENSIONS[mode]}"
+        try:
+            run.save(self.directory / name, f"{request.method} {request.full_path.rstrip('?')}")
+        except OSError as exc:
+            log.warning("[profiler] Could not save %s: %s", name, exc)
+            return response
+        log.info("[profiler] Saved %s (%s %s)", name, request.method, request.path)
+        response.headers[HEADER] = name
+        self._prune()
+        return response
+
+    def _abandon(self, exc=None) -> None:
+        profile = g.pop("_profile", None)
+        if profile is not None:
+            profile[1].stop()
+
+    def _prune(self) -> None:
+        with self._prune_lock:
+            for path in self.profiles()[self.max_files:]:
+                path.unlink(missing_ok=True)
+
+
+request_profiler = RequestProfiler()
@@ -0,0 +1,304 @@
+"""Render pool — pre-warmed worker processes for PDF conversion.
+
+xhtml2pdf holds the GIL for the whole conversion, so rendering inline in a
+request thread stalls every other request served by the same process. The
+pool moves template rendering and PDF conversion into separate processes:
+
+  - each worker imports the PDF engine and compiles every resume template
+    once, in its initializer, so jobs never pay those costs;
+  - admission is bounded (workers + queue slots); when full, callers get
+    :class:`RenderPoolBusy` immediately instead of piling up behind it;
+  - each job has a timeout (:class:`RenderTimeout`), counted from when a
+    worker starts it (workers record the start time in shared memory), so
+    time spent queued never counts. A job still running when it expires has
+    the worker processes terminated and the pool recreated, so a hung
+    conversion cannot hold a worker and its admission slot. Jobs running
+    next to it fail with :class:`RenderPoolRestarted` and are asked to retry;
+  - workers are recycled after ``PDF_RENDER_MAX_JOBS_PER_WORKER`` jobs to
+    cap memory growth from the PDF libraries (Python 3.11+; older versions
+    keep their workers until the pool is recreated).
+"""
+import atexit
+import logging
+import multiprocessing
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Optional
+
+log = logging.getLogger(__name__)
+
+
+class RenderPoolBusy(RuntimeError):
+    """Raised when every worker is busy and the queue is full."""
+
+    def __init__(self, retry_after: int):
+        super().__init__("PDF renderer is busy. Please retry shortly.")
+        self.retry_after = retry_after
+
+
+class RenderPoolRestarted(RenderPoolBusy):
+    """Raised when a job was lost because the pool broke (a worker crashed or was recycled)."""
+
+    def __init__(self, retry_after: int):
+        super().__init__(retry_after)
+        self.args = ("PDF renderer restarted after a worker crash. Please retry.",)
+
+
+class RenderTimeout(RuntimeError):
+    """Raised when a render job does not finish within its timeout."""
+
+
+# How often a caller checks whether its queued job has started.
+_START_POLL = 0.05
+
+
+class RenderPool:
+    """Bounded process pool for PDF rendering; configured by :meth:`init_app`."""
+
+    def __init__(self):
+        self.workers         = 0
+        self.queue_size      = 0
+        self.timeout         = 60.0
+        self.max_jobs        = None
+        self.retry_after     = 5
+        self.template_folder = ""
+        self.bytecode_dir    = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[threading.BoundedSemaphore] = None
+        self._started = None    # shared array: wall-clock start time per job index, 0 = not started
+        self._free: list = []   # job indexes not in use (one per admission slot)
+        self._lock = threading.Lock()
+        self.rejected = 0
+        self.timeouts = 0
+
+    def init_app(self, app) -> None:
+        self.shutdown()
+        self.workers         = int(app.config.get("PDF_RENDER_WORKERS", 0))
+        self.queue_size      = int(app.config.get("PDF_RENDER_QUEUE_SIZE", 0))
+        self.timeout         = float(app.config.get("PDF_RENDER_TIMEOUT", 60))
+        self.max_jobs        = app.config.get("PDF_RENDER_MAX_JOBS_PER_WORKER") or None
+        self.retry_after     = int(app.config.get("PDF_RENDER_RETRY_AFTER", 5))
+        self.template_folder = str(Path(app.root_path) / app.template_folder)
+        if app.config.get("JINJA_BYTECODE_CACHE_ENABLED"):
+            self.bytecode_dir = str(Path(app.config["JINJA_BYTECODE_CACHE_DIR"]) / "render_pool")
+        capacity = self.workers + self.queue_size
+        self._slots = threading.BoundedSemaphore(capacity) if self.workers else None
+        if self.workers:
+            self._started = multiprocessing.get_context("spawn").Array("d", capacity, lock=False)
+            self._free = list(range(capacity))
+        # Spawned workers re-import the main module (e.g. run.py calls create_app),
+        # so never start a pool from inside a worker process.
+        if self.workers and app.config.get("PDF_RENDER_PREWARM") and multiprocessing.parent_process() is None:
+            self.start()
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 0
+
+    def start(self) -> ProcessPoolExecutor:
+        """Create the executor (if needed) and spawn every worker up front."""
+        with self._lock:
+            if self._executor is None:
+                options = {}
+                if sys.version_info >= (3, 11):   # max_tasks_per_child is new in 3.11
+                    options["max_tasks_per_child"] = self.max_jobs
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(self.template_folder, self.bytecode_dir, self._started),
+                    **options,
+                )
+                for _ in range(self.workers):
+                    self._executor.submit(_warmup)
+            return self._executor
+
+    def render(self, template_name: str, data: dict) -> bytes:
+        """Render ``resume/<template_name>.html`` with ``data`` to PDF bytes in a worker.
+
+        Raises:
+            RenderPoolBusy:      when no worker or queue slot is free.
+            RenderPoolRestarted: when the pool broke while the job was pending.
+            RenderTimeout:       when the job runs longer than ``PDF_RENDER_TIMEOUT``.
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise RenderPoolBusy(self.retry_after)
+        with self._lock:
+            index = self._free.pop()
+        self._started[index] = 0.0
+
+        def release_slot():
+            with self._lock:
+                self._free.append(index)
+            self._slots.release()
+
+        release = _Once(release_slot)
+        executor = None
+        try:
+            executor = self.start()
+            future = executor.submit(_render_job, index, template_name, data)
+        except BrokenProcessPool:
+            release()
+            self._reset(executor)
+            raise RenderPoolRestarted(self.retry_after)
+        except BaseException:
+            release()
+            raise
+        future.add_done_callback(lambda _: release())
+
+        try:
+            return self._result(future, index)
+        except FutureTimeoutError:
+            with self._lock:
+                self.timeouts += 1
+            # The job has started, and a conversion cannot be interrupted: kill
+            # the workers so the hung job stops holding one of them.
+            log.warning("[render_pool] Job exceeded %.0fs timeout (%s); recycling workers",
+                        self.timeout, template_name)
+            self._recycle(executor)
+            release()
+            raise RenderTimeout(f"PDF rendering timed out after {self.timeout:.0f}s")
+        except BrokenProcessPool:
+            self._reset(executor)
+            raise RenderPoolRestarted(self.retry_after)
+
+    def _result(self, future, index: int) -> bytes:
+        """Wait for ``future``, at most ``timeout`` seconds after a worker started it.
+
+        Raises:
+            FutureTimeoutError: when the job started and has not finished in time.
+        """
+        deadline = None
+        while True:
+            if deadline is None and self._started[index]:
+                deadline = self._started[index] + self.timeout
+            wait = _START_POLL if deadline is None else max(0.0, deadline - time.time())
+            try:
+                return future.result(timeout=wait)
+            except FutureTimeoutError:
+                if deadline is not None and time.time() >= deadline:
+                    raise
+
+    def has_idle_worker(self) -> bool:
+        """True when fewer jobs hold a slot than there are workers (nothing is queued)."""
+        return self.stats()["in_use"] < self.workers
+
+    def stats(self) -> dict:
+        in_use = 0
+        if self._slots is not None:
+            in_use = (self.workers + self.queue_size) - self._slots._value
+        with self._lock:
+            rejected, timeouts = self.rejected, self.timeouts
+        return {
+            "workers":  self.workers,
+            "capacity": self.workers + self.queue_size,
+            "in_use":   in_use,
+            "rejected": rejected,
+            "timeouts": timeouts,
+        }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _detach(self, executor: Optional[ProcessPoolExecutor]) -> bool:
+        """Forget ``executor`` if it is still the current one; True if it was.
+
+        A caller holding a future from a pool that was already replaced must
+        not shut down the new one.
+        """
+        with self._lock:
+            if executor is None or executor is not self._executor:
+                return False
+            self._executor = None
+            return True
+
+    def _reset(self, executor: Optional[ProcessPoolExecutor]) -> None:
+        if not self._detach(executor):
+            return
+        log.error("[render_pool] Worker process died; recreating pool")
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _recycle(self, executor: ProcessPoolExecutor) -> None:
+        """Terminate ``executor``'s worker processes; the next job starts a fresh pool."""
+        if not self._detach(executor):
+            return
+        # ProcessPoolExecutor has no public way to stop a running job before 3.14.
+        processes = list((getattr(executor, "_processes", None) or {}).values())
+        executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            process.terminate()
+
+
+class _Once:
+    """Calls ``fn`` on the first call only (a slot is released exactly once)."""
+
+    def __init__(self, fn):
+        self._fn   = fn
+        self._lock = threading.Lock()
+        self._done = False
+
+    def __call__(self) -> None:
+        with self._lock:
+            if self._done:
+                return
+            self._done = True
+        self._fn()
+
+
+# ── Worker side ───────────────────────────────────────────────────────────────
+# Everything below runs inside the pool processes.
+
+_worker_env = None
+
+
+_started = None
+
+
+def _init_worker(template_folder: str, bytecode_dir: Optional[str] = None, started=None) -> None:
+    """Import the PDF engine and compile every resume template once per worker."""
+    global _worker_env, _started
+    _started = started
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+
+    from app.services.export_service import pdf_engine
+    pdf_engine()  # imports the PDF engine
+
+    # Same autoescape rules as Flask's environment for .html templates. The
+    # bytecode has its own directory: it is compiled by a different environment.
+    bytecode_cache = None
+    if bytecode_dir:
+        Path(bytecode_dir).mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(bytecode_dir)
+    _worker_env = Environment(
+        loader=FileSystemLoader(template_folder),
+        autoescape=select_autoescape(["html", "htm", "xml", "xhtml", "svg"]),
+        bytecode_cache=bytecode_cache,
+    )
+    for name in _worker_env.list_templates(filter_func=lambda n: n.startswith("resume/")):
+        _worker_env.get_template(name)
+
+
+def _warmup() -> None:
+    return None
+
+
+def _render_job(index: int, template_name: str, data: dict) -> bytes:
+    from app.services.export_service import html_to_pdf
+    if _started is not None:
+        _started[index] = time.time()
+    html_content = _worker_env.get_template(f"resume/{template_name}.html").render(**data)
+    return html_to_pdf(html_content)
+
+
+render_pool = RenderPool()
+atexit.register(render_pool.shutdown)
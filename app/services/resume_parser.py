@@ -3,6 +3,11 @@
 PDF extraction uses a fallback chain:
   1. pdfminer.six — good for standard text-based PDFs
   2. PyMuPDF (fitz) — often better for complex layouts, embedded fonts, edge cases
+  3. pdfplumber — good for structured/tabular data
+  4. pypdf — pure Python, often works when others fail
+
+The chain runs sequentially or as a concurrent race (``PDF_EXTRACT_MODE``),
+optionally re-ordered by each extractor's observed success rate and latency.
 
 DOCX uses python-docx — native text extraction, very reliable.
 
@@ -17,30 +22,136 @@ To add OCR for scanned PDFs (optional):
   Install Tesseract: https://github.com/tesseract-ocr/tesseract
   Then call _extract_pdf_ocr() when both extractors return empty.
 """
+import functools
 import io
 import logging
+import mmap
+import os
 import re
-from typing import Dict, List, Optional, Tuple
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+from app.services.metrics import metrics
 
 log = logging.getLogger(__name__)
 
+# Bump whenever extraction or parsing changes in a way that alters results;
+# cached parse results from other versions are discarded.
+PARSER_VERSION = "3"
+
+
+class ParseResult(NamedTuple):
+    data: dict
+    complete: bool   # False when no text was extracted or extraction was cut short
+
 
-def parse_resume_file(file_bytes: bytes, filename: str) -> dict:
-    """Parse a resume file and return structured data matching the ResumeModel format."""
+def parse_resume_file(file_bytes: "_FileData", filename: str) -> dict:
+    """Parse a resume file and return structured data matching the ResumeModel format.
+
+    ``file_bytes`` is either the raw bytes or a :class:`MappedFile` over a
+    spooled upload, which every extractor reads without copying it.
+    """
+    return parse_resume(file_bytes, filename).data
+
+
+def parse_resume(file_bytes: "_FileData", filename: str) -> ParseResult:
+    """Like :func:`parse_resume_file`, and also says whether the result is complete.
+
+    A degraded result (no text, or a race that hit ``PDF_EXTRACT_TIMEOUT``)
+    may come out differently next time and must not be cached.
+    """
     ext = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
     if ext == "pdf":
-        text = _extract_pdf_text(file_bytes)
+        text, complete = _extract_pdf_text(file_bytes)
     elif ext in ("docx", "doc"):
-        text = _extract_docx_text(file_bytes)
+        text, complete = _extract_docx_text(file_bytes), True
     else:
-        return {}
+        return ParseResult({}, True)
 
     if not text or not text.strip():
         log.warning("[resume_parser] No text extracted from %s (len=%d bytes)", filename, len(file_bytes))
-        return _empty_data()
+        return ParseResult(_empty_data(), False)
 
     log.info("[resume_parser] Extracted %d chars from %s", len(text), filename)
-    return _parse_text(text)
+    return ParseResult(_parse_text(text), complete)
+
+
+class MappedFile:
+    """Read-only memory map of a file on disk, shared by all extractors.
+
+    Extractors get independent read positions over the one mapping through
+    :func:`_open_stream`, and PyMuPDF opens ``path`` directly, so no extractor
+    holds its own in-memory copy of the upload.
+    """
+
+    def __init__(self, path: str, spool=None):
+        self.path = path
+        self._spool = spool  # temporary file backing ``path``, closed with the map
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        self.buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+
+    def __len__(self) -> int:
+        return len(self.buffer)
+
+    def close(self) -> None:
+        if isinstance(self.buffer, mmap.mmap):
+            try:
+                self.buffer.close()
+            except BufferError:
+                pass  # an abandoned extractor still holds a view; freed with it
+        self._file.close()
+        if self._spool is not None:
+            self._spool.close()
+
+    def __enter__(self) -> "MappedFile":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class _MappedReader(io.RawIOBase):
+    """File-like view with its own position over a shared buffer (no copy)."""
+
+    def __init__(self, buffer):
+        self._view = memoryview(buffer)
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        n = max(0, min(len(b), len(self._view) - self._pos))
+        b[:n] = self._view[self._pos:self._pos + n]
+        self._pos += n
+        return n
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: len(self._view)}[whence]
+        self._pos = max(0, base + offset)
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def close(self) -> None:
+        self._view.release()
+        super().close()
+
+
+_FileData = Union[bytes, MappedFile]
+
+
+def _open_stream(file_bytes: _FileData) -> io.BufferedIOBase:
+    if isinstance(file_bytes, MappedFile):
+        return io.BufferedReader(_MappedReader(file_bytes.buffer))
+    return io.BytesIO(file_bytes)
 
 
 def _empty_data() -> dict:
@@ -61,47 +172,191 @@ def _empty_data() -> dict:
 # Minimum chars to consider extraction successful (resumes typically have 200+ chars)
 _MIN_RESUME_CHARS = 80
 
-
-def _extract_pdf_text(file_bytes: bytes) -> str:
-    """Extract text from PDF using fallback chain: pdfminer → PyMuPDF → pdfplumber → pypdf."""
-    extractors = [
-        ("pdfminer", _extract_pdf_pdfminer),
-        ("PyMuPDF", _extract_pdf_pymupdf),
-        ("pdfplumber", _extract_pdf_pdfplumber),
-        ("pypdf", _extract_pdf_pypdf),
-    ]
+# PDF extraction strategy:
+#   "sequential" — try extractors one after another (lowest CPU per upload)
+#   "race"       — run them concurrently, first good result wins (lowest latency)
+# With adaptive ranking on, extractors are ordered by observed cost, so the
+# cheapest reliable one (usually PyMuPDF) goes first. It is off by default:
+# the stats are per process, so in sequential mode the same file can be
+# parsed by a different extractor (with different text) on each worker.
+PDF_EXTRACT_MODE      = os.environ.get("RESUME_PDF_EXTRACT_MODE", "sequential")
+PDF_EXTRACT_ADAPTIVE  = os.environ.get("RESUME_PDF_EXTRACT_ADAPTIVE", "0") == "1"
+PDF_EXTRACT_TIMEOUT   = float(os.environ.get("RESUME_PDF_EXTRACT_TIMEOUT", "20"))  # seconds, race mode
+PDF_EXTRACT_POOL_SIZE = int(os.environ.get("RESUME_PDF_EXTRACT_POOL_SIZE", "8"))
+
+
+@metrics.timed("extract_pdf")
+def _extract_pdf_text(file_bytes: "_FileData") -> Tuple[str, bool]:
+    """Extract text from PDF with the configured strategy (see ``PDF_EXTRACT_MODE``).
+
+    Returns the text and whether every extractor that was needed got to finish.
+    """
+    extractors = _PDF_EXTRACTORS
+    if PDF_EXTRACT_ADAPTIVE:
+        extractors = _extractor_stats.ranked(extractors)
+    if PDF_EXTRACT_MODE == "race":
+        return _extract_pdf_race(file_bytes, extractors)
+    return _extract_pdf_sequential(file_bytes, extractors), True
+
+
+def _extract_pdf_sequential(file_bytes: "_FileData", extractors) -> str:
+    """Try extractors one after another; return the first result that looks like a resume."""
     best = ""
     for name, fn in extractors:
-        try:
-            text = fn(file_bytes)
-            if text and len(text.strip()) >= _MIN_RESUME_CHARS:
-                log.info("[resume_parser] PDF extracted with %s (%d chars)", name, len(text))
-                return text.strip()
-            if text and len(text.strip()) > len(best.strip()):
-                best = text
-        except Exception as e:
-            log.debug("[resume_parser] %s failed: %s", name, e)
+        text, elapsed = _timed_extract(fn, file_bytes)
+        ok = len(text.strip()) >= _MIN_RESUME_CHARS
+        _extractor_stats.record(name, ok, elapsed)
+        if ok:
+            log.info("[resume_parser] PDF extracted with %s (%d chars)", name, len(text))
+            metrics.extractor_wins.inc(extractor=name)
+            return text.strip()
+        if text and len(text.strip()) > len(best.strip()):
+            best = text
     if best and best.strip():
         log.info("[resume_parser] Using best partial extraction (%d chars)", len(best.strip()))
+        metrics.extractor_wins.inc(extractor="partial")
         return best.strip()
+    metrics.extractor_wins.inc(extractor="none")
     return ""
 
 
-def _extract_pdf_pdfminer(file_bytes: bytes) -> str:
+def _extract_pdf_race(file_bytes: "_FileData", extractors) -> Tuple[str, bool]:
+    """Run all extractors concurrently; first result clearing ``_MIN_RESUME_CHARS`` wins.
+
+    Each extractor gets ``PDF_EXTRACT_TIMEOUT`` seconds. When nothing clears the
+    threshold by then, the longest partial result is used and the extraction is
+    reported incomplete. Losers are cancelled
+    if they have not started yet; running ones are abandoned (threads cannot be
+    interrupted) and still report their timing to the ranking stats when done.
+    """
+    pool = _race_pool()
+    futures = {}
+    for name, fn in extractors:
+        future = pool.submit(_timed_extract, fn, file_bytes)
+        future.add_done_callback(functools.partial(_record_race_result, name))
+        futures[future] = name
+
+    best = ""
+    deadline = time.monotonic() + PDF_EXTRACT_TIMEOUT
+    pending = set(futures)
+    try:
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                log.info("[resume_parser] PDF extractor race hit %.0fs deadline", PDF_EXTRACT_TIMEOUT)
+                break
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                text, _ = future.result()
+                if len(text.strip()) >= _MIN_RESUME_CHARS:
+                    log.info("[resume_parser] PDF extracted with %s (%d chars, race)",
+                             futures[future], len(text))
+                    metrics.extractor_wins.inc(extractor=futures[future])
+                    return text.strip(), True
+                if len(text.strip()) > len(best.strip()):
+                    best = text
+    finally:
+        for future in pending:
+            future.cancel()
+
+    complete = not pending
+    if best.strip():
+        log.info("[resume_parser] Using best partial extraction (%d chars)", len(best.strip()))
+        metrics.extractor_wins.inc(extractor="partial")
+        return best.strip(), complete
+    metrics.extractor_wins.inc(extractor="none")
+    return "", complete
+
+
+def _timed_extract(fn, file_bytes: "_FileData") -> Tuple[str, float]:
+    start = time.perf_counter()
+    try:
+        text = fn(file_bytes) or ""
+    except Exception as e:
+        log.debug("[resume_parser] %s failed: %s", getattr(fn, "__name__", fn), e)
+        text = ""
+    return text, time.perf_counter() - start
+
+
+def _record_race_result(name: str, future) -> None:
+    if future.cancelled():
+        return
+    text, elapsed = future.result()
+    _extractor_stats.record(name, len(text.strip()) >= _MIN_RESUME_CHARS, elapsed)
+
+
+_race_executor: Optional[ThreadPoolExecutor] = None
+_race_executor_lock = threading.Lock()
+
+
+def _race_pool() -> ThreadPoolExecutor:
+    global _race_executor
+    with _race_executor_lock:
+        if _race_executor is None:
+            _race_executor = ThreadPoolExecutor(
+                max_workers=PDF_EXTRACT_POOL_SIZE, thread_name_prefix="pdf-extract",
+            )
+        return _race_executor
+
+
+class _ExtractorStats:
+    """Observed success rate and latency per extractor, used to order the chain.
+
+    Extractors are ranked by expected cost — smoothed mean latency divided by
+    smoothed success rate — so a fast extractor that usually succeeds goes
+    first. Extractors with no observations yet rank ahead of the rest (keeping
+    their configured order) so every extractor gets measured at least once.
+    """
+
+    _ALPHA = 0.2  # weight of the newest latency sample
+
+    def __init__(self):
+        self._lock  = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def record(self, name: str, ok: bool, seconds: float) -> None:
+        with self._lock:
+            st = self._stats.setdefault(name, {"attempts": 0, "successes": 0, "latency": seconds})
+            st["attempts"]  += 1
+            st["successes"] += 1 if ok else 0
+            st["latency"]    = (1 - self._ALPHA) * st["latency"] + self._ALPHA * seconds
+
+    def ranked(self, extractors):
+        with self._lock:
+            def cost(item):
+                st = self._stats.get(item[0])
+                if st is None:
+                    return 0.0
+                success_rate = (st["successes"] + 1) / (st["attempts"] + 2)
+                return st["latency"] / success_rate
+            return sorted(extractors, key=cost)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {name: dict(st) for name, st in self._stats.items()}
+
+
+_extractor_stats = _ExtractorStats()
+
+
+def _extract_pdf_pdfminer(file_bytes: "_FileData") -> str:
     """Extract using pdfminer.six — good for standard text-based PDFs."""
     try:
         from pdfminer.high_level import extract_text
-        return extract_text(io.BytesIO(file_bytes)) or ""
+        return extract_text(_open_stream(file_bytes)) or ""
     except Exception as e:
         log.debug("[resume_parser] pdfminer failed: %s", e)
         return ""
 
 
-def _extract_pdf_pymupdf(file_bytes: bytes) -> str:
+def _extract_pdf_pymupdf(file_bytes: "_FileData") -> str:
     """Extract using PyMuPDF — often better for complex layouts, embedded fonts."""
     try:
         import fitz
-        doc = fitz.open(stream=file_bytes, filetype="pdf")
+        if isinstance(file_bytes, MappedFile):
+            doc = fitz.open(file_bytes.path, filetype="pdf")
+        else:
+            doc = fitz.open(stream=file_bytes, filetype="pdf")
         parts = []
         for page in doc:
             parts.append(page.get_text("text"))
@@ -115,11 +370,11 @@ def _extract_pdf_pymupdf(file_bytes: bytes) -> str:
         return ""
 
 
-def _extract_pdf_pdfplumber(file_bytes: bytes) -> str:
+def _extract_pdf_pdfplumber(file_bytes: "_FileData") -> str:
     """Extract using pdfplumber — good for structured/tabular data, built on pdfminer."""
     try:
         import pdfplumber
-        with pdfplumber.open(io.BytesIO(file_bytes)) as pdf:
+        with pdfplumber.open(_open_stream(file_bytes)) as pdf:
             parts = [page.extract_text() or "" for page in pdf.pages]
         return "\n".join(p for p in parts if p).strip()
     except ImportError:
@@ -130,11 +385,11 @@ def _extract_pdf_pdfplumber(file_bytes: bytes) -> str:
         return ""
 
 
-def _extract_pdf_pypdf(file_bytes: bytes) -> str:
+def _extract_pdf_pypdf(file_bytes: "_FileData") -> str:
     """Extract using pypdf — pure Python, often works when others fail."""
     try:
         from pypdf import PdfReader
-        reader = PdfReader(io.BytesIO(file_bytes))
+        reader = PdfReader(_open_stream(file_bytes))
         parts = []
         for page in reader.pages:
             t = page.extract_text()
@@ -149,10 +404,19 @@ def _extract_pdf_pypdf(file_bytes: bytes) -> str:
         return ""
 
 
-def _extract_docx_text(file_bytes: bytes) -> str:
+_PDF_EXTRACTORS = [
+    ("pdfminer", _extract_pdf_pdfminer),
+    ("PyMuPDF", _extract_pdf_pymupdf),
+    ("pdfplumber", _extract_pdf_pdfplumber),
+    ("pypdf", _extract_pdf_pypdf),
+]
+
+
+@metrics.timed("extract_docx")
+def _extract_docx_text(file_bytes: "_FileData") -> str:
     try:
         from docx import Document
-        doc = Document(io.BytesIO(file_bytes))
+        doc = Document(_open_stream(file_bytes))
         return "\n".join(p.text for p in doc.paragraphs)
     except Exception:
         return ""
@@ -199,9 +463,106 @@ _LOCATION_RE = re.compile(
     r"\b([A-Z][a-z]+(?:\s[A-Z][a-z]+)?),\s*([A-Z]{2}|[A-Z][a-z]+(?:\s[A-Z][a-z]+)?)\b"
 )
 
+# ── Line lexer patterns ───────────────────────────────────────────────────────
+# A line is a section header when it starts with one of the section keywords.
+# One alternation group per section, in _SECTIONS order, so the first section
+# with a matching keyword wins — the same precedence as checking them in turn.
+_SECTION_HEADER_RE = re.compile(
+    "|".join(
+        f"(?P<{key}>{'|'.join(re.escape(k) for k in keywords)})"
+        for key, keywords in _SECTIONS.items()
+    )
+)
+
+_EMAIL_RE     = re.compile(r"[\w.+\-]+@[\w\-]+\.[a-zA-Z]{2,}")
+_PHONE_RE     = re.compile(r"(\+?\d[\d\s\-(). ]{7,}\d)")
+_PHONE_CODE_RE = re.compile(r"^(\+\d{1,4})\s*(.+)$")
+_LINKEDIN_RE  = re.compile(r"linkedin\.com/in/[\w\-]+", re.IGNORECASE)
+_WEBSITE_RE   = re.compile(r"https?://(?!linkedin)[\w\-./]+", re.IGNORECASE)
+_NAME_REJECT_RE  = re.compile(r"[@/+|•:\d]")
+_TITLE_REJECT_RE = re.compile(r"[@|•·\d]")
+_TITLE_SYMBOL_RE = re.compile(r"[@/+|•:]")
+_YEAR_RE         = re.compile(r"\b\d{4}\b")
+_DIGITS4_RE      = re.compile(r"\d{4}")   # every _DATE_RE match contains one; cheap pre-check
+_SKILL_SPLIT_RE  = re.compile(r"[,|•·\n/]")
+
+
+class _Line(NamedTuple):
+    """One non-empty input line, classified once by :func:`_lex`.
+
+    ``is_date`` is only computed for lines inside an experience section and
+    ``has_year`` only for lines inside an education section — the only places
+    the section parsers look at them.
+    """
+    text: str
+    section: Optional[str] = None   # section key when the line is a header
+    is_date: bool = False           # matches _DATE_RE (experience entries)
+    has_year: bool = False          # short line with a 4-digit year (education entries)
+
+
+def _lex(text: str) -> Tuple[List[_Line], Dict[str, str], Dict[str, List[_Line]]]:
+    """Single pass over the lines of ``text``.
+
+    Returns the classified lines, the first raw match of each contact token
+    (email, phone, linkedin, website), and the body lines of each section.
+    As before, a section that appears twice keeps only its last occurrence.
+    """
+    records: List[_Line] = []
+    contacts: Dict[str, str] = {}
+    sections: Dict[str, List[_Line]] = {}
+    current: Optional[List[_Line]] = None
+    current_key: Optional[str] = None
+
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line:
+            continue
+        lower = line.lower()
+
+        # Contact tokens — first occurrence of each wins. Cheap substring
+        # checks keep the regexes off lines that cannot match.
+        if "email" not in contacts and "@" in line:
+            m = _EMAIL_RE.search(line)
+            if m:
+                contacts["email"] = m.group(0)
+        if "phone" not in contacts:
+            m = _PHONE_RE.search(line)
+            if m:
+                contacts["phone"] = m.group(0)
+        if "linkedin" not in contacts and "linkedin" in lower:
+            m = _LINKEDIN_RE.search(line)
+            if m:
+                contacts["linkedin"] = m.group(0)
+        if "website" not in contacts and "http" in lower:
+            m = _WEBSITE_RE.search(line)
+            if m:
+                contacts["website"] = m.group(0)
+
+        header = _SECTION_HEADER_RE.match(lower.rstrip(":").strip())
+        if header:
+            current_key = header.lastgroup
+            current = sections[current_key] = []
+            records.append(_Line(line, section=current_key))
+            continue
+
+        if current_key == "experience":
+            is_date = bool(_DIGITS4_RE.search(line)) and bool(_DATE_RE.search(line))
+            record = _Line(line, is_date=is_date)
+        elif current_key == "education":
+            record = _Line(line, has_year=len(line) < 50 and bool(_YEAR_RE.search(line)))
+        else:
+            record = _Line(line)
+        records.append(record)
+        if current is not None:
+            current.append(record)
+
+    return records, contacts, sections
+
 
+@metrics.timed("parse_text")
 def _parse_text(text: str) -> dict:
-    lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
+    records, tokens, section_content = _lex(text)
+    lines = [r.text for r in records[:12]]
 
     data: Dict = {
         "contacts": {"phoneCode": "+1"},
@@ -217,28 +578,24 @@ def _parse_text(text: str) -> dict:
     }
 
     # ── Contact fields ─────────────────────────────────────────────────────────
-    email_m = re.search(r"[\w.+\-]+@[\w\-]+\.[a-zA-Z]{2,}", text)
-    if email_m:
-        data["contacts"]["email"] = email_m.group(0)
-
-    phone_m = re.search(r"(\+?\d[\d\s\-(). ]{7,}\d)", text)
-    if phone_m:
-        raw = phone_m.group(0).strip()
-        code_m = re.match(r"^(\+\d{1,4})\s*(.+)$", raw)
+    if "email" in tokens:
+        data["contacts"]["email"] = tokens["email"]
+
+    if "phone" in tokens:
+        raw = tokens["phone"].strip()
+        code_m = _PHONE_CODE_RE.match(raw)
         if code_m:
             data["contacts"]["phoneCode"] = code_m.group(1)
             data["contacts"]["phone"] = code_m.group(2).strip()
         else:
             data["contacts"]["phone"] = raw
 
-    linkedin_m = re.search(r"linkedin\.com/in/[\w\-]+", text, re.IGNORECASE)
-    if linkedin_m:
-        url = linkedin_m.group(0)
+    if "linkedin" in tokens:
+        url = tokens["linkedin"]
         data["contacts"]["linkedin"] = url if url.startswith("http") else f"https://{url}"
 
-    web_m = re.search(r"https?://(?!linkedin)[\w\-./]+", text, re.IGNORECASE)
-    if web_m:
-        data["contacts"]["website"] = web_m.group(0).rstrip("/.,")
+    if "website" in tokens:
+        data["contacts"]["website"] = tokens["website"].rstrip("/.,")
 
     # ── Name + Job Title heuristic ─────────────────────────────────────────────
     # Look in the first 8 lines for:
@@ -248,7 +605,7 @@ def _parse_text(text: str) -> dict:
     for i, line in enumerate(lines[:8]):
         words = line.split()
         if (2 <= len(words) <= 5
-                and not re.search(r"[@/+|•:\d]", line)
+                and not _NAME_REJECT_RE.search(line)
                 and all(w[0].isupper() for w in words if w)):
             data["contacts"]["firstName"] = words[0].title()
             data["contacts"]["lastName"] = words[-1].title()
@@ -264,61 +621,46 @@ def _parse_text(text: str) -> dict:
 
     for line in candidate_lines:
         # Skip lines that look like contact info
-        if re.search(r"[@|•·\d]", line) or len(line) > 60:
+        if _TITLE_REJECT_RE.search(line) or len(line) > 60:
             continue
         if _JOB_TITLE_KEYWORDS.search(line):
             data["contacts"]["jobTitle"] = line.strip()
             break
         # If it's a short line right after the name with Title Case, treat it as job title
         if (name_idx is not None and not data["contacts"].get("jobTitle")
-                and len(line.split()) <= 6 and not re.search(r"[@/+|•:]", line)):
+                and len(line.split()) <= 6 and not _TITLE_SYMBOL_RE.search(line)):
             data["contacts"]["jobTitle"] = line.strip()
 
     # ── Location ───────────────────────────────────────────────────────────────
     # Check header lines (before first section) for "City, State" or "City, Country"
-    loc_search_text = "\n".join(lines[:12])
-    loc_m = _LOCATION_RE.search(loc_search_text)
+    loc_m = _LOCATION_RE.search("\n".join(lines))
     if loc_m:
         data["contacts"]["city"]    = loc_m.group(1).strip()
         data["contacts"]["country"] = loc_m.group(2).strip()
 
-    # ── Locate section boundaries ──────────────────────────────────────────────
-    section_starts: List[Tuple[int, str]] = []
-    for i, line in enumerate(lines):
-        lower = line.lower().rstrip(":").strip()
-        for key, keywords in _SECTIONS.items():
-            if lower in keywords or any(lower.startswith(k) for k in keywords):
-                section_starts.append((i, key))
-                break
-
-    section_content: Dict[str, List[str]] = {}
-    for idx, (start, key) in enumerate(section_starts):
-        end = section_starts[idx + 1][0] if idx + 1 < len(section_starts) else len(lines)
-        section_content[key] = lines[start + 1 : end]
-
     # ── Summary ────────────────────────────────────────────────────────────────
     if "summary" in section_content:
-        data["summary"] = " ".join(section_content["summary"])
+        data["summary"] = " ".join(r.text for r in section_content["summary"])
 
     # ── Skills ────────────────────────────────────────────────────────────────
     if "skills" in section_content:
-        raw = " ".join(section_content["skills"])
-        skills = [s.strip() for s in re.split(r"[,|•·\n/]", raw) if len(s.strip()) > 2]
+        raw = " ".join(r.text for r in section_content["skills"])
+        skills = [s.strip() for s in _SKILL_SPLIT_RE.split(raw) if len(s.strip()) > 2]
         data["skills"] = skills[:20]
 
     # ── Certifications ────────────────────────────────────────────────────────
     if "certifications" in section_content:
-        data["certifications"] = " · ".join(section_content["certifications"])
+        data["certifications"] = " · ".join(r.text for r in section_content["certifications"])
 
     # ── Awards ────────────────────────────────────────────────────────────────
     if "awards" in section_content:
-        data["awards"] = " ".join(section_content["awards"])
+        data["awards"] = " ".join(r.text for r in section_content["awards"])
 
     # ── Languages ─────────────────────────────────────────────────────────────
     if "languages" in section_content:
-        for lang_line in section_content["languages"]:
-            if lang_line and len(lang_line) > 1:
-                data["languages"].append({"name": lang_line, "level": 3})
+        for r in section_content["languages"]:
+            if len(r.text) > 1:
+                data["languages"].append({"name": r.text, "level": 3})
 
     # ── Experience ────────────────────────────────────────────────────────────
     if "experience" in section_content:
@@ -331,43 +673,43 @@ def _parse_text(text: str) -> dict:
     return data
 
 
-def _parse_experience(lines: List[str]) -> List[Dict]:
+def _parse_experience(lines: List[_Line]) -> List[Dict]:
     entries: List[Dict] = []
     current: Optional[Dict] = None
 
     for line in lines:
-        if _DATE_RE.search(line):
+        if line.is_date:
             if current:
                 entries.append(current)
-            current = {"dates": line, "role": "", "company": "", "description": ""}
+            current = {"dates": line.text, "role": "", "company": "", "description": ""}
         elif current:
             if not current["role"]:
-                current["role"] = line
+                current["role"] = line.text
             elif not current["company"]:
-                current["company"] = line
+                current["company"] = line.text
             else:
                 sep = " " if current["description"] else ""
-                current["description"] += sep + line
+                current["description"] += sep + line.text
 
     if current:
         entries.append(current)
     return entries
 
 
-def _parse_education(lines: List[str]) -> List[Dict]:
+def _parse_education(lines: List[_Line]) -> List[Dict]:
     entries: List[Dict] = []
     current: Optional[Dict] = None
 
     for line in lines:
-        if re.search(r"\b\d{4}\b", line) and len(line) < 50:
+        if line.has_year:
             if current:
                 entries.append(current)
-            current = {"school": "", "degree": "", "dates": line}
+            current = {"school": "", "degree": "", "dates": line.text}
         elif current:
             if not current["school"]:
-                current["school"] = line
+                current["school"] = line.text
             elif not current["degree"]:
-                current["degree"] = line
+                current["degree"] = line.text
 
     if current:
         entries.append(current)
@@ -0,0 +1,247 @@
+"""Thumbnails — first-page images of saved resumes and of the template gallery.
+
+After a resume is saved, a background thread renders it to PDF (bypassing
+the export cache, which would otherwise fill up with every saved version)
+and rasterizes page one with PyMuPDF (WebP through Pillow when available,
+PNG otherwise). Thumbnails yield to exports: a render waits up to
+``THUMBNAIL_IDLE_WAIT`` seconds for an idle render-pool worker and is dropped
+if none frees up (or the pool turns it away); the dashboard queues it again
+on the next visit. Without a render pool (``PDF_RENDER_WORKERS=0``) resume
+thumbnails are not rendered at all: conversion would hold the GIL in the
+web process. File names carry the content hash, so the URLs never change
+meaning and are served with immutable cache headers. Gallery thumbnails, one
+per template id in ``TEMPLATE_TO_HTML`` rendered from the default resume, are
+built at deploy time with ``flask thumbnails-gallery``.
+"""
+import atexit
+import hashlib
+import importlib.util
+import io
+import json
+import logging
+import os
+
+import click
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+from flask import url_for
+
+log = logging.getLogger(__name__)
+
+
+class ThumbnailService:
+    """Background thumbnail renderer and file store; configured by :meth:`init_app`."""
+
+    def __init__(self):
+        self.enabled   = False
+        self.root      = None
+        self.width     = 400
+        self.format    = "png"
+        self.workers   = 1
+        self.idle_wait = 30.0
+        self._app      = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending  = set()
+        self._lock     = threading.Lock()
+        self._gallery  = (None, {})   # (manifest mtime, {template_id: file name})
+
+    def init_app(self, app) -> None:
+        self.enabled   = bool(app.config.get("THUMBNAILS_ENABLED", True))
+        self.root      = str(app.config.get("THUMBNAIL_DIR"))
+        self.width     = int(app.config.get("THUMBNAIL_WIDTH", 400))
+        self.workers   = max(1, int(app.config.get("THUMBNAIL_WORKERS", 1)))
+        self.idle_wait = float(app.config.get("THUMBNAIL_IDLE_WAIT", 30))
+        self.format    = str(app.config.get("THUMBNAIL_FORMAT", "webp")).lower()
+        if self.format == "webp" and importlib.util.find_spec("PIL") is None:  # Pillow is optional
+            log.info("[thumbnails] Pillow not installed; writing PNG thumbnails")
+            self.format = "png"
+        self._app = app
+
+        @app.cli.command("thumbnails-gallery")
+        def build_gallery_command():
+            """Pre-render one gallery thumbnail per resume template."""
+            manifest = self.build_gallery()
+            click.echo(f"Wrote {len(manifest)} gallery thumbnails to {self._gallery_dir()}")
+
+    # ── Resume thumbnails ─────────────────────────────────────────────────────
+
+    def resume_dir(self, resume_id: int) -> str:
+        return os.path.join(self.root, "resumes", str(resume_id))
+
+    def _resume_name(self, version: str) -> str:
+        return f"{version[:16]}.{self.format}"
+
+    def resume_url(self, resume) -> Optional[str]:
+        """URL of the thumbnail for the resume's current content, or None if not rendered yet."""
+        if not self.enabled:
+            return None
+        name = self._resume_name(resume.etag)
+        if not os.path.exists(os.path.join(self.resume_dir(resume.id), name)):
+            return None
+        return url_for("pages.resume_thumbnail", resume_id=resume.id, name=name)
+
+    def enqueue(self, resume_id: int, version: str) -> None:
+        """Render the thumbnail for ``resume_id`` at content ``version`` in the background."""
+        from app.services.render_pool import render_pool
+
+        if not self.enabled or not render_pool.enabled:
+            return
+        if os.path.exists(os.path.join(self.resume_dir(resume_id), self._resume_name(version))):
+            return
+        with self._lock:
+            if (resume_id, version) in self._pending:
+                return
+            self._pending.add((resume_id, version))
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="thumbnails")
+            self._executor.submit(self._render_resume, resume_id, version)
+
+    def _render_resume(self, resume_id: int, version: str) -> None:
+        from app.models.resume_db import Resume
+        from app.models.user import db
+        from app.services.render_pool import RenderPoolBusy
+
+        try:
+            with self._app.app_context():
+                resume = db.session.get(Resume, resume_id)
+                if resume is None or resume.etag != version:
+                    return  # deleted or saved again since; that save queued its own render
+                if not self._wait_for_idle_pool():
+                    log.info("[thumbnails] Render pool busy; skipped resume %s thumbnail", resume_id)
+                    return
+                try:
+                    pdf_bytes = _render_pdf(resume.data)
+                except RenderPoolBusy:
+                    log.info("[thumbnails] Render pool busy; skipped resume %s thumbnail", resume_id)
+                    return
+                image = rasterize(pdf_bytes, self.width, self.format)
+            directory = self.resume_dir(resume_id)
+            name = self._resume_name(version)
+            _atomic_write(os.path.join(directory, name), image)
+            for old in os.listdir(directory):
+                if old != name and not old.startswith("."):
+                    _unlink(os.path.join(directory, old))
+        except Exception as exc:
+            log.warning("[thumbnails] Resume %s thumbnail failed: %s", resume_id, exc)
+        finally:
+            with self._lock:
+                self._pending.discard((resume_id, version))
+
+    def _wait_for_idle_pool(self) -> bool:
+        from app.services.render_pool import render_pool
+
+        deadline = time.monotonic() + self.idle_wait
+        while not render_pool.has_idle_worker():
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.25)
+        return True
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    # ── Template gallery ──────────────────────────────────────────────────────
+
+    def _gallery_dir(self) -> str:
+        return os.path.join(self.root, "gallery")
+
+    def gallery_path(self, name: str) -> str:
+        return os.path.join(self._gallery_dir(), name)
+
+    def build_gallery(self) -> Dict[str, str]:
+        """Render every template from the default resume; return ``{template_id: file name}``.
+
+        Must run inside an app context.
+        """
+        from app.models.resume import ResumeModel
+        from app.services.export_service import TEMPLATE_TO_HTML
+
+        manifest = {}
+        for template_id in TEMPLATE_TO_HTML:
+            data = ResumeModel.default_data()
+            data["template"] = template_id
+            image = rasterize(_render_pdf(data), self.width, self.format)
+            name = f"{template_id}-{hashlib.sha256(image).hexdigest()[:12]}.{self.format}"
+            _atomic_write(self.gallery_path(name), image)
+            manifest[template_id] = name
+
+        _atomic_write(self.gallery_path("manifest.json"), json.dumps(manifest, indent=2).encode("utf-8"))
+        keep = set(manifest.values()) | {"manifest.json"}
+        for old in os.listdir(self._gallery_dir()):
+            if old not in keep and not old.startswith("."):
+                _unlink(self.gallery_path(old))
+        return manifest
+
+    def gallery_urls(self) -> Dict[str, str]:
+        """``{template_id: url}`` from the gallery manifest; empty until it has been built."""
+        path = self.gallery_path("manifest.json")
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except (OSError, TypeError):
+            return {}
+        if self._gallery[0] != mtime:
+            try:
+                with open(path, encoding="utf-8") as f:
+                    self._gallery = (mtime, json.load(f))
+            except (OSError, ValueError) as exc:
+                log.warning("[thumbnails] Unreadable gallery manifest: %s", exc)
+                return {}
+        return {
+            template_id: url_for("pages.gallery_thumbnail", name=name)
+            for template_id, name in self._gallery[1].items()
+        }
+
+
+def _render_pdf(data: dict) -> bytes:
+    """PDF bytes for ``data``, through the render pool when enabled but never the export cache."""
+    from app.services import export_service
+
+    export_service._require_pdf_engine()
+    return export_service._render_pdf(export_service._template_name(data), data)
+
+
+def rasterize(pdf_bytes: bytes, width: int, fmt: str = "png") -> bytes:
+    """Render the first page of a PDF to an image ``width`` pixels wide."""
+    import pymupdf
+
+    with pymupdf.open(stream=pdf_bytes, filetype="pdf") as doc:
+        page = doc[0]
+        zoom = width / page.rect.width
+        pix = page.get_pixmap(matrix=pymupdf.Matrix(zoom, zoom), alpha=False)
+        if fmt == "webp":
+            from PIL import Image
+
+            buffer = io.BytesIO()
+            Image.frombytes("RGB", (pix.width, pix.height), pix.samples).save(buffer, "WEBP", quality=80, method=4)
+            return buffer.getvalue()
+        return pix.tobytes("png")
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        _unlink(tmp)
+        raise
+
+
+def _unlink(path: str) -> None:
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+thumbnails = ThumbnailService()
+atexit.register(thumbnails.shutdown)
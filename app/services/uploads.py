@@ -0,0 +1,64 @@
+"""Upload handling — stream multipart files to disk and map them for parsing.
+
+``UploadRequest`` (installed as ``app.request_class``) makes Werkzeug write
+every uploaded file part straight into a named temporary file while the body
+streams in, instead of buffering small files in memory. ``open_upload`` then
+memory-maps that file so the resume extractors share one read-only mapping.
+Together with ``MAX_CONTENT_LENGTH`` / ``enforce_upload_limit`` this keeps
+peak memory per upload flat regardless of file size or concurrency.
+"""
+import shutil
+import tempfile
+
+from flask import Request, current_app, g, request
+from werkzeug.datastructures import FileStorage
+from werkzeug.exceptions import RequestEntityTooLarge
+
+from app.services.resume_parser import MappedFile
+
+# Room for multipart boundaries, headers and small form fields on top of the file.
+_MULTIPART_OVERHEAD = 64 * 1024
+
+
+class UploadRequest(Request):
+    """Request whose uploaded files are spooled to named temporary files."""
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        # Deleted when Flask closes the request's files at teardown.
+        return tempfile.NamedTemporaryFile("w+b", prefix="upload-")
+
+
+def enforce_upload_limit(max_bytes: int = None) -> None:
+    """Reject an upload request larger than ``max_bytes`` before its body is read.
+
+    A declared Content-Length over the limit fails immediately. Otherwise the
+    limit is applied to the body as it streams in (including chunked bodies),
+    so an oversized upload is cut off instead of being spooled in full.
+
+    The limit is kept in ``g.upload_limit`` so a 413 can report it.
+
+    Raises:
+        RequestEntityTooLarge: when the request is over the limit.
+    """
+    max_bytes = max_bytes or current_app.config["MAX_UPLOAD_BYTES"]
+    g.upload_limit = max_bytes
+    limit = max_bytes + _MULTIPART_OVERHEAD
+    if request.content_length is not None and request.content_length > limit:
+        raise RequestEntityTooLarge()
+    request.max_content_length = limit
+
+
+def open_upload(file: FileStorage) -> MappedFile:
+    """Return a :class:`MappedFile` over an uploaded file without reading it into memory."""
+    stream = file.stream
+    path = getattr(stream, "name", None)
+    if isinstance(path, str):
+        stream.flush()
+        return MappedFile(path)
+
+    # Uploads that did not come through UploadRequest: spool them here.
+    spool = tempfile.NamedTemporaryFile("w+b", prefix="upload-")
+    stream.seek(0)
+    shutil.copyfileobj(stream, spool, 1024 * 1024)
+    spool.flush()
+    return MappedFile(spool.name, spool=spool)
@@ -0,0 +1,67 @@
+"""User cache — Flask-Login's ``user_loader`` without a users-table query per request.
+
+Every authenticated request loads ``current_user``. The cache keeps a
+:class:`~app.models.user.UserSnapshot` per user id for ``USER_CACHE_TTL``
+seconds in a bounded LRU. ``app/controllers/auth.py`` drops a user's entry
+whenever it changes their row; other worker processes see the change once
+their entry expires.
+"""
+import threading
+import time
+from typing import Optional
+
+from app.models.user import User, UserSnapshot, db
+from app.services.cache import LRUCache
+
+
+class UserCache:
+    """Per-process TTL + LRU cache of user snapshots; configured by :meth:`init_app`."""
+
+    def __init__(self):
+        self.enabled = False
+        self.ttl     = 60.0
+        self.memory  = LRUCache(max_entries=0)
+        self.hits    = 0
+        self.misses  = 0
+        self._lock   = threading.Lock()
+
+    def init_app(self, app) -> None:
+        self.enabled = bool(app.config.get("USER_CACHE_ENABLED", True))
+        self.ttl     = float(app.config.get("USER_CACHE_TTL", 60))
+        self.memory  = LRUCache(max_entries=app.config.get("USER_CACHE_MAX_ENTRIES", 1024))
+
+    def load(self, user_id: int) -> Optional[UserSnapshot]:
+        """The user's snapshot, from the cache while fresh; None if there is no such user."""
+        if not self.enabled:
+            user = db.session.get(User, user_id)
+            return user.snapshot() if user is not None else None
+
+        entry = self.memory.get(user_id)
+        hit = entry is not None and entry[0] > time.monotonic()
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if hit:
+            return entry[1]
+
+        user = db.session.get(User, user_id)
+        if user is None:
+            self.memory.pop(user_id)
+            return None
+        snapshot = user.snapshot()
+        self.memory.put(user_id, (time.monotonic() + self.ttl, snapshot))
+        return snapshot
+
+    def invalidate(self, user_id: int) -> None:
+        self.memory.pop(user_id)
+
+    def stats(self) -> dict:
+        stats = self.memory.stats()
+        with self._lock:
+            stats["hits"], stats["misses"] = self.hits, self.misses
+        return stats
+
+
+user_cache = UserCache()
@@ -16,6 +16,12 @@ const TAG_MAP = {
   'Starter':        { cols: '1', photo: false, style: ['professional','starter'] },
 };
 
+// Pre-rendered gallery thumbnails ({ templateId: url }), built with `flask thumbnails-gallery`
+const GALLERY_THUMBS = (() => {
+  const el = document.getElementById('gallery-thumbnails');
+  try { return el ? JSON.parse(el.textContent) : {}; } catch (e) { return {}; }
+})();
+
 // ── State ──────────────────────────────────────────────────────────────────
 let selectedTemplate = null;
 let selectedAccent   = null;
@@ -103,8 +109,8 @@ Object.keys(TEMPLATE_REGISTRY).forEach(id => {
       swatches.querySelectorAll('.ct-swatch').forEach(s => s.classList.remove('active'));
       sw.classList.add('active');
       // Re-render thumbnail with new color
-      const sample = getTemplateSample(id);
-      inner.innerHTML = renderResume(sample, id, { accent: color, font:'sans-serif', spacing:'1.4' });
+      const item = cards.find(c => c.id === id);
+      if (item) renderCard(item);
     });
     swatches.appendChild(sw);
   });
@@ -140,11 +146,17 @@ const CT_RENDER_W = 595, CT_RENDER_H = 842;  // screen-pixel A4 — always scale
 
 function renderCard(item) {
   item.rendered = true;
+  const palette = ACCENT_PALETTES.default;
+  const accent  = item.card.querySelector('.ct-swatch.active')?.dataset.color || palette[0];
+  // Default accent: show the static thumbnail instead of rendering the template live
+  if (GALLERY_THUMBS[item.id] && accent === palette[0]) {
+    item.inner.style.cssText = 'position:absolute;inset:0;pointer-events:none';
+    item.inner.innerHTML = `<img src="${GALLERY_THUMBS[item.id]}" alt="" loading="lazy" decoding="async" style="width:100%;height:100%;object-fit:contain;display:block">`;
+    return;
+  }
   const tw = item.thumb.offsetWidth  || 220;
   const th = item.thumb.offsetHeight || 311;  // 220 * 842/595 ≈ 311
   const scale   = Math.min(tw / CT_RENDER_W, th / CT_RENDER_H);
-  const palette = ACCENT_PALETTES.default;
-  const accent  = item.card.querySelector('.ct-swatch.active')?.dataset.color || palette[0];
   const sample  = getTemplateSample(item.id);
   item.inner.style.cssText = [
     `width:${CT_RENDER_W}px`, `height:${CT_RENDER_H}px`,
@@ -156,7 +168,7 @@ function renderCard(item) {
 
 window.addEventListener('resize', () => {
   cards.forEach(item => {
-    if (!item.rendered) return;
+    if (!item.rendered || item.inner.firstElementChild?.tagName === 'IMG') return;
     const tw = item.thumb.offsetWidth  || 220;
     const th = item.thumb.offsetHeight || 311;
     const scale = Math.min(tw / CT_RENDER_W, th / CT_RENDER_H);
@@ -12,6 +12,9 @@
       awards: '',
       additional: ''
     };
+    // Last state the server confirmed, so saves can send a JSON Patch of the edits only.
+    let savedEtag = null;
+    let savedSnapshot = null;
     const STEP_LABELS = ['Contacts', 'Experience', 'Education', 'Skills', 'Summary', 'Finalize'];
     let currentStep = 0;
     let currentTemplate = 'classic';
@@ -734,11 +737,7 @@
       data.awards = document.getElementById('awards')?.value || '';
       data.template = currentTemplate;
       try {
-        await fetch(resumeApiUrl, {
-          method: 'POST',
-          headers: { 'Content-Type': 'application/json' },
-          body: JSON.stringify(data)
-        });
+        await persistResume();
       } catch (e) {
         console.warn('[editor] Save before redirect failed:', e);
       }
@@ -803,18 +802,62 @@
       data.awards = document.getElementById('awards')?.value || '';
       data.template = currentTemplate;
       try {
-        const res = await fetch(resumeApiUrl, {
-          method: 'POST',
-          headers: { 'Content-Type': 'application/json' },
-          body: JSON.stringify(data)
-        });
+        const res = await persistResume();
         if (res.ok) alert('Resume saved!');
+        else if (res.status === 412 || res.status === 409) {
+          alert('This resume was changed in another window. Reload the page to get the latest version.');
+        }
         else alert('Failed to save.');
       } catch (e) {
         alert('Failed to save: ' + e.message);
       }
     });
 
+    // RFC 6902 operations that turn `from` into `to` (arrays of a new length are replaced whole).
+    function jsonPatchDiff(from, to, path = '', ops = []) {
+      const isObj = v => v !== null && typeof v === 'object';
+      if (Array.isArray(from) && Array.isArray(to) && from.length === to.length) {
+        to.forEach((v, i) => jsonPatchDiff(from[i], v, `${path}/${i}`, ops));
+      } else if (isObj(from) && isObj(to) && !Array.isArray(from) && !Array.isArray(to)) {
+        const esc = k => k.replace(/~/g, '~0').replace(/\//g, '~1');
+        Object.keys(from).forEach(k => { if (!(k in to)) ops.push({ op: 'remove', path: `${path}/${esc(k)}` }); });
+        Object.keys(to).forEach(k => {
+          if (to[k] === undefined) return;
+          if (!(k in from)) ops.push({ op: 'add', path: `${path}/${esc(k)}`, value: to[k] });
+          else jsonPatchDiff(from[k], to[k], `${path}/${esc(k)}`, ops);
+        });
+      } else if (JSON.stringify(from) !== JSON.stringify(to)) {
+        ops.push({ op: 'replace', path, value: to });
+      }
+      return ops;
+    }
+
+    // Save `data`: a conditional PATCH of the changes when the server state is known, a full POST otherwise.
+    async function persistResume() {
+      const body = JSON.parse(JSON.stringify(data));
+      let res;
+      if (savedEtag && savedSnapshot) {
+        const ops = jsonPatchDiff(savedSnapshot, body);
+        if (!ops.length) return { ok: true, status: 200 };
+        res = await fetch(resumeApiUrl, {
+          method: 'PATCH',
+          headers: { 'Content-Type': 'application/json-patch+json', 'If-Match': savedEtag },
+          body: JSON.stringify(ops),
+        });
+      } else {
+        res = await fetch(resumeApiUrl, {
+          method: 'POST',
+          headers: { 'Content-Type': 'application/json' },
+          body: JSON.stringify(body),
+        });
+      }
+      if (res.ok) {
+        savedEtag = res.headers.get('ETag');
+        savedSnapshot = savedEtag ? body : null;
+      }
+      return res;
+    }
+
     function migrateData(loaded) {
       const c = loaded.contacts || {};
       if (!c.firstName && !c.lastName && c.name) {
@@ -957,11 +1000,7 @@
 
             // Persist to backend so refresh and future visits load this data
             try {
-              await fetch(resumeApiUrl, {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify(data),
-              });
+              await persistResume();
             } catch (_) { /* non-fatal */ }
 
             const c    = parsedData.contacts || {};
@@ -1001,7 +1040,11 @@
       try {
         const res = await fetch(resumeApiUrl);
         if (!res.ok) throw new Error(`HTTP ${res.status}`);
-        applyLoadedData(await res.json());
+        const loaded = await res.json();
+        const snapshot = JSON.parse(JSON.stringify(loaded));
+        applyLoadedData(loaded);
+        savedEtag = res.headers.get('ETag');
+        savedSnapshot = savedEtag ? snapshot : null;
       } catch (e) {
         console.warn('[editor] Could not load saved resume:', e);
         applyLoadedData(blankData());
@@ -337,15 +337,25 @@
       if (activeCard) activeCard.classList.add('active');
     }
 
+    let savedEtag = null;
+
     async function saveTemplate() {
       data.template = currentTemplate;
-      try { await fetch(resumeApiUrl, { method:'POST', headers:{'Content-Type':'application/json'}, body:JSON.stringify(data) }); }
+      try {
+        // Only the template changes here, so send a one-operation JSON Patch when the revision is known.
+        const res = savedEtag
+          ? await fetch(resumeApiUrl, { method:'PATCH', headers:{'Content-Type':'application/json-patch+json','If-Match':savedEtag}, body:JSON.stringify([{ op:'add', path:'/template', value:currentTemplate }]) })
+          : await fetch(resumeApiUrl, { method:'POST', headers:{'Content-Type':'application/json'}, body:JSON.stringify(data) });
+        if (res.ok) savedEtag = res.headers.get('ETag');
+        else console.warn('Save failed: HTTP', res.status);
+      }
       catch(e) { console.warn('Save failed:', e); }
     }
 
     async function loadData() {
       try {
         const res = await fetch(resumeApiUrl);
+        savedEtag = res.headers.get('ETag');
         data = await res.json();
         if (data.template) currentTemplate = data.template;
       } catch(e) {
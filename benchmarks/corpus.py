@@ -0,0 +1,102 @@
+"""Synthetic resume data for benchmarks.
+
+Everything is derived from a seeded ``random.Random``, so a given seed always
+produces the same resumes (and, through the app's own exporters, the same
+PDF/DOCX corpus).
+"""
+import os
+import random
+
+# Benchmarks measure the code paths themselves: render inline, skip caches and
+# background workers. Must be set before ``app.config`` is imported.
+BENCH_ENV = {
+    "PDF_RENDER_WORKERS": "0",
+    "EXPORT_CACHE_ENABLED": "0",
+    "EXPORT_JOB_WORKERS": "0",
+    "PARSE_CACHE_ENABLED": "0",
+    "THUMBNAILS_ENABLED": "0",
+}
+
+FIRST_NAMES = ["Maria", "James", "Aiko", "Carlos", "Priya", "Liam", "Fatima", "Noah", "Elena", "Kwame"]
+LAST_NAMES  = ["Santos", "Walker", "Tanaka", "Mendez", "Sharma", "Obrien", "Haddad", "Fischer", "Rossi", "Mensah"]
+JOB_TITLES  = ["Senior Software Engineer", "Data Analyst", "Product Manager", "Cloud Architect",
+               "Marketing Specialist", "Operations Lead", "UX Designer", "Finance Officer"]
+LOCATIONS   = [("Austin", "USA"), ("Manila", "Philippines"), ("Berlin", "Germany"),
+               ("Toronto", "Canada"), ("Lagos", "Nigeria")]
+COMPANIES   = ["Acme Corp", "Globex", "Initech", "Umbrella Labs", "Stark Industries", "Wayne Enterprises"]
+SCHOOLS     = ["University of Somewhere", "State Technical Institute", "Northern College of Design"]
+DEGREES     = ["BSc Computer Science", "MBA", "BA Economics", "MSc Data Science"]
+SKILLS      = ["Python", "SQL", "Kubernetes", "Terraform", "Figma", "Tableau", "Spark", "Go",
+               "Leadership", "Negotiation", "Excel", "Airflow", "React", "AWS", "GCP", "Kafka"]
+MONTHS      = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+WORDS       = ("designed built led migrated optimised delivered scalable pipelines services teams "
+               "customers revenue latency reliability platform analytics automation cloud").split()
+
+# Named payload sizes: number of experience entries and description sentences.
+SIZES = {
+    "small":   {"jobs": 2,  "sentences": 1},
+    "typical": {"jobs": 6,  "sentences": 3},
+    "large":   {"jobs": 40, "sentences": 6},
+}
+
+
+def apply_bench_env() -> None:
+    for key, value in BENCH_ENV.items():
+        os.environ.setdefault(key, value)
+
+
+def _sentence(rng: random.Random, words: int = 12) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def synthetic_resume(rng: random.Random, size: str = "typical", template: str = "classic") -> dict:
+    """Return one resume in the ``ResumeModel`` format."""
+    spec = SIZES[size]
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    city, country = rng.choice(LOCATIONS)
+
+    experience, year = [], 2024
+    for _ in range(spec["jobs"]):
+        start = year - rng.randint(1, 3)
+        experience.append({
+            "dates": f"{rng.choice(MONTHS)} {start} — {rng.choice(MONTHS)} {year}",
+            "role": rng.choice(JOB_TITLES),
+            "company": rng.choice(COMPANIES),
+            "description": " ".join(_sentence(rng) for _ in range(spec["sentences"])),
+        })
+        year = start
+
+    education = []
+    for _ in range(rng.randint(1, 2)):
+        education.append({
+            "school": rng.choice(SCHOOLS),
+            "degree": rng.choice(DEGREES),
+            "dates": f"{year - 4}–{year}",
+        })
+        year -= 4
+
+    return {
+        "contacts": {
+            "firstName": first,
+            "lastName": last,
+            "name": f"{first} {last}",
+            "jobTitle": rng.choice(JOB_TITLES),
+            "email": f"{first.lower()}.{last.lower()}@example.com",
+            "phone": f"555 {rng.randint(100, 999)} {rng.randint(1000, 9999)}",
+            "phoneCode": "+1",
+            "city": city,
+            "country": country,
+            "location": f"{city}, {country}",
+            "linkedin": f"https://www.linkedin.com/in/{first.lower()}{last.lower()}",
+            "website": "",
+        },
+        "summary": " ".join(_sentence(rng, 16) for _ in range(spec["sentences"] + 1)),
+        "experience": experience,
+        "education": education,
+        "skills": rng.sample(SKILLS, 8),
+        "languages": [{"name": "English", "level": 4}],
+        "certifications": "",
+        "awards": "",
+        "additional": "",
+        "template": template,
+    }
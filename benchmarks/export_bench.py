@@ -0,0 +1,221 @@
+"""Export benchmark matrix: every resume template x PDF engine x payload size.
+
+Each cell runs in a fresh subprocess so peak RSS belongs to that cell alone.
+The worker renders once to warm up (template compile, font loading), then
+times ``--repeat`` calls of ``build_pdf`` (inline, with the export cache and
+render pool off) or ``build_docx``, and reports the median time, the output
+size and the process's peak RSS (plus how much of it the renders added).
+
+Results are written to ``benchmarks/results/export-<utc>.json`` and compared
+with the stored baseline (``benchmarks/baselines/export.json``). Any cell whose
+time or peak RSS grew past ``--threshold`` is flagged, and the exit status is 1.
+
+    python -m benchmarks.export_bench [--sizes small,typical,large] [--engines xhtml2pdf,weasyprint]
+                                      [--templates classic,modern] [--repeat 3] [--threshold 0.25]
+                                      [--update-baseline]
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+from benchmarks.corpus import SIZES, apply_bench_env, synthetic_resume
+
+ROOT          = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEMPLATE_DIR  = os.path.join(ROOT, "app", "templates", "resume")
+RESULTS_DIR   = os.path.join(os.path.dirname(__file__), "results")
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baselines", "export.json")
+ENGINES       = ["xhtml2pdf", "weasyprint"]
+_MARKER       = "EXPORT_BENCH_RESULT "
+
+
+def all_templates() -> list:
+    return sorted(
+        name[:-5] for name in os.listdir(TEMPLATE_DIR)
+        if name.endswith(".html") and not name.startswith("_")
+    )
+
+
+def available_engines() -> list:
+    from app.services.export_service import available_engines
+    return available_engines()
+
+
+def _peak_rss_mib() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == "darwin" else peak / 1024  # bytes on macOS, KiB elsewhere
+
+
+# ── Worker (one matrix cell per process) ──────────────────────────────────────
+
+def measure(template: str, engine: str, size: str, seed: int, repeat: int) -> dict:
+    apply_bench_env()
+    from app import create_app
+    from app.services import export_service
+
+    # The same resume for every template/engine at a given size.
+    data = synthetic_resume(random.Random(f"{seed}-{size}"), size, template)
+
+    if engine == "docx":
+        render = export_service.build_docx
+    else:
+        export_service.PDF_ENGINE = engine
+        # Route every template through build_pdf, not only those with a client id.
+        export_service.TEMPLATE_TO_HTML.setdefault(template, template)
+        render = export_service.build_pdf
+
+    app = create_app()
+    with app.test_request_context():
+        rss_before = _peak_rss_mib()
+        try:
+            output = render(data).getvalue()  # warm-up
+            runs = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                render(data)
+                runs.append(time.perf_counter() - start)
+        except Exception as exc:
+            return {"status": "error", "error": f"{type(exc).__name__}: {exc}"[:200]}
+
+    return {
+        "status": "ok",
+        "time_ms": statistics.median(runs) * 1e3,
+        "bytes": len(output),
+        "rss_before_mib": rss_before,
+        "peak_rss_mib": _peak_rss_mib(),
+    }
+
+
+def _run_cell(template: str, engine: str, size: str, args) -> dict:
+    cmd = [sys.executable, "-m", "benchmarks.export_bench", "--worker",
+           template, engine, size, str(args.seed), str(args.repeat)]
+    try:
+        proc = subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True, timeout=args.timeout)
+    except subprocess.TimeoutExpired:
+        return {"status": "error", "error": f"timed out after {args.timeout}s"}
+    for line in reversed(proc.stdout.splitlines()):
+        if line.startswith(_MARKER):
+            return json.loads(line[len(_MARKER):])
+    tail = (proc.stderr.strip().splitlines() or ["no output"])[-1]
+    return {"status": "error", "error": f"worker exited {proc.returncode}: {tail}"[:200]}
+
+
+# ── Baseline comparison ───────────────────────────────────────────────────────
+
+def compare(results: dict, baseline: dict, threshold: float, min_delta_ms: float) -> list:
+    """Return ``[(cell, metric, baseline, current), ...]`` for every regression."""
+    regressions = []
+    for cell, current in results.items():
+        ref = baseline.get(cell)
+        if not ref or ref.get("status") != "ok":
+            continue
+        if current.get("status") != "ok":
+            regressions.append((cell, "status", "ok", current.get("status")))
+            continue
+        if (current["time_ms"] > ref["time_ms"] * (1 + threshold)
+                and current["time_ms"] - ref["time_ms"] >= min_delta_ms):
+            regressions.append((cell, "time_ms", ref["time_ms"], current["time_ms"]))
+        if current["peak_rss_mib"] > ref["peak_rss_mib"] * (1 + threshold):
+            regressions.append((cell, "peak_rss_mib", ref["peak_rss_mib"], current["peak_rss_mib"]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--worker", nargs=5, metavar=("TEMPLATE", "ENGINE", "SIZE", "SEED", "REPEAT"),
+                        help=argparse.SUPPRESS)
+    parser.add_argument("--templates", help="comma-separated template names (default: all)")
+    parser.add_argument("--engines", default=",".join(ENGINES))
+    parser.add_argument("--sizes", default=",".join(SIZES))
+    parser.add_argument("--no-docx", action="store_true", help="skip the build_docx cells")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--repeat", type=int, default=3, help="timed renders per cell (median)")
+    parser.add_argument("--timeout", type=float, default=300, help="seconds per cell")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed relative growth")
+    parser.add_argument("--min-delta-ms", type=float, default=20, help="ignore smaller time changes")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--output", help="results file (default: benchmarks/results/export-<utc>.json)")
+    args = parser.parse_args()
+
+    if args.worker:
+        template, engine, size, seed, repeat = args.worker
+        print(_MARKER + json.dumps(measure(template, engine, size, int(seed), int(repeat))), flush=True)
+        return 0
+
+    templates = args.templates.split(",") if args.templates else all_templates()
+    sizes = [s for s in args.sizes.split(",") if s]
+    installed = available_engines()
+    engines = [e for e in args.engines.split(",") if e in installed]
+    skipped = sorted(set(filter(None, args.engines.split(","))) - set(engines))
+    if skipped:
+        print(f"Skipping unavailable engine(s): {', '.join(skipped)}")
+    cells = [(t, e, s) for t in templates for e in engines for s in sizes]
+    if not args.no_docx:
+        cells += [("-", "docx", s) for s in sizes]  # build_docx ignores the template
+
+    print(f"{'template':<22}{'engine':<12}{'size':<9}{'ms':>9}{'KiB':>9}{'peak MiB':>10}{'+render':>9}")
+    results = {}
+    for template, engine, size in cells:
+        cell = f"{template}|{engine}|{size}"
+        r = results[cell] = _run_cell(template, engine, size, args)
+        if r["status"] == "ok":
+            print(f"{template:<22}{engine:<12}{size:<9}{r['time_ms']:>9.1f}{r['bytes'] / 1024:>9.1f}"
+                  f"{r['peak_rss_mib']:>10.1f}{r['peak_rss_mib'] - r['rss_before_mib']:>9.1f}")
+        else:
+            print(f"{template:<22}{engine:<12}{size:<9}  {r['status']}: {r.get('error', '')}")
+
+    doc = {
+        "benchmark": "export",
+        "created_at": datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "params": {"seed": args.seed, "repeat": args.repeat, "sizes": sizes, "engines": engines},
+        "results": results,
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f"export-{doc['created_at']}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(doc, f, indent=2)
+    print(f"\nResults written to {output}")
+
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding="utf-8") as f:
+                baseline = json.load(f)
+        baseline.update({k: v for k, v in doc.items() if k != "results"})
+        baseline["results"] = {**baseline.get("results", {}), **results}
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No baseline to compare with; run with --update-baseline to store one.")
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+    regressions = compare(results, baseline, args.threshold, args.min_delta_ms)
+    if not regressions:
+        print(f"No regressions beyond {args.threshold:.0%} of the baseline.")
+        return 0
+    print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%} of the baseline:")
+    for cell, metric, before, after in regressions:
+        if metric == "status":
+            print(f"  {cell:<40} {metric}: {before} -> {after}")
+        else:
+            print(f"  {cell:<40} {metric}: {before:.1f} -> {after:.1f} ({(after - before) / before:+.0%})")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
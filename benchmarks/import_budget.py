@@ -0,0 +1,88 @@
+"""Import-time budget: keep cold start and CLI commands fast.
+
+Runs each scenario in a fresh interpreter under ``python -X importtime`` and
+checks two things:
+
+  - none of the heavy export/parser dependencies (PDF engines, python-docx,
+    PyMuPDF, Pillow, pdfplumber...) is imported; they load on first use or in
+    the ``EXPORT_WARMUP`` thread;
+  - the total import time, best of ``--repeat`` runs, stays under the
+    scenario's budget (scaled by ``--scale`` for slower machines).
+
+Exits 1 on any violation.
+
+    python -m benchmarks.import_budget [--repeat 3] [--scale 1.0] [--scenarios app,create_app]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# name -> (statement, budget in ms of import time)
+SCENARIOS = {
+    "app":        ("import app", 750),
+    "create_app": ("from app import create_app; create_app()", 1200),
+}
+
+HEAVY = ("xhtml2pdf", "weasyprint", "reportlab", "pyhanko", "docx", "fitz", "pymupdf", "PIL",
+         "pdfplumber", "pdfminer", "pypdf")
+
+
+def measure(statement: str, env: dict) -> tuple:
+    """Return ``(total import ms, {top-level package: cumulative ms})`` for one cold run."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], cwd=ROOT, env=env,
+                          capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    total, packages = 0, {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header
+        package = name.strip().split(".")[0]
+        packages[package] = max(packages.get(package, 0), int(cumulative) / 1e3)
+        if not name.startswith("  "):  # top-level import; nested ones are included in it
+            total += int(cumulative) / 1e3
+    return total, packages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    parser.add_argument("--repeat", type=int, default=3, help="runs per scenario (best is kept)")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every budget")
+    parser.add_argument("--top", type=int, default=8, help="slowest packages to list")
+    args = parser.parse_args()
+
+    failures = []
+    with tempfile.TemporaryDirectory(prefix="import-budget-") as tmp:
+        env = {**os.environ, "DATABASE_URL": f"sqlite:///{os.path.join(tmp, 'budget.db')}",
+               "TEMPLATE_PRECOMPILE": "0", "EXPORT_WARMUP": "0", "PDF_RENDER_WORKERS": "0",
+               "EXPORT_JOB_WORKERS": "0"}
+        for name in [s for s in args.scenarios.split(",") if s in SCENARIOS]:
+            statement, budget = SCENARIOS[name]
+            budget *= args.scale
+            runs = [measure(statement, env) for _ in range(args.repeat)]
+            total, packages = min(runs, key=lambda r: r[0])
+            heavy = sorted(p for p in packages if p in HEAVY)
+            status = "ok" if total <= budget and not heavy else "FAIL"
+            print(f"{name:<12} {total:8.1f} ms  (budget {budget:.0f} ms)  {status}")
+            slowest = sorted(packages.items(), key=lambda kv: -kv[1])[:args.top]
+            print("             " + ", ".join(f"{p} {ms:.0f}" for p, ms in slowest))
+            if total > budget:
+                failures.append(f"{name}: {total:.0f} ms of imports exceeds the {budget:.0f} ms budget")
+            if heavy:
+                failures.append(f"{name}: imports heavy dependencies at startup: {', '.join(heavy)}")
+
+    for failure in failures:
+        print(f"  {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
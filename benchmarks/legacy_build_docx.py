@@ -0,0 +1,83 @@
+"""Frozen copy of ``build_docx`` before the DOCX skeleton engine.
+
+Used only by ``benchmarks/docx_bench.py`` as the baseline for speed and
+output comparisons. Do not import from application code.
+"""
+from io import BytesIO
+
+from docx import Document
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.shared import Inches, Pt
+
+
+def legacy_build_docx(data: dict) -> BytesIO:
+    """Build a DOCX document from resume data and return as bytes."""
+    contacts = data.get("contacts", {})
+    name = contacts.get("name", "")
+    job_title = contacts.get("jobTitle", "")
+
+    doc = Document()
+    section = doc.sections[0]
+    section.page_width = Inches(8.27)
+    section.page_height = Inches(11.69)
+
+    # Header — name and job title
+    name_paragraph = doc.add_paragraph()
+    name_run = name_paragraph.add_run(name)
+    name_run.bold = True
+    name_run.font.size = Pt(18)
+    name_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+    if job_title:
+        title_paragraph = doc.add_paragraph(job_title)
+        title_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+    doc.add_paragraph()
+
+    # Contact information
+    location = contacts.get("location") or (
+        ", ".join(filter(None, [contacts.get("city"), contacts.get("country")]))
+        if (contacts.get("city") or contacts.get("country")) else None
+    )
+    contact_parts = [
+        contacts.get("email"),
+        contacts.get("phone") and f"{contacts.get('phoneCode', '')} {contacts.get('phone', '')}".strip(),
+        location,
+    ]
+    contact_parts = [p for p in contact_parts if p]
+    if contact_parts:
+        doc.add_paragraph(" | ".join(contact_parts))
+
+    # Summary
+    if data.get("summary"):
+        doc.add_paragraph()
+        doc.add_paragraph("SUMMARY", style="Heading 2")
+        doc.add_paragraph(data["summary"])
+
+    # Experience
+    doc.add_paragraph()
+    doc.add_paragraph("EXPERIENCE", style="Heading 2")
+    for entry in data.get("experience", []):
+        p = doc.add_paragraph()
+        p.add_run(f"{entry.get('role', '')} — {entry.get('company', '')}").bold = True
+        doc.add_paragraph(entry.get("dates", ""), style="List Bullet")
+        doc.add_paragraph(entry.get("description", ""))
+
+    # Education
+    doc.add_paragraph()
+    doc.add_paragraph("EDUCATION", style="Heading 2")
+    for entry in data.get("education", []):
+        p = doc.add_paragraph()
+        p.add_run(entry.get("school", "")).bold = True
+        doc.add_paragraph(f"{entry.get('degree', '')} · {entry.get('dates', '')}")
+
+    # Skills
+    if data.get("skills"):
+        doc.add_paragraph()
+        doc.add_paragraph("SKILLS", style="Heading 2")
+        doc.add_paragraph(", ".join(data["skills"]))
+
+    buffer = BytesIO()
+    doc.save(buffer)
+    buffer.seek(0)
+    return buffer
@@ -0,0 +1,92 @@
+"""Micro-benchmark: single-pass ``_parse_text`` vs. the previous implementation.
+
+Builds a reproducible set of synthetic plain-text CVs (short to very long),
+checks that both implementations agree on every field, and reports the time
+per document and the speedup.
+
+    python -m benchmarks.parse_text_bench [--docs 200] [--repeat 5] [--seed 7]
+"""
+import argparse
+import random
+import statistics
+import time
+
+from app.services.resume_parser import _parse_text
+from benchmarks.legacy_parse_text import legacy_parse_text
+
+_FIRST  = ["Maria", "James", "Aiko", "Carlos", "Priya", "Liam", "Fatima", "Noah", "Elena", "Kwame"]
+_LAST   = ["Santos", "Walker", "Tanaka", "Mendez", "Sharma", "O'Brien", "Haddad", "Fischer", "Rossi", "Mensah"]
+_TITLES = ["Senior Software Engineer", "Data Analyst", "Product Manager", "Cloud Architect",
+           "Marketing Specialist", "Operations Lead", "UX Designer", "Finance Officer"]
+_CITIES = ["Austin, TX", "Manila, Philippines", "Berlin, Germany", "Toronto, Canada", "Lagos, Nigeria"]
+_COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Labs", "Stark Industries", "Wayne Enterprises"]
+_MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+_WORDS  = ("designed built led migrated optimised delivered scalable pipelines services teams "
+           "customers revenue latency reliability platform analytics automation cloud").split()
+
+
+def synthetic_cv(rng: random.Random, jobs: int) -> str:
+    first, last = rng.choice(_FIRST), rng.choice(_LAST)
+    lines = [
+        f"{first} {last}",
+        rng.choice(_TITLES),
+        f"{first.lower()}.{last.lower().replace(chr(39), '')}@example.com | +1 555 {rng.randint(100, 999)} {rng.randint(1000, 9999)}",
+        rng.choice(_CITIES),
+        f"linkedin.com/in/{first.lower()}{last.lower().replace(chr(39), '')}",
+        "",
+        "Professional Summary",
+        " ".join(rng.choice(_WORDS) for _ in range(40)),
+        "",
+        "Work Experience",
+    ]
+    year = 2024
+    for _ in range(jobs):
+        start = year - rng.randint(1, 3)
+        lines += [
+            f"{rng.choice(_MONTHS)} {start} — {rng.choice(_MONTHS)} {year}",
+            rng.choice(_TITLES),
+            rng.choice(_COMPANIES),
+        ]
+        lines += [" ".join(rng.choice(_WORDS) for _ in range(14)) for _ in range(rng.randint(2, 6))]
+        year = start
+    lines += ["", "Education"]
+    for _ in range(rng.randint(1, 3)):
+        lines += [f"{year - 4}–{year}", "University of Somewhere", "BSc Computer Science"]
+        year -= 4
+    lines += ["", "Skills", ", ".join(rng.sample(_WORDS, 10)),
+              "Certifications", "AWS Certified Solutions Architect", "Languages", "English", "Spanish"]
+    return "\n".join(lines)
+
+
+def _time_per_doc(fn, docs, repeat):
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for doc in docs:
+            fn(doc)
+        runs.append((time.perf_counter() - start) / len(docs))
+    return statistics.median(runs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    buckets = {"short (3 jobs)": 3, "typical (10 jobs)": 10, "long (60 jobs)": 60}
+
+    print(f"{'corpus':<20}{'legacy µs/doc':>16}{'single-pass µs/doc':>22}{'speedup':>10}{'agree':>8}")
+    for label, jobs in buckets.items():
+        docs = [synthetic_cv(rng, jobs) for _ in range(args.docs)]
+        agree = sum(_parse_text(d) == legacy_parse_text(d) for d in docs)
+        legacy = _time_per_doc(legacy_parse_text, docs, args.repeat)
+        new    = _time_per_doc(_parse_text, docs, args.repeat)
+        print(f"{label:<20}{legacy * 1e6:>16.1f}{new * 1e6:>22.1f}{legacy / new:>9.2f}x"
+              f"{agree:>5}/{len(docs)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+"""Parser benchmark: throughput, memory and accuracy on a synthetic corpus.
+
+Builds a reproducible corpus of resumes (``benchmarks.corpus``), exports each
+one to PDF and DOCX with the app's own ``build_pdf`` / ``build_docx`` across
+the resume templates, then parses the files back and reports:
+
+* latency of every PDF extractor and of the DOCX extractor,
+* ``_parse_text`` time on the extracted text,
+* peak Python memory (tracemalloc) of a full ``parse_resume_file`` call,
+* field-level accuracy against the source JSON, per extractor and format.
+
+Results are written as JSON (default ``benchmarks/results/parser-<utc>.json``)
+and can be compared with an earlier run.
+
+    python -m benchmarks.parser_bench [--docs 4] [--seed 7] [--repeat 3]
+                                      [--corpus-dir DIR] [--output PATH] [--compare PATH]
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import re
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from benchmarks.corpus import apply_bench_env, synthetic_resume
+
+apply_bench_env()
+
+from app import create_app  # noqa: E402
+from app.services import resume_parser  # noqa: E402
+from app.services.export_service import TEMPLATE_TO_HTML, build_docx, build_pdf  # noqa: E402
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+# One template id per distinct HTML template, so every layout is exercised once.
+TEMPLATE_IDS = sorted({html: tid for tid, html in sorted(TEMPLATE_TO_HTML.items(), reverse=True)}.values())
+
+FIELDS = ["name", "email", "phone", "jobTitle", "summary", "skills", "experience", "education"]
+
+
+# ── Corpus ────────────────────────────────────────────────────────────────────
+
+def build_corpus(app, seed: int, docs_per_template: int, sizes, corpus_dir: str = None):
+    """Return ``(corpus, skipped)``.
+
+    ``corpus`` is ``[{"id", "template", "size", "source", "pdf", "docx"}, ...]``;
+    ``skipped`` maps the id of every resume the exporters could not render to
+    the error, so layout limits show up in the results instead of aborting.
+    """
+    rng = random.Random(seed)
+    corpus, skipped = [], {}
+    with app.test_request_context():
+        for template in TEMPLATE_IDS:
+            for size in sizes:
+                for n in range(docs_per_template):
+                    doc_id = f"{template}-{size}-{n}"
+                    source = synthetic_resume(rng, size, template)
+                    try:
+                        pdf, docx = build_pdf(source).getvalue(), build_docx(source).getvalue()
+                    except Exception as exc:
+                        skipped[doc_id] = f"{type(exc).__name__}: {exc}"[:200]
+                        continue
+                    doc = {"id": doc_id, "template": template, "size": size,
+                           "source": source, "pdf": pdf, "docx": docx}
+                    corpus.append(doc)
+                    if corpus_dir:
+                        _save_doc(corpus_dir, doc)
+    return corpus, skipped
+
+
+def _save_doc(corpus_dir: str, doc: dict) -> None:
+    os.makedirs(corpus_dir, exist_ok=True)
+    base = os.path.join(corpus_dir, doc["id"])
+    for fmt in ("pdf", "docx"):
+        with open(f"{base}.{fmt}", "wb") as f:
+            f.write(doc[fmt])
+    with open(f"{base}.json", "w", encoding="utf-8") as f:
+        json.dump(doc["source"], f, indent=2, ensure_ascii=False)
+
+
+# ── Accuracy ──────────────────────────────────────────────────────────────────
+
+def _norm(value) -> str:
+    return re.sub(r"\s+", " ", str(value or "")).strip().lower()
+
+
+def _tokens(value) -> list:
+    return re.findall(r"\w+", _norm(value))
+
+
+def _recall(expected: list, actual: list) -> float:
+    if not expected:
+        return 1.0
+    pool = list(actual)
+    hits = 0
+    for token in expected:
+        if token in pool:
+            pool.remove(token)
+            hits += 1
+    return hits / len(expected)
+
+
+def _f1(expected: set, actual: set) -> float:
+    if not expected and not actual:
+        return 1.0
+    hits = len(expected & actual)
+    if not hits:
+        return 0.0
+    precision, recall = hits / len(actual), hits / len(expected)
+    return 2 * precision * recall / (precision + recall)
+
+
+def score(source: dict, parsed: dict) -> dict:
+    """Score each field of ``parsed`` against ``source`` in [0, 1]."""
+    src, out = source["contacts"], parsed.get("contacts") or {}
+    digits = lambda s: re.sub(r"\D", "", s or "")  # noqa: E731
+
+    exp_roles = [_norm(e["role"]) for e in source["experience"]]
+    out_roles = [_norm(e.get("role")) for e in parsed.get("experience") or []]
+    exp_count, out_count = len(source["experience"]), len(parsed.get("experience") or [])
+    edu_count, out_edu = len(source["education"]), len(parsed.get("education") or [])
+
+    return {
+        "name":       float(_norm(out.get("name")) == _norm(src["name"])),
+        "email":      float(_norm(out.get("email")) == _norm(src["email"])),
+        "phone":      float(digits(src["phone"]) != "" and digits(src["phone"]) in digits(
+                          f"{out.get('phoneCode', '')}{out.get('phone', '')}")),
+        "jobTitle":   float(_norm(out.get("jobTitle")) == _norm(src["jobTitle"])),
+        "summary":    _recall(_tokens(source["summary"]), _tokens(parsed.get("summary"))),
+        "skills":     _f1({_norm(s) for s in source["skills"]}, {_norm(s) for s in parsed.get("skills") or []}),
+        "experience": (min(exp_count, out_count) / max(exp_count, out_count, 1)) * _recall(exp_roles, out_roles),
+        "education":  min(edu_count, out_edu) / max(edu_count, out_edu, 1),
+    }
+
+
+# ── Measurements ──────────────────────────────────────────────────────────────
+
+def _timed(fn, *args, repeat: int = 1):
+    """Return ``(result, median seconds)`` over ``repeat`` calls."""
+    runs, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        runs.append(time.perf_counter() - start)
+    return result, statistics.median(runs)
+
+
+def _peak_bytes(fn, *args) -> int:
+    tracemalloc.start()
+    try:
+        fn(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _summarise(samples: list) -> dict:
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+    return {
+        "n": len(ordered),
+        "mean_ms": statistics.fmean(ordered) * 1e3,
+        "p50_ms": ordered[len(ordered) // 2] * 1e3,
+        "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1e3,
+        "max_ms": ordered[-1] * 1e3,
+    }
+
+
+def _mean_scores(scores: list) -> dict:
+    if not scores:
+        return {}
+    means = {f: statistics.fmean(s[f] for s in scores) for f in FIELDS}
+    means["overall"] = statistics.fmean(means.values())
+    return means
+
+
+def run(corpus: list, repeat: int) -> dict:
+    extractors = [(name, fn, "pdf") for name, fn in resume_parser._PDF_EXTRACTORS]
+    extractors.append(("python-docx", resume_parser._extract_docx_text, "docx"))
+
+    per_extractor = {
+        name: {"format": fmt, "latency": [], "parse_text": [], "scores": [], "failures": 0}
+        for name, _, fmt in extractors
+    }
+    end_to_end = {fmt: {"latency": [], "peak_bytes": [], "scores": []} for fmt in ("pdf", "docx")}
+
+    for doc in corpus:
+        for name, fn, fmt in extractors:
+            bucket = per_extractor[name]
+            text, seconds = _timed(fn, doc[fmt], repeat=repeat)
+            bucket["latency"].append(seconds)
+            if len(text.strip()) < resume_parser._MIN_RESUME_CHARS:
+                bucket["failures"] += 1
+                bucket["scores"].append(score(doc["source"], resume_parser._empty_data()))
+                continue
+            parsed, seconds = _timed(resume_parser._parse_text, text, repeat=repeat)
+            bucket["parse_text"].append(seconds)
+            bucket["scores"].append(score(doc["source"], parsed))
+
+        for fmt in ("pdf", "docx"):
+            filename = f"{doc['id']}.{fmt}"
+            parsed, seconds = _timed(resume_parser.parse_resume_file, doc[fmt], filename, repeat=repeat)
+            bucket = end_to_end[fmt]
+            bucket["latency"].append(seconds)
+            bucket["peak_bytes"].append(_peak_bytes(resume_parser.parse_resume_file, doc[fmt], filename))
+            bucket["scores"].append(score(doc["source"], parsed))
+
+    return {
+        "extractors": {
+            name: {
+                "format": b["format"],
+                "failures": b["failures"],
+                "latency": _summarise(b["latency"]),
+                "parse_text": _summarise(b["parse_text"]),
+                "accuracy": _mean_scores(b["scores"]),
+            }
+            for name, b in per_extractor.items()
+        },
+        "end_to_end": {
+            fmt: {
+                "latency": _summarise(b["latency"]),
+                "peak_mib": {
+                    "mean": statistics.fmean(b["peak_bytes"]) / 2**20,
+                    "max": max(b["peak_bytes"]) / 2**20,
+                },
+                "accuracy": _mean_scores(b["scores"]),
+            }
+            for fmt, b in end_to_end.items()
+        },
+    }
+
+
+# ── Reporting ─────────────────────────────────────────────────────────────────
+
+def print_report(results: dict, baseline: dict = None) -> None:
+    def delta(path, value, fmt):
+        ref = baseline
+        for key in path:
+            ref = (ref or {}).get(key)
+        if not isinstance(ref, (int, float)) or not ref:
+            return ""
+        return f" ({(value - ref) / ref:+.0%})" if fmt == "pct" else f" ({value - ref:+.3f})"
+
+    print(f"{'extractor':<14}{'fmt':<6}{'p50 ms':>10}{'p95 ms':>10}{'parse ms':>10}{'fail':>6}{'accuracy':>10}")
+    for name, r in results["extractors"].items():
+        p50 = r["latency"].get("p50_ms", 0.0)
+        parse = r["parse_text"].get("p50_ms", 0.0)
+        acc = r["accuracy"].get("overall", 0.0)
+        print(f"{name:<14}{r['format']:<6}{p50:>10.1f}{r['latency'].get('p95_ms', 0.0):>10.1f}"
+              f"{parse:>10.2f}{r['failures']:>6}{acc:>10.3f}"
+              f"{delta(('extractors', name, 'latency', 'p50_ms'), p50, 'pct')}"
+              f"{delta(('extractors', name, 'accuracy', 'overall'), acc, 'abs')}")
+
+    print()
+    print(f"{'end-to-end':<14}{'p50 ms':>10}{'peak MiB':>10}  accuracy by field")
+    for fmt, r in results["end_to_end"].items():
+        p50 = r["latency"]["p50_ms"]
+        fields = " ".join(f"{f}={r['accuracy'][f]:.2f}" for f in FIELDS)
+        print(f"{fmt:<14}{p50:>10.1f}{r['peak_mib']['max']:>10.2f}  {fields}"
+              f"{delta(('end_to_end', fmt, 'latency', 'p50_ms'), p50, 'pct')}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=2, help="documents per template and size")
+    parser.add_argument("--sizes", default="small,typical,large")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--repeat", type=int, default=3, help="timed calls per measurement (median)")
+    parser.add_argument("--corpus-dir", help="also write the generated PDF/DOCX/JSON files here")
+    parser.add_argument("--output", help="results file (default: benchmarks/results/parser-<utc>.json)")
+    parser.add_argument("--compare", help="earlier results file to diff against")
+    args = parser.parse_args()
+
+    # Measure every extractor in a fixed order, not the adaptive one.
+    resume_parser.PDF_EXTRACT_MODE = "sequential"
+    resume_parser.PDF_EXTRACT_ADAPTIVE = False
+
+    sizes = [s for s in args.sizes.split(",") if s]
+    app = create_app()
+
+    start = time.perf_counter()
+    corpus, skipped = build_corpus(app, args.seed, args.docs, sizes, args.corpus_dir)
+    print(f"Built {len(corpus)} resumes x 2 formats over {len(TEMPLATE_IDS)} templates "
+          f"in {time.perf_counter() - start:.1f}s")
+    for doc_id, error in skipped.items():
+        print(f"  skipped {doc_id}: {error}")
+
+    results = run(corpus, args.repeat)
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+    print_report(results, baseline)
+
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    output = args.output or os.path.join(RESULTS_DIR, f"parser-{stamp}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({
+            "benchmark": "parser",
+            "created_at": stamp,
+            "parser_version": resume_parser.PARSER_VERSION,
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "params": {"docs": args.docs, "sizes": sizes, "seed": args.seed, "repeat": args.repeat,
+                       "templates": TEMPLATE_IDS, "documents": len(corpus), "skipped": skipped},
+            "results": results,
+        }, f, indent=2)
+    print(f"\nResults written to {output}")
+
+
+if __name__ == "__main__":
+    main()
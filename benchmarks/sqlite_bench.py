@@ -0,0 +1,215 @@
+"""Concurrency benchmark: mixed GET/POST /api/resume traffic against SQLite.
+
+Runs the same workload twice, once with the default engine settings and once
+with the production profile (``SQLITE_TUNED``: WAL, tuned pragmas, separate
+read/write pools), each against a fresh database seeded with one user and
+resume per client. Every mode starts ``--processes`` worker processes (like
+gunicorn workers) running ``--threads`` clients each. Each client loops for
+``--duration`` seconds, saving its own resume with probability ``--write-ratio``
+and loading it otherwise.
+
+Reports throughput, p50/p95/p99 latency per method and the failed requests
+(5xx, mostly "database is locked") and writes
+``benchmarks/results/sqlite-<utc>.json``.
+
+    python -m benchmarks.sqlite_bench [--processes 4] [--threads 8] [--duration 10]
+                                      [--write-ratio 0.3] [--modes default,tuned]
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+
+from benchmarks.corpus import apply_bench_env, synthetic_resume
+
+ROOT        = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+MODES       = {"default": "0", "tuned": "1"}
+_MARKER     = "SQLITE_BENCH_RESULT "
+
+
+def _app():
+    apply_bench_env()
+    from app import create_app
+    app = create_app()
+    app.logger.disabled = True   # failed requests are counted, not printed
+    return app
+
+
+# ── Worker side ───────────────────────────────────────────────────────────────
+
+def seed(users: int, seed_value: int) -> dict:
+    from app.models.resume_db import Resume
+    from app.models.user import User, db
+
+    app = _app()
+    rng = random.Random(seed_value)
+    with app.app_context():
+        for i in range(users):
+            user = User(email=f"bench{i}@example.com", name=f"Bench {i}")
+            db.session.add(user)
+            db.session.flush()
+            db.session.add(Resume(user_id=user.id, data=synthetic_resume(rng), is_primary=True))
+        db.session.commit()
+        return {"user_ids": [u.id for u in User.query.order_by(User.id)]}
+
+
+def client_loop(app, user_id: int, rng: random.Random, write_ratio: float,
+                start_at: float, stop_at: float, out: list) -> None:
+    client = app.test_client()
+    with client.session_transaction() as session:
+        session["_user_id"] = str(user_id)
+        session["_fresh"]   = True
+    data = client.get("/api/resume").get_json()
+    while time.time() < start_at:
+        time.sleep(0.001)
+    while time.time() < stop_at:
+        if rng.random() < write_ratio:
+            data["summary"] = f"Revision {rng.random():.12f}"
+            start = time.perf_counter()
+            status = client.post("/api/resume", json=data).status_code
+            out.append(("POST", status, time.perf_counter() - start))
+        else:
+            start = time.perf_counter()
+            status = client.get("/api/resume").status_code
+            out.append(("GET", status, time.perf_counter() - start))
+
+
+def worker(user_ids: list, threads: int, write_ratio: float, start_at: float, duration: float,
+           seed_value: int) -> dict:
+    app = _app()
+    samples, clients = [], []
+    for user_id in user_ids[:threads]:
+        rng = random.Random(f"{seed_value}-{user_id}")
+        t = threading.Thread(target=client_loop, daemon=True,
+                             args=(app, user_id, rng, write_ratio, start_at, start_at + duration, samples))
+        t.start()
+        clients.append(t)
+    for t in clients:
+        t.join()
+    return {"samples": [(m, s, round(t * 1e3, 3)) for m, s, t in samples]}
+
+
+def _run(args: list, env: dict):
+    return subprocess.Popen([sys.executable, "-m", "benchmarks.sqlite_bench", *args], cwd=ROOT, env=env,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+
+
+def _result(proc, timeout: float) -> dict:
+    stdout, stderr = proc.communicate(timeout=timeout)
+    for line in reversed(stdout.splitlines()):
+        if line.startswith(_MARKER):
+            return json.loads(line[len(_MARKER):])
+    tail = (stderr.strip().splitlines() or ["no output"])[-1]
+    raise RuntimeError(f"worker exited {proc.returncode}: {tail}")
+
+
+# ── Driver ────────────────────────────────────────────────────────────────────
+
+def _percentile(values: list, q: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def summarize(samples: list, duration: float) -> dict:
+    summary = {"requests": len(samples), "rps": round(len(samples) / duration, 1)}
+    for method in ("GET", "POST"):
+        times  = [t for m, s, t in samples if m == method and s < 500]
+        status = Counter(s for m, s, t in samples if m == method)
+        summary[method] = {
+            "ok": len(times),
+            "failed": sum(n for s, n in status.items() if s >= 500),
+            "status": {str(s): n for s, n in sorted(status.items())},
+            "p50_ms": round(_percentile(times, 0.50), 2),
+            "p95_ms": round(_percentile(times, 0.95), 2),
+            "p99_ms": round(_percentile(times, 0.99), 2),
+            "mean_ms": round(statistics.fmean(times), 2) if times else 0.0,
+        }
+    return summary
+
+
+def run_mode(mode: str, args) -> dict:
+    with tempfile.TemporaryDirectory(prefix="sqlite-bench-") as tmp:
+        env = {**os.environ, "DATABASE_URL": f"sqlite:///{os.path.join(tmp, 'bench.db')}",
+               "SQLITE_TUNED": MODES[mode]}
+        users = args.processes * args.threads
+        user_ids = _result(_run(["--seed-db", str(users), "--seed", str(args.seed)], env), args.timeout)["user_ids"]
+
+        start_at = time.time() + args.warmup
+        procs = []
+        for i in range(args.processes):
+            chunk = user_ids[i * args.threads:(i + 1) * args.threads]
+            procs.append(_run(["--worker", json.dumps(chunk), str(args.threads), str(args.write_ratio),
+                               str(start_at), str(args.duration), "--seed", str(args.seed)], env))
+        samples = []
+        for proc in procs:
+            samples += _result(proc, args.timeout + args.duration + args.warmup)["samples"]
+    return summarize(samples, args.duration)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed-db", type=int, metavar="USERS", help=argparse.SUPPRESS)
+    parser.add_argument("--worker", nargs=5, help=argparse.SUPPRESS)
+    parser.add_argument("--processes", type=int, default=4, help="worker processes per mode")
+    parser.add_argument("--threads", type=int, default=8, help="concurrent clients per process")
+    parser.add_argument("--duration", type=float, default=10, help="seconds of traffic per mode")
+    parser.add_argument("--warmup", type=float, default=5, help="seconds allowed for workers to start")
+    parser.add_argument("--write-ratio", type=float, default=0.3, help="share of requests that are saves")
+    parser.add_argument("--modes", default=",".join(MODES))
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--timeout", type=float, default=120)
+    parser.add_argument("--output", help="results file (default: benchmarks/results/sqlite-<utc>.json)")
+    args = parser.parse_args()
+
+    if args.seed_db is not None:
+        print(_MARKER + json.dumps(seed(args.seed_db, args.seed)), flush=True)
+        return 0
+    if args.worker:
+        user_ids, threads, ratio, start_at, duration = args.worker
+        result = worker(json.loads(user_ids), int(threads), float(ratio), float(start_at), float(duration), args.seed)
+        print(_MARKER + json.dumps(result), flush=True)
+        return 0
+    return drive(args)
+
+
+def drive(args) -> int:
+    results = {}
+    print(f"{'mode':<9}{'req/s':>8}{'GET p50':>9}{'p95':>8}{'p99':>8}{'POST p50':>10}{'p95':>8}{'p99':>8}"
+          f"{'failed':>8}")
+    for mode in [m for m in args.modes.split(",") if m in MODES]:
+        r = results[mode] = run_mode(mode, args)
+        g, p = r["GET"], r["POST"]
+        print(f"{mode:<9}{r['rps']:>8.1f}{g['p50_ms']:>9.1f}{g['p95_ms']:>8.1f}{g['p99_ms']:>8.1f}"
+              f"{p['p50_ms']:>10.1f}{p['p95_ms']:>8.1f}{p['p99_ms']:>8.1f}{g['failed'] + p['failed']:>8}")
+
+    doc = {
+        "benchmark": "sqlite",
+        "created_at": datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "params": {"processes": args.processes, "threads": args.threads, "duration": args.duration,
+                   "write_ratio": args.write_ratio, "seed": args.seed},
+        "results": results,
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f"sqlite-{doc['created_at']}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(doc, f, indent=2)
+    print(f"\nResults written to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())